@@ -2,13 +2,23 @@ import tkinter as tk
 from tkinter import messagebox, filedialog 
 import sys
 import os
-import time
 import datetime
 import traceback
 import atexit 
 import ctypes
 import collections 
 import random 
+import importlib
+
+# Import profile mode: time every module import from here on
+if "--import-profile" in sys.argv:
+    import etw_import_profile
+    etw_import_profile.install()
+
+# Profile mode: cProfile the startup, time engine entry points, count JSON I/O
+import etw_profiler as profiler
+if "--profile" in sys.argv:
+    profiler.enable(startup=True)
 
 # Foundation Modules
 import etw_config as config
@@ -21,34 +31,46 @@ import etw_ambush as ambush
 import etw_hotkeys
 import etw_bridge as bridge
 import etw_game_timer as game_timer
+import etw_scheduler as scheduler
+import etw_task_runner as task_runner
 import etw_inventory as inventory 
-import etw_loot 
 import etw_buff_manager as buff_manager
 import etw_dialogue as dialogue 
 
-# UI Modules
-import etw_ui_town
-import etw_ui_game
-import etw_ui_chargen
-import etw_ui_charinfo
-import etw_ui_settings
-import etw_ui_quests
-import etw_ui_shop
-import etw_ui_inventory
-import etw_ui_hideout
-import etw_ui_bar
-import etw_ui_raid_transition
+# UI Modules (screen modules are imported on first use, see SCREEN_BUILDERS)
+import etw_ui_view as ui_view
 
 # ----------------------------------------------------------------------
 # CONSTANTS
 # ----------------------------------------------------------------------
 VERSION = "v.14.52 (Non-Blocking I/O)"
 AHK_WAIT_MS = int(bridge.AHK_EXECUTION_TIME * 1000)
+BATCH_ACK_MAX_WAIT = 8.0
 ERROR_LOG_FILE = "error_log.txt"
 
-# REFACTORED: Loaded from JSON
+# REFACTORED: Loaded from JSON (on first show_intro_screen)
 INTRO_TEXT = [] 
 
+# Screen -> (module, builder). Screens are created on first ensure_screen /
+# lift_screen; a None module means an App method builds it.
+SCREEN_BUILDERS = {
+    "splash":           (None, "_build_splash"),
+    "intro":            (None, "_build_intro_screen"),
+    "character_gen":    ("etw_ui_chargen", "build_character_gen_screen"),
+    "character_picker": ("etw_ui_chargen", "build_character_picker_screen"),
+    "character_info":   ("etw_ui_charinfo", "build_character_info_screen"),
+    "settings":         ("etw_ui_settings", "build_settings_screen"),
+    "town":             ("etw_ui_town", "build_town_screen"),
+    "game":             ("etw_ui_game", "build_game_screen"),
+    "quest_log":        ("etw_ui_quests", "build_quest_log_screen"),
+    "shop":             ("etw_ui_shop", "build_shop_screen"),
+    "inventory":        ("etw_ui_inventory", "build_inventory_screen"),
+    "hideout":          ("etw_ui_hideout", "build_hideout_screen"),
+    "bar":              ("etw_ui_bar", "build_bar_screen"),
+    "departing":        ("etw_ui_raid_transition", "build_departing_screen"),
+    "raid_end":         ("etw_ui_raid_transition", "build_raid_end_screen")
+}
+
 class EscapeTheWastelandApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -77,16 +99,8 @@ class EscapeTheWastelandApp(tk.Tk):
         self.bind_all("<Button-1>", self._track_interaction)
         self.bind_all("<KeyRelease>", self._track_interaction)
         
-        # Load Static Content
-        self.main_quests = engine.load_main_quests()
-        self.side_quests = engine.load_side_quests()
-        self.shop_items = engine.load_shop_items()
-        
-        # Load Intro Text
-        global INTRO_TEXT
-        INTRO_TEXT = dialogue.get_intro_text()
-        
-        etw_loot.get_loot_pool_cached() 
+        # Static content (quests, shop items, intro, loot) loads on first use
+        self._aio = None
         
         self.save_data = engine.load_save_data()
         self.current_character = self.save_data.get("character")
@@ -101,16 +115,59 @@ class EscapeTheWastelandApp(tk.Tk):
         self.intro_skipped = False
         
         self._log_startup_version()
-        self.create_screens()
-        self.build_all_screens()
+        self.scheduler = scheduler.EventScheduler(self)
+        self.tasks = task_runner.TaskRunner(self)
         self.bind("<Configure>", self.on_window_resize)
         
-        # Always show splash first.
+        # Always show splash first. Every other screen is built on first use.
         self.show_splash()
             
-        self.update_raid_timer()
+        self.wake_raid_timer()
             
         atexit.register(self.hotkey_manager.cleanup)
+        atexit.register(self.tasks.shutdown)
+        atexit.register(self._close_async_loop)
+        
+        if "--import-profile" in sys.argv:
+            etw_import_profile.mark("App initialized")
+            self.after_idle(self._finish_import_profile)
+        if profiler.ENABLED:
+            atexit.register(profiler.flush)
+            self.after_idle(self._finish_startup_profile)
+
+    # --- Lazy Static Content (served by the Content Registry) ---
+    @property
+    def main_quests(self): return engine.load_main_quests()
+
+    @property
+    def side_quests(self): return engine.load_side_quests()
+
+    @property
+    def shop_items(self): return engine.load_shop_items()
+
+    @property
+    def aio(self):
+        """Tk-driven asyncio loop, created (and asyncio imported) on first use."""
+        if self._aio is None:
+            import etw_async_loop as async_loop
+            self._aio = async_loop.TkAsyncLoop(self)
+        return self._aio
+
+    def _close_async_loop(self):
+        if self._aio is not None: self._aio.close()
+
+    def _finish_import_profile(self):
+        etw_import_profile.mark("Splash shown")
+        etw_import_profile.write_report()
+
+    def _finish_startup_profile(self):
+        profiler.stop_startup_profile()
+        self._flush_profile()
+
+    def _flush_profile(self):
+        """Writes the --profile stats file, then re-arms itself."""
+        profiler.flush()
+        self.scheduler.schedule_in("profile_flush", profiler.STATS_FLUSH_INTERVAL, self._flush_profile)
 
     # ------------------------------------------------------------------
     # ERROR LOGGING SYSTEM
@@ -147,6 +204,7 @@ class EscapeTheWastelandApp(tk.Tk):
                 
             msg = f"{event.type} on {w_desc}{details}"
             self.action_history.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] {msg}")
+            profiler.set_action(msg) # --profile: attribute timings/IO to this click
         except: pass
 
     def handle_fatal_error(self, exc_type, exc_value, exc_traceback):
@@ -195,6 +253,7 @@ class EscapeTheWastelandApp(tk.Tk):
             self.show_game_screen()
         else:
             # Abandon Logic
+            ambush.stop_position_tracker()
             self.save_data["raid_active"] = False
             self.save_data["raid_paused"] = False
             engine.save_save_data(self.save_data)
@@ -226,24 +285,31 @@ class EscapeTheWastelandApp(tk.Tk):
                 if self.get_active_screen_name() == "town":
                      buff_manager.remove_companion_buffs(self.save_data)
 
-    def create_screens(self):
-        screen_names = [
-            "splash", "intro", "character_gen", "character_picker", "character_info", 
-            "town", "game", "quest_log", "settings",
-            "shop", "inventory", "hideout", "bar",
-            "departing", "raid_end"
-        ]
-        for name in screen_names:
-            f = tk.Frame(self, bg="#111111")
-            f.place(relx=0, rely=0, relwidth=1, relheight=1)
-            self.screens[name] = f
+    def ensure_screen(self, name):
+        """
+        Creates and builds a screen the first time it is needed.
+        New screens start below the current one; lift_screen raises them.
+        """
+        frame = self.screens.get(name)
+        if frame is None:
+            frame = tk.Frame(self, bg="#111111")
+            frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+            frame.lower()
+            self.screens[name] = frame
+            module_name, builder = SCREEN_BUILDERS[name]
+            if module_name is None:
+                getattr(self, builder)()
+            else:
+                getattr(importlib.import_module(module_name), builder)(self, frame)
+        return frame
 
     def get_screen_frame(self, name): 
-        return self.screens[name]
+        return self.ensure_screen(name)
     
     def lift_screen(self, name): 
-        self.screens[name].lift()
+        self.ensure_screen(name).lift()
         self.update_idletasks()
+        self.wake_raid_timer()
         # Log screen transition
         self.action_history.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Screen Transition -> {name}")
 
@@ -252,24 +318,6 @@ class EscapeTheWastelandApp(tk.Tk):
             if frame.winfo_ismapped(): return name
         return None
 
-    def build_all_screens(self):
-        self._build_splash()
-        self._build_intro_screen()
-        
-        etw_ui_chargen.build_character_gen_screen(self, self.get_screen_frame("character_gen"))
-        etw_ui_chargen.build_character_picker_screen(self, self.get_screen_frame("character_picker"))
-        etw_ui_charinfo.build_character_info_screen(self, self.get_screen_frame("character_info"))
-        etw_ui_settings.build_settings_screen(self, self.get_screen_frame("settings"))
-        etw_ui_town.build_town_screen(self, self.get_screen_frame("town"))
-        etw_ui_game.build_game_screen(self, self.get_screen_frame("game"))
-        etw_ui_quests.build_quest_log_screen(self, self.get_screen_frame("quest_log"))
-        etw_ui_shop.build_shop_screen(self, self.get_screen_frame("shop"))
-        etw_ui_inventory.build_inventory_screen(self, self.get_screen_frame("inventory"))
-        etw_ui_hideout.build_hideout_screen(self, self.get_screen_frame("hideout"))
-        etw_ui_bar.build_bar_screen(self, self.get_screen_frame("bar"))
-        etw_ui_raid_transition.build_departing_screen(self, self.get_screen_frame("departing"))
-        etw_ui_raid_transition.build_raid_end_screen(self, self.get_screen_frame("raid_end"))
-
     def _build_splash(self):
         f = self.get_screen_frame("splash")
         tk.Label(f, text="Escape the Wasteland", fg="#00FF00", bg="#111111", font=("Courier", 36, "bold")).pack(expand=True, pady=(50, 0))
@@ -285,6 +333,8 @@ class EscapeTheWastelandApp(tk.Tk):
         self.intro_btn.place(relx=0.5, rely=0.85, anchor="center")
 
     def show_intro_screen(self):
+        global INTRO_TEXT
+        if not INTRO_TEXT: INTRO_TEXT = dialogue.get_intro_text()
         self.lift_screen("intro")
         self.intro_active = True
         self.intro_skipped = False
@@ -335,12 +385,15 @@ class EscapeTheWastelandApp(tk.Tk):
             self._check_startup_buff_state()
 
     def show_town_screen(self):
+        import etw_ui_town
+        self.ensure_screen("town")
         etw_ui_town.update_town_stats(self)
         self.raid_depart_btn.config(state="normal", text="Depart on Raid", bg="#003300")
         self.lift_screen("town")
 
     def show_game_screen(self):
-        import etw_ui_quests, etw_ui_game
+        import etw_ui_town, etw_ui_game
+        self.ensure_screen("game")
         self.quest_display_page = 0 
         etw_ui_game.refresh_pending_tasks_game(self, self.task_frame)
         etw_ui_game.refresh_raid_quest_hud(self, self.main_quest_frame)
@@ -361,97 +414,96 @@ class EscapeTheWastelandApp(tk.Tk):
         self.lift_screen("game")
 
     def show_quest_log_screen(self):
+        import etw_ui_quests
+        self.ensure_screen("quest_log")
         etw_ui_quests.refresh_quest_log_screen(self)
         self.lift_screen("quest_log")
 
     def show_shop_screen(self):
+        import etw_ui_shop
+        self.ensure_screen("shop")
         etw_ui_shop.refresh_shop_ui(self)
         self.lift_screen("shop")
 
     def show_inventory_screen(self):
+        import etw_ui_inventory
+        self.ensure_screen("inventory")
         etw_ui_inventory.refresh_inventory_ui(self)
         self.lift_screen("inventory")
 
     def show_hideout_screen(self):
+        import etw_ui_hideout
+        self.ensure_screen("hideout")
         etw_ui_hideout.refresh_hideout_ui(self)
         self.lift_screen("hideout")
 
     def show_bar_screen(self):
+        import etw_ui_bar
+        self.ensure_screen("bar")
         etw_ui_bar.refresh_bar_ui(self)
         self.lift_screen("bar")
 
     def show_settings_screen(self, next_screen=None):
         import etw_ui_settings
+        self.ensure_screen("settings")
         if next_screen:
             self.settings_next_screen = next_screen 
         self.path_display_label.config(text=self.save_data.get("game_install_path", "Not Set"))
         self.lift_screen("settings")
         
     def show_character_info_screen(self):
+        import etw_ui_charinfo
+        self.ensure_screen("character_info")
         etw_ui_charinfo.refresh_character_info_ui(self)
         self.lift_screen("character_info")
         
     def start_character_gen(self):
+        import etw_ui_chargen
+        # The chargen flow refreshes both of its screens before lifting them
+        self.ensure_screen("character_gen")
+        self.ensure_screen("character_picker")
         etw_ui_chargen.start_character_gen(self)
 
     # -----------------------
-    # RAID LIFECYCLE (ASYNC POLLING REFACTOR)
+    # RAID LIFECYCLE (ASYNC BRIDGE)
     # -----------------------
     def start_raid(self):
         import etw_ui_raid_transition
         self.lift_screen("departing")
         etw_ui_raid_transition.update_depart_status(self, "Scanning Vitals...")
-        path = self.save_data.get("game_install_path")
-        
-        # Step 1: Trigger Baseline Scan if buffs enabled
-        if path and self.save_data.get("companion_buffs", False):
-            bridge.trigger_baseline_scan(path)
-            # Enter Non-Blocking Polling Loop
-            self._poll_raid_scan_results(start_time=time.time())
-        else:
-            # Skip scan, go straight to teleport
-            self.after(1000, self._start_raid_sequence_3)
+        self.aio.spawn(self._raid_departure())
 
-    def _poll_raid_scan_results(self, start_time):
+    async def _raid_departure(self):
         """
-        Polls for the baseline scan file without freezing the UI.
+        Baseline scan -> buff batch -> teleport, awaited on the Tk-driven loop.
         """
+        import etw_ui_raid_transition
         path = self.save_data.get("game_install_path")
         
-        # NON-BLOCKING READ
-        res = bridge.read_baseline_scan(path, blocking=False)
-        
-        if res:
-            # SUCCESS: File found and read
-            if "baseline" not in self.save_data: self.save_data["baseline"] = {}
-            self.save_data["baseline"].update(res["stats"])
-            inventory.perform_full_inventory_sync(self.save_data)
+        # Step 1: Baseline Scan + Buffs (only if buffs enabled)
+        if path and self.save_data.get("companion_buffs", False):
+            res = await bridge.scan(path, timeout=15.0)
+            if res:
+                if "baseline" not in self.save_data: self.save_data["baseline"] = {}
+                self.save_data["baseline"].update(res.stats)
+                inventory.perform_full_inventory_sync(self.save_data)
+            else:
+                # Timeout - Proceed anyway to avoid softlock
+                print("Raid Start: Scan Timed Out. Proceeding without fresh baseline.")
             
-            # Proceed to Step 2 (Buff Application)
-            self._start_raid_sequence_buffs()
+            # Step 2: Buff Application
+            etw_ui_raid_transition.update_depart_status(self, "Injecting Stims (Buffs)...")
+            future = buff_manager.apply_companion_buffs(self.save_data)
             
+            # Teleport once the game acknowledges the buff batch (no fixed 2s wait).
+            # The teleport is queued behind it either way, so the cap only bounds the UI.
+            await bridge.wait_batch(future, BATCH_ACK_MAX_WAIT)
         else:
-            # FAILURE/WAITING
-            elapsed = time.time() - start_time
-            if elapsed > 15.0:
-                # Timeout - Proceed anyway to avoid softlock, but log/notify
-                print("Raid Start: Scan Timed Out. Proceeding without fresh baseline.")
-                self._start_raid_sequence_buffs()
-            else:
-                # Schedule next check in 100ms
-                self.after(100, lambda: self._poll_raid_scan_results(start_time))
-
-    def _start_raid_sequence_buffs(self):
-        """
-        Formerly _start_raid_sequence_2. Now applies buffs and transitions to teleport.
-        """
-        import etw_ui_raid_transition
-        etw_ui_raid_transition.update_depart_status(self, "Injecting Stims (Buffs)...")
-        buff_manager.apply_companion_buffs(self.save_data)
+            # Skip scan, go straight to teleport
+            import asyncio
+            await asyncio.sleep(1.0)
         
-        # Give game 2 seconds to process buff commands before teleporting
-        # Commands are fire-and-forget, but we want them to register before load screen.
-        self.after(2000, self._start_raid_sequence_3)
+        self._start_raid_sequence_3()
 
     def _start_raid_sequence_3(self):
         """
@@ -477,88 +529,154 @@ class EscapeTheWastelandApp(tk.Tk):
         self.handle_extraction(is_sos=True)
 
     def handle_extraction(self, is_sos=False):
+        import etw_ui_raid_transition
+        if self.tasks.is_running("extraction"): return
         self.reset_pause_state()
-        context = raid.prepare_extraction(self.save_data, is_sos=is_sos)
-        self.pending_raid_context = context
+        ambush.stop_position_tracker()
+        
+        # Rewards are rolled and committed here on the Tk thread; only the verified
+        # batch (blocks for up to 8s) runs on the worker pool. The raid clock
+        # stays stopped until the outcome is committed.
+        plan = raid.plan_extraction(self.save_data, is_sos=is_sos)
+        self.tasks.submit("extraction", raid.send_extraction_batch, plan,
+                          on_done=lambda verified: self._on_extraction_sent(plan, verified),
+                          on_error=self._on_extraction_failed)
+        self.scheduler.cancel("raid_tick")
         self.lift_screen("raid_end")
+        etw_ui_raid_transition.show_extraction_pending(self)
+
+    def _on_extraction_sent(self, plan, verified):
+        self._on_extraction_prepared(raid.commit_extraction(self.save_data, plan, verified))
+
+    def _on_extraction_prepared(self, context):
+        import etw_ui_raid_transition
+        self.pending_raid_context = context
         etw_ui_raid_transition.animate_raid_end_sequence(self, context)
 
+    def _on_extraction_failed(self, exc):
+        print(f"Extraction Error: {exc}")
+        self._on_extraction_prepared({"outcome": "ERROR", "message": f"Extraction failed ({exc})."})
+
+    def remove_game_items(self, key, items, on_done):
+        """
+        Verified removal of inventory items without blocking the Tk thread:
+        checks `items` now, sends the removal batch on the worker pool under
+        `key`, and applies it to the local inventory back on the Tk thread.
+        on_done(result) gets a verify_and_remove_items style result dict
+        (possibly synchronously). Returns False if `key` is busy.
+        """
+        if self.tasks.is_running(key): return False
+        removals, cmds, missing = inventory.plan_item_removal(self.save_data, items)
+        if missing:
+            on_done({"success": False, "missing": missing})
+            return True
+        if not cmds:
+            on_done({"success": True})
+            return True
+        
+        def finish(verified):
+            if not verified:
+                on_done({"success": False, "msg": "Game Communication Failed"})
+                return
+            inventory.update_local_inventory(self.save_data, removed_items=removals)
+            on_done({"success": True})
+        
+        self.tasks.submit(key, bridge.execute_batch_with_verification, self.save_data.get("game_install_path", ""), cmds,
+                          on_done=finish, on_error=lambda exc: finish(False))
+        return True
+
     def handle_death(self):
+        import etw_ui_raid_transition
         self.reset_pause_state()
+        ambush.stop_position_tracker()
         context = raid.prepare_death(self.save_data)
         self.pending_raid_context = context
         self.lift_screen("raid_end")
         etw_ui_raid_transition.animate_raid_end_sequence(self, context)
 
     def finalize_raid_end(self):
+        import etw_ui_raid_transition
+        etw_ui_raid_transition.cancel_background_process(self)
         raid.finalize_raid_teleport(self.save_data)
         self.pending_raid_context = None
         self.show_town_screen()
 
     def update_raid_timer(self):
+        import etw_ui_game
         status = game_timer.process_game_tick(self.save_data)
         if status["is_active"]:
+            self.ensure_screen("game") # The HUD widgets below live on it (e.g. raid resumed at startup)
             elapsed = status["elapsed_seconds"]
             if status["is_paused"]:
-                self.raid_timer_label.config(text="PAUSED", fg="#FFFF00")
+                ui_view.set_if_changed(self.raid_timer_label, text="PAUSED", fg="#FFFF00")
             else:
                 mins = int(elapsed // 60)
                 secs = int(elapsed % 60)
-                self.raid_timer_label.config(text=f"Raid time: {mins:02}:{secs:02}")
+                ui_view.set_if_changed(self.raid_timer_label, text=f"Raid time: {mins:02}:{secs:02}")
+                ambush.ensure_position_tracker(self.save_data)
                 
                 # --- NEW AMBUSH LOGIC ---
                 if status["ambush_triggered"]:
-                    # 1. Lock Target Location
-                    ambush_data = ambush.prepare_ambush_coords(self.save_data)
-                    
-                    if ambush_data:
-                        # 2. Show Warning
-                        self.show_temporary_text(self.raid_condition_raid_label, "AMBUSH IMMINENT! HOLD POSITION...", "#FF0000", 3000)
-                        
-                        # 3. Random Delay (3-8 seconds)
-                        delay_ms = random.randint(3000, 8000)
-                        
-                        # 4. Schedule Strike
-                        self.after(delay_ms, lambda: ambush.execute_ambush_spawn(self.save_data, ambush_data))
-                    else:
-                        print("Ambush Warning: Could not prepare coords (Game paused or bridge busy?)")
+                    # 1. Lock Target Location (may fall back to a live dump; off the Tk thread)
+                    self.tasks.submit("ambush_prep", ambush.prepare_ambush_coords, self.save_data,
+                                      on_done=self._on_ambush_prepared)
 
                 etw_ui_game.update_companion_raid_hud(self)
                 if self.sos_button.winfo_exists():
-                    self.sos_button.config(text=status["sos_text"], state=status["sos_state"])
-                    if status["sos_ready"]: self.sos_button.config(bg="#AA5500")
-                    else: self.sos_button.config(bg="#331100")
+                    ui_view.set_if_changed(self.sos_button, text=status["sos_text"], state=status["sos_state"],
+                                            bg="#AA5500" if status["sos_ready"] else "#331100")
                 if status["fail_state"]:
-                    self.died_button.config(text=status["fail_state"])
+                    ui_view.set_if_changed(self.died_button, text=status["fail_state"])
                     if "FAILED" in status["fail_state"]:
-                        self.extracted_button.config(state="disabled")
+                        ui_view.set_if_changed(self.extracted_button, state="disabled")
                     else:
-                        self.extracted_button.config(state="normal")
+                        ui_view.set_if_changed(self.extracted_button, state="normal")
                 else:
-                    self.died_button.config(text="DIED")
-                    self.extracted_button.config(state="normal")
-
-        if hasattr(self, 'town_threat_canvas') and self.town_threat_canvas.winfo_exists():
-            threat = self.save_data.get("threat_level", 1)
-            w = 100
-            pct = min(1.0, threat / 5.0)
-            self.town_threat_canvas.coords(self.town_threat_rect, 0, 0, int(w * pct), 15)
-            col = "#00FF00"
-            if threat >= 3: col = "#FFFF00"
-            if threat >= 5: col = "#FF0000"
-            self.town_threat_canvas.itemconfig(self.town_threat_rect, fill=col)
+                    ui_view.set_if_changed(self.died_button, text="DIED")
+                    ui_view.set_if_changed(self.extracted_button, state="normal")
+
+        self._update_threat_bar(getattr(self, 'town_threat_canvas', None), getattr(self, 'town_threat_rect', None), 100)
+        self._update_threat_bar(getattr(self, 'raid_threat_canvas', None), getattr(self, 'raid_threat_rect', None), 200)
+
+        # Sleep until the next visible change; town and pause leave the loop idle
+        # until wake_raid_timer() is called.
+        delay = game_timer.next_event_delay(self.save_data, status)
+        if delay is None:
+            self.scheduler.cancel("raid_tick")
+        else:
+            self.scheduler.schedule_in("raid_tick", delay, self.update_raid_timer)
+
+    def _on_ambush_prepared(self, ambush_data):
+        if not self.save_data.get("raid_active"): return # Raid ended while locating the player
+        if ambush_data:
+            # 2. Show Warning
+            self.show_temporary_text(self.raid_condition_raid_label, "AMBUSH IMMINENT! HOLD POSITION...", "#FF0000", 3000)
+            
+            # 3. Random Delay (3-8 seconds)
+            delay_ms = random.randint(3000, 8000)
             
-        if hasattr(self, 'raid_threat_canvas') and self.raid_threat_canvas.winfo_exists():
-            threat = self.save_data.get("threat_level", 1)
-            w_r = 200
-            pct = min(1.0, threat / 5.0)
-            self.raid_threat_canvas.coords(self.raid_threat_rect, 0, 0, int(w_r * pct), 15)
-            col = "#00FF00"
-            if threat >= 3: col = "#FFFF00"
-            if threat >= 5: col = "#FF0000"
-            self.raid_threat_canvas.itemconfig(self.raid_threat_rect, fill=col)
-
-        self.after(1000, self.update_raid_timer)
+            # 4. Schedule Strike
+            self.after(delay_ms, lambda: ambush.execute_ambush_spawn(self.save_data, ambush_data))
+        else:
+            print("Ambush Warning: Could not prepare coords (Game paused or bridge busy?)")
+
+    def wake_raid_timer(self):
+        """Restarts an idle raid timer (screen change, unpause, raid start)."""
+        if self.tasks.is_running("extraction"): return # Woken by the next screen change once it settles
+        if not self.scheduler.is_scheduled("raid_tick"):
+            self.scheduler.schedule_in("raid_tick", 0, self.update_raid_timer)
+
+    def _update_threat_bar(self, canvas, rect, width):
+        if canvas is None or not canvas.winfo_exists(): return
+        threat = self.save_data.get("threat_level", 1)
+        if getattr(canvas, '_drawn_threat', None) == threat: return
+        pct = min(1.0, threat / 5.0)
+        canvas.coords(rect, 0, 0, int(width * pct), 15)
+        col = "#00FF00"
+        if threat >= 3: col = "#FFFF00"
+        if threat >= 5: col = "#FF0000"
+        canvas.itemconfig(rect, fill=col)
+        canvas._drawn_threat = threat
 
     def reset_pause_state(self):
         self.save_data["raid_paused"] = False
@@ -566,6 +684,7 @@ class EscapeTheWastelandApp(tk.Tk):
         if hasattr(self, 'raid_pause_button') and self.raid_pause_button.winfo_exists():
             self.raid_pause_button.config(text="Pause")
         engine.save_save_data(self.save_data)
+        self.wake_raid_timer()
 
     def register_wrappable(self, label):
         label.config(wraplength=self.current_wrap_width)
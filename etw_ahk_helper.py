@@ -0,0 +1,301 @@
+import os
+import sys
+import time
+import socket
+import atexit
+import threading
+import subprocess
+
+# ----------------------------------------------------------------------
+# PERSISTENT AHK HELPER
+# ----------------------------------------------------------------------
+# Instead of spawning run_bat.ahk (shell + interpreter) for every batch, the
+# bridge starts one long-lived helper and streams batches to it.
+#
+# Protocol (tab separated lines, both directions):
+#   bridge -> helper:  RUN <seq> <game_path> <batch_stem> <ack_path>
+#                      QUIT
+#   helper -> bridge:  READY
+#                      TYPED <seq>            (console closed, keyboard free)
+#                      FAIL <seq> <reason>
+#
+# Transports are pluggable:
+#   "file"   - control files (etw_helper.in / etw_helper.out). The AHK helper
+#              (etw_helper.ahk) speaks this one; AHK v1 has no sockets.
+#   "socket" - localhost TCP. The bridge listens, the helper connects back.
+#
+# etw_helper_stub.py implements the same protocol in Python and fakes the
+# game console, for testing the whole bridge on Linux.
+
+HELPER_SCRIPT = "etw_helper.ahk"
+STUB_SCRIPT = "etw_helper_stub.py"
+
+HELPER_TRANSPORT = "file"
+HELPER_DIR = "."             # Where the control files live
+READY_TIMEOUT = 5.0          # Helper must report READY within this
+TYPED_TIMEOUT = 12.0         # Helper must finish typing a batch within this
+RESTART_BACKOFF = 30.0       # Don't retry a failed helper start more often than this
+
+_HELPER = None
+_HELPER_LOCK = threading.Lock()
+_LAST_START_FAILURE = 0.0
+_COMMAND = None              # Helper command (list); None = platform default
+
+# ----------------------------------------------------------------------
+# TRANSPORTS
+# ----------------------------------------------------------------------
+
+class FileTransport:
+    """Control-file transport: append-only request and reply files."""
+    name = "file"
+    poll_interval = 0.02
+
+    def __init__(self, directory=HELPER_DIR):
+        self.in_path = os.path.abspath(os.path.join(directory, "etw_helper.in"))
+        self.out_path = os.path.abspath(os.path.join(directory, "etw_helper.out"))
+        self._offset = 0
+        self._buffer = ""
+
+    def open(self):
+        for path in (self.in_path, self.out_path):
+            with open(path, "w", encoding="utf-8"):
+                pass
+        self._offset = 0
+        self._buffer = ""
+
+    def helper_args(self):
+        return [self.in_path, self.out_path]
+
+    def accept(self, timeout):
+        return True
+
+    def send(self, line):
+        with open(self.in_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+
+    def recv(self, timeout):
+        deadline = time.time() + timeout
+        while True:
+            if "\n" in self._buffer:
+                line, self._buffer = self._buffer.split("\n", 1)
+                return line.rstrip("\r")
+            try:
+                with open(self.out_path, "r", encoding="utf-8", errors="ignore") as f:
+                    f.seek(self._offset)
+                    chunk = f.read()
+                    self._offset = f.tell()
+                self._buffer += chunk
+                if chunk: continue
+            except OSError:
+                pass
+            if time.time() >= deadline:
+                return None
+            time.sleep(self.poll_interval)
+
+    def close(self):
+        pass
+
+class SocketTransport:
+    """Localhost TCP transport. Listens on an ephemeral port; helper connects back."""
+    name = "socket"
+
+    def __init__(self, host="127.0.0.1"):
+        self.host = host
+        self._server = None
+        self._conn = None
+        self._buffer = b""
+
+    def open(self):
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind((self.host, 0))
+        self._server.listen(1)
+        self._buffer = b""
+
+    def helper_args(self):
+        return [str(self._server.getsockname()[1])]
+
+    def accept(self, timeout):
+        self._server.settimeout(timeout)
+        try:
+            self._conn, _ = self._server.accept()
+            return True
+        except OSError:
+            return False
+
+    def send(self, line):
+        self._conn.sendall((line + "\n").encode("utf-8"))
+
+    def recv(self, timeout):
+        deadline = time.time() + timeout
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.time()
+            if remaining <= 0: return None
+            self._conn.settimeout(remaining)
+            try:
+                chunk = self._conn.recv(4096)
+            except socket.timeout:
+                return None
+            except OSError:
+                return None
+            if not chunk: return None
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line.decode("utf-8", "ignore").rstrip("\r")
+
+    def close(self):
+        for s in (self._conn, self._server):
+            if s:
+                try: s.close()
+                except OSError: pass
+        self._conn = None
+        self._server = None
+
+TRANSPORTS = {"file": FileTransport, "socket": SocketTransport}
+
+# ----------------------------------------------------------------------
+# HELPER CLIENT
+# ----------------------------------------------------------------------
+
+class HelperClient:
+    """
+    One running helper process plus its transport.
+    run_batch() is called from the bridge worker thread only.
+    """
+    def __init__(self, command, transport):
+        self.command = list(command)
+        self.transport = transport
+        self.process = None
+        self.alive = False
+        self._seq = 0
+
+    def start(self):
+        self.transport.open()
+        args = self.command + self.transport.helper_args()
+        try:
+            # shell=True matches how run_bat.ahk is launched (file association)
+            self.process = subprocess.Popen(args, shell=(os.name == "nt"))
+        except Exception as e:
+            print(f"[Helper] Launch Error: {e}")
+            self.transport.close()
+            return False
+
+        if not self.transport.accept(READY_TIMEOUT) or self.transport.recv(READY_TIMEOUT) != "READY":
+            print("[Helper] Helper did not report READY. Falling back to per-batch AHK.")
+            self.stop()
+            return False
+        self.alive = True
+        return True
+
+    def run_batch(self, game_path, batch_stem, ack_path, timeout=TYPED_TIMEOUT):
+        """
+        Streams one batch to the helper and waits for its typed acknowledgement.
+        Returns True when typed, False on FAIL. A missing reply kills the helper.
+        """
+        self._seq += 1
+        seq = str(self._seq)
+        try:
+            self.transport.send("\t".join(("RUN", seq, os.path.abspath(game_path), batch_stem, ack_path or "-")))
+        except OSError as e:
+            print(f"[Helper] Send Error: {e}")
+            self.stop()
+            return False
+
+        deadline = time.time() + timeout
+        while True:
+            line = self.transport.recv(max(0.0, deadline - time.time()))
+            if line is None:
+                print(f"[Helper] No reply for batch {seq}. Restarting helper on next use.")
+                self.stop()
+                return False
+            parts = line.split("\t")
+            if len(parts) >= 2 and parts[1] == seq:
+                if parts[0] == "TYPED": return True
+                if parts[0] == "FAIL":
+                    print(f"[Helper] Batch {seq} failed: {parts[2] if len(parts) > 2 else 'unknown'}")
+                    return False
+            # Stale reply from an earlier, timed-out batch: keep reading
+
+    def stop(self):
+        self.alive = False
+        try:
+            self.transport.send("QUIT")
+        except Exception:
+            pass
+        self.transport.close()
+        if self.process and self.process.poll() is None and os.name != "nt":
+            try: self.process.terminate()
+            except OSError: pass
+        self.process = None
+
+# ----------------------------------------------------------------------
+# PUBLIC API
+# ----------------------------------------------------------------------
+
+def stub_command():
+    """Command line for the Python stub helper (fake console, any OS)."""
+    return [sys.executable, os.path.abspath(STUB_SCRIPT)]
+
+def _default_command():
+    if os.environ.get("ETW_HELPER") == "stub":
+        return stub_command()
+    if os.name == "nt" and os.path.exists(HELPER_SCRIPT):
+        return [os.path.abspath(HELPER_SCRIPT)]
+    return None
+
+def configure(command=None, transport=None):
+    """
+    Overrides the helper command and/or transport (restarts on next use).
+    e.g. configure(stub_command(), "socket") on Linux.
+    """
+    global _COMMAND, HELPER_TRANSPORT, _LAST_START_FAILURE
+    shutdown()
+    with _HELPER_LOCK:
+        _COMMAND = command
+        if transport: HELPER_TRANSPORT = transport
+        _LAST_START_FAILURE = 0.0
+
+def get_helper():
+    """
+    Returns a running HelperClient, starting one if needed.
+    Returns None when no helper is configured or it failed to start recently.
+    """
+    global _HELPER, _LAST_START_FAILURE
+    with _HELPER_LOCK:
+        if _HELPER and _HELPER.alive:
+            return _HELPER
+
+        command = _COMMAND or _default_command()
+        if not command: return None
+        if time.time() - _LAST_START_FAILURE < RESTART_BACKOFF: return None
+
+        transport = TRANSPORTS.get(HELPER_TRANSPORT, FileTransport)()
+        helper = HelperClient(command, transport)
+        if not helper.start():
+            _LAST_START_FAILURE = time.time()
+            _HELPER = None
+            return None
+        _HELPER = helper
+        return helper
+
+def is_running():
+    with _HELPER_LOCK:
+        return bool(_HELPER and _HELPER.alive)
+
+def run_batch(game_path, batch_stem, ack_path=None):
+    """
+    Types 'bat <batch_stem>' through the persistent helper.
+    Returns True/False, or None if no helper is available (caller spawns AHK).
+    """
+    helper = get_helper()
+    if helper is None: return None
+    return helper.run_batch(game_path, batch_stem, ack_path)
+
+def shutdown():
+    global _HELPER
+    with _HELPER_LOCK:
+        if _HELPER:
+            _HELPER.stop()
+        _HELPER = None
+
+atexit.register(shutdown)
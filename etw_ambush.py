@@ -1,9 +1,11 @@
+import math
 import random
+import threading
 import time
 
 # Foundation
-import etw_config as config
-import etw_io as io
+import etw_save_manager as save_manager
+import etw_content as registry
 
 # Sub-Systems
 import etw_bridge as bridge
@@ -16,37 +18,150 @@ MIN_SECONDS_BETWEEN_AMBUSHES = 300
 BASE_AMBUSH_CHANCE_PER_TICK = 0.005   
 AMBUSH_THREAT_FACTOR = 0.002          
 
-_AMBUSHES = None 
-
 def _load_ambushes():
-    """Lazy load static data."""
-    global _AMBUSHES
-    if _AMBUSHES is None:
-        try:
-            # Refactored to use IO/Config
-            _AMBUSHES = io.load_json(config.PATHS["ambushes"], [])
-        except AttributeError:
-             _AMBUSHES = []
+    """Static ambush groups, served by the Content Registry."""
+    return registry.get_content("ambushes", [])
 
 # --------------------------
 # 2. POSITION TRACKING
 # --------------------------
 
+# A background tracker keeps the last known position (with its timestamp)
+# during raids, so prepare_ambush_coords can answer from the cache instead of
+# blocking the Tk thread on a dump. It only dumps inside the window before
+# the planned ambush, every POSITION_PREFETCH_INTERVAL: each dump opens the
+# game console, and anything older than POSITION_MAX_AGE is useless anyway.
+# Failed dumps wait out the same interval, so a dead bridge is not hammered.
+
+POSITION_PREFETCH_WINDOW = 30.0   # Raid seconds before a planned ambush to prefetch in
+POSITION_PREFETCH_INTERVAL = 5.0  # Dump cadence inside that window
+POSITION_MAX_AGE = 10.0           # Older cached positions fall back to a live dump
+TRACKER_POLL = 1.0                # Tracker re-checks raid/pause state this often
+
+_POS_CACHE = {"pos": None, "time": 0.0}
+_POS_LOCK = threading.Lock()      # One dump in flight (both paths share etw_pos)
+_TRACKER = {"thread": None, "stop": threading.Event()}
+
 def get_player_position_with_retry(game_path):
     """
     Fetches player coordinates using the Bridge's smart polling.
+    Blocks for up to 5s; successful reads refresh the position cache.
     """
-    bridge.trigger_position_dump(game_path)
-    pos = bridge.read_player_position(game_path)
+    with _POS_LOCK:
+        bridge.trigger_position_dump(game_path)
+        pos = bridge.read_player_position(game_path)
+        if pos:
+            _POS_CACHE["pos"] = pos
+            _POS_CACHE["time"] = time.time()
     return pos
 
+def get_cached_position(max_age=POSITION_MAX_AGE):
+    """Last tracked position if it is at most max_age seconds old, else None."""
+    pos, stamp = _POS_CACHE["pos"], _POS_CACHE["time"]
+    if pos and (time.time() - stamp) <= max_age:
+        return dict(pos)
+    return None
+
+def _raid_elapsed(save_data):
+    start_t = save_data.get("last_raid_start_timestamp", time.time())
+    return time.time() - start_t - save_data.get("raid_paused_elapsed", 0.0)
+
+def _in_prefetch_window(save_data):
+    """True when a planned ambush is at most POSITION_PREFETCH_WINDOW raid seconds away."""
+    next_at = save_data.get("ambush_state", {}).get("next_ambush_at")
+    return next_at is not None and next_at - _raid_elapsed(save_data) <= POSITION_PREFETCH_WINDOW
+
+def _position_tracker_loop(save_data):
+    stop = _TRACKER["stop"]
+    last_attempt = 0.0
+    while not stop.is_set() and save_data.get("raid_active"):
+        game_path = save_data.get("game_install_path", "")
+        if game_path and not save_data.get("raid_paused", False) and _in_prefetch_window(save_data):
+            # Successful or not, the next dump waits a full interval
+            if time.time() - max(last_attempt, _POS_CACHE["time"]) >= POSITION_PREFETCH_INTERVAL:
+                last_attempt = time.time()
+                try:
+                    get_player_position_with_retry(game_path)
+                except Exception as e:
+                    print(f"Position Tracker Error: {e}")
+        stop.wait(TRACKER_POLL)
+
+def ensure_position_tracker(save_data):
+    """
+    Starts the background position tracker if a raid is running and it is not.
+    Cheap enough to call every raid tick; the thread exits when the raid ends.
+    """
+    if not save_data.get("raid_active"):
+        return
+    thread = _TRACKER["thread"]
+    if thread is not None and thread.is_alive():
+        return
+    _TRACKER["stop"].clear()
+    thread = threading.Thread(target=_position_tracker_loop, args=(save_data,), daemon=True)
+    _TRACKER["thread"] = thread
+    thread.start()
+
+def stop_position_tracker():
+    """Called on raid end (extraction, death, abandon); a dump in flight still completes."""
+    _TRACKER["stop"].set()
+
 # --------------------------
 # 3. AMBUSH LOGIC
 # --------------------------
 
+# Instead of rolling random() every tick, the next ambush is planned once:
+# a per-tick chance p is a geometric wait, i.e. floor(Exp(rate)) whole ticks
+# with rate = -ln(1 - p), added to the moment the raid first allows one
+# (MIN_SECONDS_BEFORE_FIRST_AMBUSH, post-ambush cooldown). The plan is stored
+# in ambush_state in raid-elapsed seconds and redrawn whenever threat or the
+# modifier changes (the process is memoryless, so resampling is unbiased).
+
+HOSTILE_COOLDOWN = 120
+HOSTILE_CHANCE_BONUS = 0.05
+
+def _ambush_params(save_data):
+    """(cooldown_seconds, chance_per_tick) for the current threat/modifier."""
+    mod_id = save_data.get("current_raid_modifier")
+    threat = int(save_data.get("threat_level", 0))
+    cooldown = MIN_SECONDS_BETWEEN_AMBUSHES
+    chance = BASE_AMBUSH_CHANCE_PER_TICK + (threat * AMBUSH_THREAT_FACTOR)
+    if mod_id == "hostile_wasteland":
+        cooldown = HOSTILE_COOLDOWN
+        chance += HOSTILE_CHANCE_BONUS
+    return cooldown, chance
+
+def _plan_key(save_data):
+    # A list, so it still compares equal after a JSON round-trip
+    return [int(save_data.get("threat_level", 0)), save_data.get("current_raid_modifier")]
+
+def plan_next_ambush(save_data, elapsed_time):
+    """
+    Samples and stores the raid-elapsed time of the next ambush.
+    Returns it, or None when no ambush can happen (watching_eyes).
+    """
+    amb_state = save_data.get("ambush_state", {})
+    next_at = None
+
+    if save_data.get("current_raid_modifier") != "watching_eyes":
+        cooldown, chance = _ambush_params(save_data)
+        last_time = amb_state.get("last_check_time", 0.0)
+        cooldown_left = max(0.0, cooldown - (time.time() - last_time))
+        eligible = max(MIN_SECONDS_BEFORE_FIRST_AMBUSH, elapsed_time + cooldown_left)
+
+        if chance >= 1.0:
+            next_at = eligible
+        elif chance > 0.0:
+            next_at = eligible + math.floor(random.expovariate(-math.log1p(-chance)))
+
+    amb_state["next_ambush_at"] = next_at
+    amb_state["plan_key"] = _plan_key(save_data)
+    save_data["ambush_state"] = amb_state
+    save_manager.journal_changes(save_data, "ambush_state")
+    return next_at
+
 def check_ambush_trigger(save_data, elapsed_time, force=False):
     """
-    Determines if an ambush SHOULD trigger.
+    Determines if an ambush SHOULD trigger (the planned time has been reached).
     Returns True if conditions are met, False otherwise.
     Does NOT execute the spawn.
     """
@@ -54,62 +169,57 @@ def check_ambush_trigger(save_data, elapsed_time, force=False):
     if not save_data.get("raid_active", False):
         return False
 
-    if force:
-        pass
-    else:
-        mod_id = save_data.get("current_raid_modifier")
-        
-        if mod_id == "watching_eyes":
-            return False 
-                         
-        if elapsed_time < MIN_SECONDS_BEFORE_FIRST_AMBUSH: return False
-        
-        amb_state = save_data.get("ambush_state", {})
-        last_time = amb_state.get("last_check_time", 0.0)
-        now = time.time()
-        
-        cooldown = MIN_SECONDS_BETWEEN_AMBUSHES
-        
-        if mod_id == "hostile_wasteland":
-            cooldown = 120 
-            
-        if (now - last_time) < cooldown: return False
-        
-        threat = int(save_data.get("threat_level", 0))
-        chance = BASE_AMBUSH_CHANCE_PER_TICK + (threat * AMBUSH_THREAT_FACTOR)
-        
-        if mod_id == "hostile_wasteland":
-            chance += 0.05 
-            
-        if random.random() > chance: return False
-
-    # Update state immediately to prevent double-triggering
     amb_state = save_data.get("ambush_state", {})
+    if not force:
+        if amb_state.get("plan_key") != _plan_key(save_data):
+            plan_next_ambush(save_data, elapsed_time)
+        next_at = amb_state.get("next_ambush_at")
+        if next_at is None or elapsed_time < next_at: return False
+
+    # Update state immediately to prevent double-triggering, then plan the next one
     amb_state["last_check_time"] = time.time()
     save_data["ambush_state"] = amb_state
-    io.save_json(config.PATHS["save_data"], save_data)
-    
+    plan_next_ambush(save_data, elapsed_time)
+
     return True
 
+def seconds_until_next_ambush(save_data, elapsed_time):
+    """
+    Seconds until the planned ambush (0 if it is due).
+    Returns None when none is planned or the raid is not active.
+    """
+    if not save_data.get("raid_active", False):
+        return None
+    amb_state = save_data.get("ambush_state", {})
+    if amb_state.get("plan_key") != _plan_key(save_data):
+        return 0.0 # Stale plan: the next tick redraws it
+    next_at = amb_state.get("next_ambush_at")
+    if next_at is None:
+        return None
+    return max(0.0, next_at - elapsed_time)
+
 def prepare_ambush_coords(save_data):
     """
     Step 1: Get the player's current position to lock in the ambush site.
     Returns a dict with coordinates and the chosen enemy group, or None on failure.
     """
-    _load_ambushes()
+    ambushes = _load_ambushes()
     
     game_path = save_data.get("game_install_path", "")
     if not game_path: return None
     
-    # This call might take a moment as it polls the bridge
-    pos = get_player_position_with_retry(game_path)
+    # Prefetched by the position tracker; a live dump (which polls the bridge
+    # and may take a moment) only when the cache is stale
+    pos = get_cached_position()
+    if not pos:
+        pos = get_player_position_with_retry(game_path)
     
     if not pos: 
         print("Ambush Prep Failed: Could not get player position.")
         return None
         
     threat = save_data.get("threat_level", 1)
-    eligible = [g for g in _AMBUSHES if g.get("threat_tier", 1) <= (threat + 1)]
+    eligible = [g for g in ambushes if g.get("threat_tier", 1) <= (threat + 1)]
     if not eligible: return None
     
     group = random.choice(eligible)
@@ -161,11 +271,11 @@ def execute_ambush_spawn(save_data, ambush_data):
         
     if lines:
         # OPT-OUT of verification for speed
+        # Queue ordering keeps later batches behind this one; no fixed sleep needed
         bridge.process_game_commands(game_path, lines, verify=False)
-        bridge.wait_for_ahk() # Small legacy buffer just in case
         
         # Track stats
         amb_state = save_data.get("ambush_state", {})
         amb_state["ambushes_triggered"] = amb_state.get("ambushes_triggered", 0) + 1
         save_data["ambush_state"] = amb_state
-        io.save_json(config.PATHS["save_data"], save_data)
\ No newline at end of file
+        save_manager.mark_dirty(save_data)
\ No newline at end of file
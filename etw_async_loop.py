@@ -0,0 +1,72 @@
+import asyncio
+import sys
+
+# ----------------------------------------------------------------------
+# TK-DRIVEN ASYNCIO LOOP
+# ----------------------------------------------------------------------
+# An asyncio event loop that never runs on its own: Tk's after() steps it
+# while coroutines are pending. Coroutines therefore execute on the Tk
+# thread between Tk events and may touch widgets directly; awaiting the
+# async bridge (etw_bridge.run / scan / position) suspends them instead of
+# freezing the window. With nothing pending the loop is not stepped at all.
+
+STEP_MS = 20              # Step cadence while coroutines are pending
+ITERATIONS_PER_STEP = 4   # Loop passes per step (each await hop costs one pass)
+
+class TkAsyncLoop:
+    """Runs coroutines spawned from Tk callbacks on an after()-stepped loop."""
+
+    def __init__(self, root):
+        self.root = root
+        self.loop = asyncio.new_event_loop()
+        self._tasks = set()
+        self._job = None
+
+    def spawn(self, coro, on_done=None):
+        """
+        Schedules a coroutine; on_done(result) runs when it returns.
+        Exceptions go to root.report_callback_exception. Returns the asyncio Task.
+        """
+        task = self.loop.create_task(self._guard(coro, on_done))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        self._arm()
+        return task
+
+    def cancel_all(self):
+        for task in list(self._tasks):
+            task.cancel()
+        self._arm()
+
+    def close(self):
+        self.cancel_all()
+        if self._job is not None:
+            try: self.root.after_cancel(self._job)
+            except Exception: pass
+            self._job = None
+        # Let cancellations unwind before closing
+        if self._tasks:
+            self.loop.run_until_complete(asyncio.gather(*self._tasks, return_exceptions=True))
+        self.loop.close()
+
+    async def _guard(self, coro, on_done):
+        try:
+            result = await coro
+            if on_done: on_done(result)
+            return result
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+            return None
+
+    def _step(self):
+        self._job = None
+        for _ in range(ITERATIONS_PER_STEP):
+            self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+        self._arm()
+
+    def _arm(self):
+        if self._job is None and self._tasks and not self.loop.is_closed():
+            self._job = self.root.after(STEP_MS, self._step)
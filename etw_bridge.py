@@ -1,23 +1,48 @@
 import os
+import sys
 import time
 import subprocess
 import re
 import collections
 import threading
+import itertools
+import concurrent.futures
+import select
+import struct
+import ctypes
+import ctypes.util
+
+import etw_ahk_helper as ahk_helper
+import etw_profiler as profiler
 
 # ----------------------------------------------------------------------
 # CONSTANTS & TIMING
 # ----------------------------------------------------------------------
 BATCH_FILENAME = "mng.txt"
 AHK_SCRIPT_NAME = "run_bat.ahk"
-HANDSHAKE_FILENAME = "etw_handshake" # No extension needed for scof
+HANDSHAKE_FILENAME = "etw_handshake" # Legacy single handshake log (now one ack log per batch)
 
 # AHK execution buffer
 AHK_EXECUTION_TIME = 4.0
 
-# Queue Buffer (Minimum time between batch writes to allow AHK processing)
+# Queue Buffer (Legacy fixed gap between batches; the transport now paces on acks)
 BATCH_WRITE_COOLDOWN = 0.8
 
+# Pipelined Transport
+# Each batch runs from its own file (etw_b<seq>.txt) and echoes into its own
+# acknowledgement log (etw_ack_<seq>), so batches never overwrite each other
+# and every caller gets a Future for its own batch.
+BATCH_FILE_PREFIX = "etw_b"
+ACK_FILE_PREFIX = "etw_ack_"
+ACK_TIMEOUT = 8.0          # Fire & forget batches give up waiting after this
+AHK_EXIT_GRACE = 0.4       # AHK closes the console this long after the ack lands
+QUEUE_WAIT_TIMEOUT = 5.0   # Extra time a verified caller waits for batches ahead of it
+
+# Coalescing (batches queued while AHK is busy are merged into one launch)
+COALESCE_ENABLED = True
+COALESCE_WINDOW = 0.05     # Let same-tick bursts land before launching
+COALESCE_MAX_BATCHES = 16  # Upper bound of queued batches merged per launch
+
 # Log Files
 STATS_LOG_BASE = "etw_baseline" 
 STATS_LOG_FILENAME = "etw_baseline"
@@ -29,6 +54,18 @@ POS_LOG_FILENAME = "etw_pos"
 SCAN_LOG_FILENAME = STATS_LOG_FILENAME 
 INV_LOG_FILENAME = STATS_LOG_FILENAME
 
+# Completion Sentinels
+# The last command before 'scof 0' echoes a known marker. Once the marker is
+# in the log, everything before it has been written: no size-stable timer needed.
+SCAN_SENTINEL_COMMAND = "player.GetItemCount 0000000F"
+SCAN_SENTINEL = "GetItemCount"
+HANDSHAKE_SENTINEL = ("GetLevel >>", "GetLevel:")
+
+# File Watcher ("auto" = inotify on Linux, polling elsewhere)
+WATCH_BACKEND = "auto"
+WATCH_POLL_INTERVAL = 0.05   # Polling backend re-check interval
+WATCH_SAFETY_INTERVAL = 1.0  # inotify backend still re-checks this often (missed events, network drives)
+
 # Stats to track
 STATS_COVERED = [
     "health", "actionpoints", "carryweight", "damageresist", "speedmult",
@@ -40,22 +77,173 @@ STATS_COVERED = [
 # ----------------------------------------------------------------------
 # COMMAND QUEUE STATE
 # ----------------------------------------------------------------------
-_COMMAND_QUEUE = collections.deque()
+_COMMAND_QUEUE = collections.deque()   # Pending batch dicts (see submit_batch)
 _QUEUE_LOCK = threading.Lock()
 _WORKER_THREAD = None
 _SHUTDOWN_FLAG = False
+_SEQUENCE = itertools.count(1)
+_TRANSPORT_STATS = {"batches": 0, "launches": 0, "commands_in": 0, "commands_out": 0}
+
+# ----------------------------------------------------------------------
+# FILE WATCHER BACKENDS
+# ----------------------------------------------------------------------
+# A watcher only answers "something may have changed, look again".
+# Callers always re-check the file itself, so a spurious wake is harmless.
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+def _load_libc():
+    if not sys.platform.startswith("linux"): return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+_LIBC = _load_libc()
+
+class _PollingWatcher:
+    """Fallback backend: sleeps a short interval between checks."""
+    name = "poll"
+    
+    def __init__(self, directory, filenames):
+        pass
+
+    def wait(self, timeout):
+        time.sleep(max(0.0, min(timeout, WATCH_POLL_INTERVAL)))
+
+    def close(self):
+        pass
+
+class _InotifyWatcher:
+    """Linux backend: blocks until one of 'filenames' is closed after writing (or renamed in)."""
+    name = "inotify"
+    
+    def __init__(self, directory, filenames):
+        self.filenames = set(filenames)
+        self.fd = _LIBC.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        
+        wd = _LIBC.inotify_add_watch(self.fd, os.fsencode(directory), _IN_CLOSE_WRITE | _IN_MOVED_TO)
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout):
+        deadline = time.time() + min(timeout, WATCH_SAFETY_INTERVAL)
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0: return
+            
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready: return
+            
+            try:
+                buf = os.read(self.fd, 65536)
+            except BlockingIOError:
+                continue
+                
+            offset = 0
+            while offset + _INOTIFY_EVENT.size <= len(buf):
+                _, _, _, name_len = _INOTIFY_EVENT.unpack_from(buf, offset)
+                offset += _INOTIFY_EVENT.size
+                name = buf[offset:offset + name_len].rstrip(b"\0").decode("utf-8", "ignore")
+                offset += name_len
+                if name in self.filenames:
+                    return
+
+    def close(self):
+        try: os.close(self.fd)
+        except OSError: pass
+
+def _make_watcher(directory, filenames):
+    """
+    Builds the configured watcher backend, falling back to polling
+    if inotify is unavailable or the directory cannot be watched.
+    """
+    if WATCH_BACKEND in ("auto", "inotify") and _LIBC is not None:
+        try:
+            return _InotifyWatcher(directory, filenames)
+        except OSError as e:
+            print(f"[Bridge] inotify unavailable ({e}). Falling back to polling.")
+    return _PollingWatcher(directory, filenames)
 
 # ----------------------------------------------------------------------
 # SMART POLLING
 # ----------------------------------------------------------------------
 
-def await_file_creation(path, timeout=15.0, stability_duration=0.5):
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _read_if_complete(path, sentinel):
+    """
+    Returns the file's lines if the sentinel marker is present, else None.
+    'sentinel' is a marker string or a tuple of alternatives.
+    """
+    markers = (sentinel,) if isinstance(sentinel, str) else sentinel
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+    except OSError:
+        return None
+    if any(m in content for m in markers):
+        return content.splitlines(keepends=True)
+    return None
+
+def _await_sentinel(path, timeout, sentinel):
+    return _await_ready(path, timeout, lambda p: _read_if_complete(p, sentinel))
+
+def _await_ready(path, timeout, probe):
     """
-    Actively polls for a file to appear and have STABLE content.
+    Re-runs probe(path) whenever the file changes until it returns a result.
+    """
+    deadline = time.time() + timeout
+    watcher = _make_watcher(os.path.dirname(path) or ".", (os.path.basename(path),))
+    last_sig = None
+    
+    try:
+        while True:
+            # Watch is armed before this check, so a write landing now still wakes us
+            sig = _file_signature(path)
+            if sig is not None and sig != last_sig:
+                last_sig = sig
+                result = probe(path)
+                if result: return result
+                
+            remaining = deadline - time.time()
+            if remaining <= 0: return None
+            watcher.wait(remaining)
+    finally:
+        watcher.close()
+
+def await_file_creation(path, timeout=15.0, stability_duration=0.5, sentinel=None):
+    """
+    Waits for a console log file and returns its lines (or None on timeout).
+    sentinel: marker echoed by the batch's last command. The file is returned
+    the moment the marker appears. Without one, falls back to waiting until
+    the size has been stable for 'stability_duration'.
     """
     if not path: return None
     path = os.path.normpath(path)
     
+    if sentinel is not None:
+        lines = _await_sentinel(path, timeout, sentinel)
+        if lines is None:
+            print(f"[Bridge] TIMEOUT! Could not read file: {path}")
+        return lines
+    
     start_time = time.time()
     last_size = -1
     stable_start = 0
@@ -86,8 +274,8 @@ def await_file_creation(path, timeout=15.0, stability_duration=0.5):
     print(f"[Bridge] TIMEOUT! Could not read file: {path}")
     return None
 
-def read_file_safely(path, retries=20, delay=0.25):
-    return await_file_creation(path, timeout=(retries * delay * 2.0))
+def read_file_safely(path, retries=20, delay=0.25, sentinel=None):
+    return await_file_creation(path, timeout=(retries * delay * 2.0), sentinel=sentinel)
 
 def write_file_safely(path, content, retries=10, delay=0.1):
     if not path: return False
@@ -106,115 +294,277 @@ def write_file_safely(path, content, retries=10, delay=0.1):
 # CORE COMMAND EXECUTION (Low Level)
 # ----------------------------------------------------------------------
 
-def run_console_command(game_path, command_text, ahk_path=None):
+def _remove_quietly(path):
+    if os.path.exists(path):
+        try: os.remove(path)
+        except OSError: pass
+
+def run_console_command(game_path, command_text, ahk_path=None, batch_name=None, ack_path=None):
     """
     Writes the batch file and triggers AHK. 
+    batch_name: file stem AHK passes to 'bat' (default: mng).
+    ack_path: lets AHK close the console as soon as the batch acknowledges.
+    Uses the persistent helper when one is available (blocks until typed),
+    otherwise spawns run_bat.ahk. An explicit ahk_path always spawns.
     Internal use only - use process_game_commands for logic.
+    Returns True if AHK was launched.
     """
     if not game_path or not os.path.exists(game_path):
         print(f"[Bridge] Game path not found: {game_path}")
-        return
+        return False
 
-    batch_path = os.path.join(game_path, BATCH_FILENAME)
+    batch_name = batch_name or os.path.splitext(BATCH_FILENAME)[0]
+    batch_path = os.path.join(game_path, batch_name + ".txt")
     
+    if not write_file_safely(batch_path, command_text):
+        print("[Bridge] Failed to write batch file.")
+        return False
+
     if not ahk_path:
+        typed = ahk_helper.run_batch(game_path, batch_name, ack_path)
+        if typed is not None:
+            return typed
         ahk_path = os.path.abspath(AHK_SCRIPT_NAME)
         
-    if write_file_safely(batch_path, command_text):
-        try:
-            subprocess.Popen([ahk_path], shell=True)
-        except Exception as e:
-            print(f"Bridge Execution Error: {e}")
-    else:
-        print("[Bridge] Failed to write batch file.")
+    args = [ahk_path, batch_name]
+    if ack_path: args.append(os.path.abspath(ack_path))
+    try:
+        subprocess.Popen(args, shell=True)
+        return True
+    except Exception as e:
+        print(f"Bridge Execution Error: {e}")
+    return False
 
 # ----------------------------------------------------------------------
-# QUEUE WORKER
+# PIPELINED TRANSPORT
 # ----------------------------------------------------------------------
+# The keyboard is a single resource, so AHK launches stay in submission order.
+# Instead of sleeping BATCH_WRITE_COOLDOWN after every batch, the worker
+# launches the next batch as soon as the previous one is acknowledged.
+
+def _run_batch(batch):
+    """
+    Executes one sequence-numbered batch and waits for its own echo.
+    The ack log is opened AFTER the payload, so payloads that 'scof' into
+    their own log files (scans, position dumps) are unaffected.
+    Returns True if the game acknowledged the batch.
+    """
+    game_path = batch["game_path"]
+    seq = batch["seq"]
+    batch_name = f"{BATCH_FILE_PREFIX}{seq}"
+    ack_name = f"{ACK_FILE_PREFIX}{seq}"
+    ack_path = os.path.join(game_path, ack_name)
+    _remove_quietly(ack_path)
+    
+    lines = list(batch["cmds"])
+    lines.append(f"scof {ack_name}") # Start Ack Log
+    lines.append("player.GetLevel")  # The Echo
+    lines.append("scof 0")           # End Log
+    
+    if not run_console_command(game_path, "\n".join(lines), batch["ahk_path"], batch_name, ack_path):
+        return False
+        
+    acked = _await_sentinel(os.path.normpath(ack_path), batch["timeout"], HANDSHAKE_SENTINEL) is not None
+    
+    _remove_quietly(os.path.join(game_path, batch_name + ".txt"))
+    _remove_quietly(ack_path)
+    return acked
 
-def _queue_worker_loop(game_path):
+# ----------------------------------------------------------------------
+# COALESCING
+# ----------------------------------------------------------------------
+# Within a run of additem/modav lines, repeated commands collapse into one:
+#   player.additem X 1 + player.additem X 2  ->  player.additem X 3
+#   player.modav luck 2 + player.modav luck -2  ->  (dropped)
+# A line that merged with nothing is sent exactly as written (even an amount
+# of 0 or a negative one); only merged lines that net to zero are dropped.
+# Any other command ends the run, so ordering against teleports, removals and
+# scans is preserved. Only the newest position dump survives (same log file).
+
+_ADDITEM_RE = re.compile(r"^player\.additem\s+(\S+)\s+(-?\d+)\s*$", re.IGNORECASE)
+_MODAV_RE = re.compile(r"^player\.modav\s+(\S+)\s+(-?\d+(?:\.\d+)?)\s*$", re.IGNORECASE)
+
+def _is_position_dump(cmd):
+    return cmd.lower().startswith(f"scof {POS_LOG_BASE}".lower())
+
+def _flush_run(run, out):
+    for kind, key, amount, count, first_cmd in run.values():
+        if count == 1:
+            out.append(first_cmd)
+        elif amount == 0:
+            continue
+        elif kind == "additem":
+            out.append(f"player.additem {key} {amount}")
+        else:
+            amount = int(amount) if float(amount).is_integer() else round(amount, 4)
+            out.append(f"player.modav {key} {amount}")
+    run.clear()
+
+def _add_to_run(run, kind, key, amount, cmd):
+    entry = run.setdefault((kind, key), [kind, key, 0, 0, cmd])
+    entry[2] += amount
+    entry[3] += 1
+
+def coalesce_commands(cmd_lists):
     """
-    Background thread that processes the command queue sequentially.
-    Ensures 'Rapid Fire' commands don't overwrite the batch file before AHK reads it.
+    Merges several batches' command lists into one list of console lines.
+    """
+    # Drop superseded position dumps (keep the newest)
+    last_dump = max((i for i, cmds in enumerate(cmd_lists) for c in cmds if _is_position_dump(c)), default=-1)
+    
+    out = []
+    run = {} # (kind, key) -> [kind, key, amount, count, first_cmd], insertion ordered
+    
+    for i, cmds in enumerate(cmd_lists):
+        for cmd in cmds:
+            if _is_position_dump(cmd) and i != last_dump:
+                continue
+                
+            # Multi-line blocks (e.g. position dumps) are barriers as a whole
+            if "\n" not in cmd:
+                m = _ADDITEM_RE.match(cmd.strip())
+                if m:
+                    _add_to_run(run, "additem", m.group(1).upper(), int(m.group(2)), cmd)
+                    continue
+                m = _MODAV_RE.match(cmd.strip())
+                if m:
+                    _add_to_run(run, "modav", m.group(1).lower(), float(m.group(2)), cmd)
+                    continue
+                    
+            _flush_run(run, out)
+            out.append(cmd)
+            
+    _flush_run(run, out)
+    return out
+
+def _take_batch_group():
+    """
+    Pops the next batch plus compatible batches queued behind it.
+    Caller holds _QUEUE_LOCK.
+    """
+    group = [_COMMAND_QUEUE.popleft()]
+    if not COALESCE_ENABLED:
+        return group
+        
+    first = group[0]
+    while _COMMAND_QUEUE and len(group) < COALESCE_MAX_BATCHES:
+        nxt = _COMMAND_QUEUE[0]
+        if nxt["game_path"] != first["game_path"] or nxt["ahk_path"] != first["ahk_path"]:
+            break
+        group.append(_COMMAND_QUEUE.popleft())
+    return group
+
+def get_transport_stats():
+    """Counters for submitted batches vs. actual AHK launches this session."""
+    with _QUEUE_LOCK:
+        return dict(_TRANSPORT_STATS)
+
+def _queue_worker_loop():
+    """
+    Background thread that launches queued batches in order.
+    Batches waiting behind a running launch are coalesced into the next one.
+    Exits when the queue is empty (restarted by the next submit).
     """
     global _WORKER_THREAD
     
     while True:
-        batch_to_run = None
-        
+        if COALESCE_ENABLED:
+            time.sleep(COALESCE_WINDOW)
+            
         with _QUEUE_LOCK:
-            if _COMMAND_QUEUE:
-                batch_to_run = _COMMAND_QUEUE.popleft()
-            else:
-                # Queue empty, exit thread
+            if not _COMMAND_QUEUE or _SHUTDOWN_FLAG:
                 _WORKER_THREAD = None
                 return
+            group = _take_batch_group()
 
-        if batch_to_run:
-            cmds, ahk_path = batch_to_run
-            run_console_command(game_path, "\n".join(cmds), ahk_path)
-            # Critical Wait: Allow AHK time to type commands into console
-            time.sleep(BATCH_WRITE_COOLDOWN)
-
-def _start_queue_worker_if_needed(game_path):
+        group = [b for b in group if b["future"].set_running_or_notify_cancel()]
+        if not group:
+            continue
+            
+        batch = dict(group[0])
+        if COALESCE_ENABLED:
+            batch["cmds"] = coalesce_commands([b["cmds"] for b in group])
+            batch["timeout"] = max(b["timeout"] for b in group)
+        
+        with _QUEUE_LOCK:
+            _TRANSPORT_STATS["launches"] += 1
+            _TRANSPORT_STATS["commands_in"] += sum(len(b["cmds"]) for b in group)
+            _TRANSPORT_STATS["commands_out"] += len(batch["cmds"])
+            
+        try:
+            acked = _run_batch(batch)
+        except Exception as e:
+            print(f"[Bridge] Batch {batch['seq']} Error: {e}")
+            acked = False
+        for b in group:
+            b["future"].set_result(acked)
+        
+        if acked:
+            # Let AHK close the console before the next launch restarts it
+            # (the persistent helper only replies once the console is closed)
+            if not ahk_helper.is_running():
+                time.sleep(AHK_EXIT_GRACE)
+        else:
+            print(f"[Bridge] Batch {batch['seq']} not acknowledged within {batch['timeout']}s.")
+
+def _start_queue_worker_if_needed():
     global _WORKER_THREAD
     with _QUEUE_LOCK:
         if _WORKER_THREAD is None or not _WORKER_THREAD.is_alive():
-            _WORKER_THREAD = threading.Thread(target=_queue_worker_loop, args=(game_path,), daemon=True)
+            _WORKER_THREAD = threading.Thread(target=_queue_worker_loop, daemon=True)
             _WORKER_THREAD.start()
 
+def submit_batch(game_path, cmds, ahk_path=None, timeout=ACK_TIMEOUT):
+    """
+    Queues a batch and returns a concurrent.futures.Future.
+    The future resolves True once the game echoes this batch's ack,
+    False on timeout / launch failure. Never blocks the caller.
+    """
+    future = concurrent.futures.Future()
+    if not cmds:
+        future.set_result(True)
+        return future
+    if not game_path:
+        future.set_result(False)
+        return future
+        
+    batch = {
+        "seq": next(_SEQUENCE),
+        "game_path": game_path,
+        "cmds": list(cmds),
+        "ahk_path": ahk_path,
+        "timeout": timeout,
+        "future": future
+    }
+    with _QUEUE_LOCK:
+        _COMMAND_QUEUE.append(batch)
+        _TRANSPORT_STATS["batches"] += 1
+    _start_queue_worker_if_needed()
+    return future
+
+def pending_batch_count():
+    with _QUEUE_LOCK:
+        return len(_COMMAND_QUEUE)
+
 # ----------------------------------------------------------------------
 # VERIFIED COMMAND EXECUTION (The Echo Protocol)
 # ----------------------------------------------------------------------
 
+@profiler.timed
 def execute_batch_with_verification(game_path, cmds, ahk_path=None, timeout=8.0):
     """
-    Executes a list of commands and waits for a specific 'echo' from the game.
-    BLOCKS until the background queue is empty to ensure exclusive access.
+    Executes a list of commands and waits for its acknowledgement.
+    Queued in order behind earlier batches (no exclusive drain needed: each
+    batch has its own file and ack). BLOCKS until confirmed or timed out.
     """
     if not game_path or not cmds: return False
     
-    # 1. Drain Queue (Exclusive Mode)
-    # We wait for pending "Fire & Forget" commands to finish to prevent collision.
-    start_wait = time.time()
-    while True:
-        with _QUEUE_LOCK:
-            if not _COMMAND_QUEUE and (_WORKER_THREAD is None or not _WORKER_THREAD.is_alive()):
-                break
-        if (time.time() - start_wait) > 5.0:
-            print("[Bridge] Warning: Queue drain timed out. Forcing verification.")
-            break
-        time.sleep(0.1)
-
-    # 2. Cleanup old handshake file
-    handshake_path = os.path.join(game_path, HANDSHAKE_FILENAME)
-    if os.path.exists(handshake_path):
-        try: os.remove(handshake_path)
-        except: pass
-    
-    # 3. Construct Verified Batch
-    verified_cmds = []
-    verified_cmds.append(f"scof {HANDSHAKE_FILENAME}") # Start Log
-    verified_cmds.extend(cmds)                         # Payload
-    verified_cmds.append("player.GetLevel")            # The Echo
-    verified_cmds.append("scof 0")                     # End Log
-    
-    # 4. Execute Directly (Bypass Queue)
-    run_console_command(game_path, "\n".join(verified_cmds), ahk_path)
-    
-    # 5. Poll for Echo
-    start_time = time.time()
-    
-    while (time.time() - start_time) < timeout:
-        if os.path.exists(handshake_path):
-            try:
-                with open(handshake_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                    if "GetLevel >>" in content or "GetLevel:" in content:
-                        return True
-            except:
-                pass # Locked, retry
-        time.sleep(0.2)
+    future = submit_batch(game_path, cmds, ahk_path, timeout=timeout)
+    try:
+        if future.result(timeout=timeout + QUEUE_WAIT_TIMEOUT):
+            return True
+    except concurrent.futures.TimeoutError:
+        pass
         
     print(f"[Bridge] Verification Timed Out ({timeout}s). Game may be paused or crashed.")
     return False
@@ -227,7 +577,8 @@ def process_game_commands(game_path, cmds, ahk_path=None, verify=False):
     """
     Primary entry point for sending commands.
     verify=False: Queues command for background execution (Thread-Safe).
-    verify=True: Blocks, drains queue, executes immediately, and waits for confirmation.
+    verify=True: Blocks until this batch is acknowledged.
+    Use submit_batch() to get a Future instead.
     """
     if not cmds: return True
     
@@ -239,9 +590,7 @@ def process_game_commands(game_path, cmds, ahk_path=None, verify=False):
         return success
     else:
         # Fire & Forget (UI Clicks, Buying, Selling)
-        with _QUEUE_LOCK:
-            _COMMAND_QUEUE.append((cmds, ahk_path))
-        _start_queue_worker_if_needed(game_path)
+        submit_batch(game_path, cmds, ahk_path)
         return True
 
 def wait_for_ahk():
@@ -252,55 +601,135 @@ def wait_for_ahk():
 # UNIFIED BASELINE SCAN
 # ----------------------------------------------------------------------
 
-def trigger_stat_scan(game_path, ahk_path=None):
-    # Clean up old file
-    fp = os.path.join(game_path, STATS_LOG_FILENAME)
-    if os.path.exists(fp): 
-        try: os.remove(fp)
-        except: pass
-    time.sleep(0.1)
-    
+def _stat_scan_commands():
     # Dump Stats
     cmd_lines = [f"scof {STATS_LOG_BASE}"]
     cmd_lines.append("player.getlevel")
     for stat in STATS_COVERED: 
         cmd_lines.append(f"player.getbaseav {stat}")
     cmd_lines.append("player.showinventory")
+    cmd_lines.append(SCAN_SENTINEL_COMMAND)
     cmd_lines.append("scof 0")
+    return cmd_lines
+
+def trigger_stat_scan(game_path, ahk_path=None):
+    # Clean up old file
+    _remove_quietly(os.path.join(game_path, STATS_LOG_FILENAME))
+    time.sleep(0.1)
     
     # QUEUE this scan to ensure it doesn't overwrite a pending transaction
-    process_game_commands(game_path, cmd_lines, ahk_path, verify=False)
+    process_game_commands(game_path, _stat_scan_commands(), ahk_path, verify=False)
 
 # Alias
 trigger_baseline_scan = trigger_stat_scan
 
-def read_baseline_scan(game_path):
-    if not game_path: return None
-    log_path = os.path.join(game_path, STATS_LOG_FILENAME)
+# ----------------------------------------------------------------------
+# SCAN PARSER (Single Pass)
+# ----------------------------------------------------------------------
+# The unified scan file is read once, line by line, and every line is
+# classified as level / actor value / inventory record. All consumers
+# (hotkey poll, settings, insurance, inventory sync) share one ScanResult,
+# cached against the file's (mtime, size) signature.
+
+_INV_LINE_RE = re.compile(r"^\s*(\d+)\s+-\s+(.+?)\s+\(([0-9A-Fa-f]{8})\)")
+_STATS_SET = frozenset(STATS_COVERED)
+
+_SCAN_CACHE = {"path": None, "signature": None, "result": None}
+_SCAN_CACHE_LOCK = threading.Lock()
+
+class ScanResult:
+    """
+    Parsed unified scan.
+    level: float, stats: {actor_value: float},
+    items: [(qty, name, full_id)] with full_id upper-cased,
+    complete: True once the completion sentinel was seen.
+    """
+    __slots__ = ("level", "stats", "items", "complete")
+
+    def __init__(self):
+        self.level = 1
+        self.stats = {}
+        self.items = []
+        self.complete = False
+
+def parse_scan_stream(lines, sentinel=SCAN_SENTINEL):
+    """
+    Classifies an iterable of console lines (e.g. an open file) in one pass.
+    """
+    result = ScanResult()
+    stats = result.stats
+    items = result.items
     
-    lines = await_file_creation(log_path, timeout=15.0)
-    if not lines: return None
+    for line in lines:
+        if sentinel in line:
+            result.complete = True
+            continue
+        if ">>" in line:
+            left, _, right = line.partition(">>")
+            try:
+                value = float(right.strip())
+            except ValueError:
+                continue
+            if "GetLevel" in left:
+                result.level = value
+            elif "GetBaseActorValue" in left:
+                av = left.replace("GetBaseActorValue:", "").strip().lower()
+                if av in _STATS_SET: stats[av] = value
+            continue
+        
+        match = _INV_LINE_RE.match(line)
+        if match:
+            items.append((int(match.group(1)), match.group(2).strip(), match.group(3).upper()))
+    return result
+
+def _parse_scan_file(path):
+    """
+    Returns the ScanResult for a complete scan file, else None.
+    Served from the cache while the file is unchanged.
+    """
+    sig = _file_signature(path)
+    if sig is None: return None
     
-    result = {"level": 1, "stats": {}}
+    with _SCAN_CACHE_LOCK:
+        if _SCAN_CACHE["path"] == path and _SCAN_CACHE["signature"] == sig:
+            return _SCAN_CACHE["result"]
     
     try:
-        for line in lines:
-            line = line.strip()
-            if "GetLevel >>" in line:
-                m = re.search(r">> ([\d\.]+)", line)
-                if m: result["level"] = float(m.group(1))
-            
-            if "GetBaseActorValue" in line and ">>" in line:
-                parts = line.split(">>")
-                if len(parts) == 2:
-                    val = float(parts[1].strip())
-                    left = parts[0].replace("GetBaseActorValue:", "").strip().lower()
-                    if left in STATS_COVERED:
-                        result["stats"][left] = val
-        return result
-    except Exception as e:
-        print(f"Bridge Read Error (Stats Parse): {e}")
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            result = parse_scan_stream(f)
+    except OSError:
         return None
+    if not result.complete: return None
+    
+    with _SCAN_CACHE_LOCK:
+        _SCAN_CACHE.update(path=path, signature=sig, result=result)
+    return result
+
+def read_scan(game_path, timeout=15.0, blocking=True):
+    """
+    Returns the shared ScanResult for the unified scan file, or None.
+    blocking=False checks once (used by the async API);
+    otherwise waits up to 'timeout' for the completion sentinel.
+    """
+    if not game_path: return None
+    path = os.path.normpath(os.path.join(game_path, STATS_LOG_FILENAME))
+    
+    if not blocking:
+        return _parse_scan_file(path)
+    
+    with profiler.timing("bridge.read_scan (wait)"):
+        result = _await_ready(path, timeout, _parse_scan_file)
+    if result is None:
+        print(f"[Bridge] TIMEOUT! Could not read file: {path}")
+    return result
+
+def read_baseline_scan(game_path, blocking=True):
+    """
+    Parses the unified baseline scan (ScanResult or None).
+    blocking=False checks once and returns None if the scan is not complete yet
+    (used by the async API).
+    """
+    return read_scan(game_path, blocking=blocking)
 
 # ----------------------------------------------------------------------
 # LEGACY REDIRECT
@@ -313,21 +742,27 @@ def trigger_inventory_scan(game_path, ahk_path=None):
 # POSITION TRACKING
 # ----------------------------------------------------------------------
 
+def _position_dump_commands():
+    return [f'scof {POS_LOG_BASE}\nplayer.GetPos X\nplayer.GetPos Y\nplayer.GetPos Z\nplayer.GetAngle Z\n{SCAN_SENTINEL_COMMAND}\nscof 0']
+
 def trigger_position_dump(game_path, ahk_path=None):
-    log_path = os.path.join(game_path, POS_LOG_FILENAME)
-    if os.path.exists(log_path):
-        try: os.remove(log_path)
-        except: pass
+    _remove_quietly(os.path.join(game_path, POS_LOG_FILENAME))
     time.sleep(0.1)
     
-    cmd_text = f'scof {POS_LOG_BASE}\nplayer.GetPos X\nplayer.GetPos Y\nplayer.GetPos Z\nplayer.GetAngle Z\nscof 0'
-    
     # Queue position checks too, to prevent cutting off a raid-start command
-    process_game_commands(game_path, [cmd_text], ahk_path, verify=False)
+    process_game_commands(game_path, _position_dump_commands(), ahk_path, verify=False)
 
-def read_player_position(game_path):
-    log_path = os.path.join(game_path, POS_LOG_FILENAME)
-    lines = await_file_creation(log_path, timeout=5.0)
+def read_player_position(game_path, blocking=True):
+    """
+    Parses the position dump ({x, y, z, angle} or None).
+    blocking=False checks once; otherwise waits up to 5s for the sentinel.
+    """
+    log_path = os.path.normpath(os.path.join(game_path, POS_LOG_FILENAME))
+    if blocking:
+        with profiler.timing("bridge.read_player_position (wait)"):
+            lines = await_file_creation(log_path, timeout=5.0, sentinel=SCAN_SENTINEL)
+    else:
+        lines = _read_if_complete(log_path, SCAN_SENTINEL)
     if not lines: return None
     
     pos_data = {}
@@ -348,4 +783,77 @@ def read_player_position(game_path):
     except Exception as e:
         print(f"Bridge Read Error (Pos): {e}")
         
-    return None
\ No newline at end of file
+    return None
+
+# ----------------------------------------------------------------------
+# ASYNC API (asyncio facade)
+# ----------------------------------------------------------------------
+# Coroutine versions of the blocking calls above, for code running on the
+# Tk-driven event loop (etw_async_loop). They never block: batch acks are
+# awaited through the queue's Futures and log files are re-checked between
+# asyncio.sleep()s, so several waits (scan, buff batch, position) overlap.
+# asyncio itself is imported on first use (it is slow to import at startup).
+
+ASYNC_POLL_INTERVAL = 0.1   # Log file re-check cadence while awaiting
+
+async def wait_batch(future, timeout=ACK_TIMEOUT + QUEUE_WAIT_TIMEOUT):
+    """
+    Awaits a submit_batch() Future. Returns its result, False on timeout.
+    A timeout does not withdraw the batch from the queue.
+    """
+    import asyncio
+    if future is None: return True
+    try:
+        with profiler.timing("bridge.wait_batch (async)"):
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+    except asyncio.TimeoutError:
+        return False
+
+async def run(game_path, cmds, verify=True, ahk_path=None, timeout=ACK_TIMEOUT):
+    """
+    Queues a batch. verify=True resolves once the game acknowledges it
+    (False on timeout); verify=False returns as soon as it is queued.
+    """
+    if not cmds: return True
+    future = submit_batch(game_path, cmds, ahk_path, timeout=timeout)
+    if not verify: return True
+    
+    acked = await wait_batch(future, timeout + QUEUE_WAIT_TIMEOUT)
+    if not acked:
+        print(f"[Bridge] Verification Timed Out ({timeout}s). Game may be paused or crashed.")
+    return acked
+
+async def _await_log(probe, timeout):
+    import asyncio
+    deadline = time.time() + timeout
+    while True:
+        result = probe()
+        if result or time.time() >= deadline: return result
+        await asyncio.sleep(ASYNC_POLL_INTERVAL)
+
+async def scan(game_path, timeout=15.0, ahk_path=None):
+    """
+    Triggers the unified stat/inventory scan and returns its ScanResult
+    (None on timeout).
+    """
+    import asyncio
+    if not game_path: return None
+    _remove_quietly(os.path.join(game_path, STATS_LOG_FILENAME))
+    await asyncio.sleep(0.1)
+    submit_batch(game_path, _stat_scan_commands(), ahk_path)
+    
+    with profiler.timing("bridge.scan (async)"):
+        result = await _await_log(lambda: read_scan(game_path, blocking=False), timeout)
+    if result is None:
+        print(f"[Bridge] TIMEOUT! Scan not completed within {timeout}s.")
+    return result
+
+async def position(game_path, timeout=5.0, ahk_path=None):
+    """Dumps and returns the player's position ({x, y, z, angle} or None)."""
+    import asyncio
+    if not game_path: return None
+    _remove_quietly(os.path.join(game_path, POS_LOG_FILENAME))
+    await asyncio.sleep(0.1)
+    submit_batch(game_path, _position_dump_commands(), ahk_path)
+    with profiler.timing("bridge.position (async)"):
+        return await _await_log(lambda: read_player_position(game_path, blocking=False), timeout)
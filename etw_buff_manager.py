@@ -1,7 +1,6 @@
 import etw_bridge as bridge
 import etw_buffs as buffs
-import etw_config as config
-import etw_io as io
+import etw_save_manager as save_manager
 
 # ----------------------------------------------------------------------
 # STAT MAPPING CONSTANTS
@@ -46,9 +45,10 @@ STAT_MAP = {
 def apply_companion_buffs(save_data):
     """
     Calculates active companion bonuses and applies them via console commands.
+    Returns the bridge Future for the buff batch (None if nothing was sent).
     """
     if save_data.get("buffs_active", False): 
-        return 
+        return None
     
     bonuses = buffs.calculate_companion_bonuses(save_data)
     baseline = save_data.get("baseline", {})
@@ -86,11 +86,13 @@ def apply_companion_buffs(save_data):
     if cmds:
         game_path = save_data.get("game_install_path", "")
         if game_path:
-            bridge.process_game_commands(game_path, cmds)
+            future = bridge.submit_batch(game_path, cmds)
             
             save_data["buffs_active"] = True
             save_data["current_bonuses"] = applied_deltas
-            io.save_json(config.PATHS["save_data"], save_data)
+            save_manager.mark_dirty(save_data)
+            return future
+    return None
 
 # ----------------------------------------------------------------------
 # BUFF REMOVAL
@@ -106,7 +108,7 @@ def remove_companion_buffs(save_data):
     current_bonuses = save_data.get("current_bonuses", {})
     if not current_bonuses: 
         save_data["buffs_active"] = False
-        io.save_json(config.PATHS["save_data"], save_data)
+        save_manager.mark_dirty(save_data)
         return
     
     cmds = []
@@ -119,4 +121,4 @@ def remove_companion_buffs(save_data):
         
     save_data["buffs_active"] = False
     save_data["current_bonuses"] = {}
-    io.save_json(config.PATHS["save_data"], save_data)
\ No newline at end of file
+    save_manager.mark_dirty(save_data)
\ No newline at end of file
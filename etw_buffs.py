@@ -1,6 +1,6 @@
 # Foundation
-import etw_config as config
-import etw_io as io
+import etw_content as registry
+import etw_stations as catalog
 
 # Note: We do NOT import etw_engine here to avoid circular loops.
 # We access save_data directly passed as arguments.
@@ -9,6 +9,23 @@ import etw_io as io
 # CONSTANTS
 # ----------------------------------------------------------------------
 
+# ----------------------------------------------------------------------
+# MODIFIER CACHE
+# ----------------------------------------------------------------------
+# get_player_modifiers / calculate_cumulative_multiplier / untagged
+# calculate_companion_bonuses share one snapshot per save_data.
+# Code that mutates active_buffs, hideout_stations, the active companion or
+# a companion's level/loyalty calls invalidate_modifiers() afterwards.
+# Content edits (hideout/companion JSON) are picked up via registry versions.
+
+_MODIFIER_VERSION = 0
+_MOD_CACHE = {"save": None, "key": None, "snapshot": None}
+
+def invalidate_modifiers():
+    """Marks the cached modifier snapshot stale."""
+    global _MODIFIER_VERSION
+    _MODIFIER_VERSION += 1
+
 # Base buff percentage by companion level (0.02 = 2%)
 COMPANION_BUFF_SCALING = {
     1: 0.02,
@@ -27,6 +44,11 @@ def calculate_companion_bonuses(save_data, task_tags=None, raid_tags=None):
     Returns a dict of multipliers based on the currently active companion's state.
     Includes Level scaling, Loyalty bonuses, and Contextual (Tag) bonuses.
     """
+    if not task_tags and not raid_tags:
+        return dict(_get_snapshot(save_data)["companion"])
+    return _compute_companion_bonuses(save_data, task_tags, raid_tags)
+
+def _compute_companion_bonuses(save_data, task_tags=None, raid_tags=None):
     bonuses = {
         "xp": 1.0, "caps": 1.0, "scrip": 1.0, 
         "loot": 1.0, "damage": 1.0, "defense": 1.0,
@@ -43,8 +65,8 @@ def calculate_companion_bonuses(save_data, task_tags=None, raid_tags=None):
         
     c_data = save_data["companions"][active_id]
     
-    # Load Roster Config via IO/Config (Fixing the crash here)
-    roster = io.load_json(config.PATHS["content_companions"], {})
+    # Load Roster Config via the Content Registry (cached, re-parsed only on edit)
+    roster = registry.get_content("content_companions", {})
     c_def = roster.get(active_id)
     if not c_def: return bonuses
     
@@ -92,29 +114,16 @@ def get_hideout_buffs(save_data):
     mods = {"xp_mult": 0.0, "caps_mult": 0.0, "fortune_flat": 0.0}
     
     stations = save_data.get("hideout_stations", {})
-    # Use IO/Config here - This was the line causing the AttributeError
-    content = io.load_json(config.PATHS["content_hideout"])
     
-    for s_conf in content.get("stations", []):
-        s_id = s_conf["id"]
-        
-        if s_conf.get("type") != "passive_buff": continue
-        
-        user_data = stations.get(s_id)
+    for station in catalog.get_passive_buff_stations():
+        user_data = stations.get(station.id)
         if not user_data: continue
         
-        level = user_data.get("level", 0)
-        if level < 1: continue
-        
-        lvl_conf = next((l for l in s_conf["levels"] if l["level"] == level), None)
+        lvl_conf = station.level(user_data.get("level", 0))
         if not lvl_conf: continue
         
-        buff = lvl_conf.get("buff", {})
-        b_type = buff.get("type")
-        b_val = buff.get("value", 0.0)
-        
-        if b_type in mods:
-            mods[b_type] += b_val
+        if lvl_conf.buff_type in mods:
+            mods[lvl_conf.buff_type] += lvl_conf.buff_value
             
     return mods
 
@@ -122,9 +131,19 @@ def get_hideout_buffs(save_data):
 # AGGREGATE CALCULATORS
 # ----------------------------------------------------------------------
 
-def get_player_modifiers(save_data):
+# Consumable buff id -> (modifier key, amount)
+CONSUMABLE_BUFF_EFFECTS = {
+    "xp_boost": ("xp_mult", 0.25),
+    "caps_boost": ("caps_mult", 0.25),
+    "scrip_boost": ("scrip_mult", 0.25),
+    "loot_quantity": ("loot_count_bonus", 1),
+    "fortune_boost": ("effective_fortune", 2.0),
+    "rested_xp": ("xp_mult", 0.25)
+}
+
+def _build_snapshot(save_data):
     """
-    Combines Active Buffs, Hideout Buffs, and Companion Bonuses into a single modifier set.
+    Single pass over buffs, hideout and companion state.
     """
     mods = {
         "xp_mult": 1.0, 
@@ -135,55 +154,55 @@ def get_player_modifiers(save_data):
     }
     
     # Process Consumable Buffs
-    buffs = save_data.get("active_buffs", [])
-    for b in buffs:
-        bid = b.get("id")
-        if bid == "xp_boost": mods["xp_mult"] += 0.25
-        elif bid == "caps_boost": mods["caps_mult"] += 0.25
-        elif bid == "scrip_boost": mods["scrip_mult"] += 0.25
-        elif bid == "loot_quantity": mods["loot_count_bonus"] += 1
-        elif bid == "fortune_boost": mods["effective_fortune"] += 2.0
-        elif bid == "rested_xp": mods["xp_mult"] += 0.25
+    for b in save_data.get("active_buffs", []):
+        effect = CONSUMABLE_BUFF_EFFECTS.get(b.get("id"))
+        if effect: mods[effect[0]] += effect[1]
+    
+    # Per-stat bonus above 1.0 (calculate_cumulative_multiplier)
+    cumulative = {
+        "xp": mods["xp_mult"] - 1.0,
+        "caps": mods["caps_mult"] - 1.0,
+        "scrip": mods["scrip_mult"] - 1.0
+    }
     
     # Hideout Buffs
     h_buffs = get_hideout_buffs(save_data)
     mods["xp_mult"] += h_buffs.get("xp_mult", 0.0)
     mods["caps_mult"] += h_buffs.get("caps_mult", 0.0)
     mods["effective_fortune"] += h_buffs.get("fortune_flat", 0.0)
+    cumulative["xp"] += h_buffs.get("xp_mult", 0.0)
+    cumulative["caps"] += h_buffs.get("caps_mult", 0.0)
     
     # Companion Bonuses
-    c_bonuses = calculate_companion_bonuses(save_data)
+    c_bonuses = _compute_companion_bonuses(save_data)
     mods["xp_mult"] += (c_bonuses["xp"] - 1.0)
     mods["caps_mult"] += (c_bonuses["caps"] - 1.0)
     mods["scrip_mult"] += (c_bonuses["scrip"] - 1.0)
+    for stat, value in c_bonuses.items():
+        cumulative[stat] = cumulative.get(stat, 0.0) + (value - 1.0)
     
-    return mods
+    return {"mods": mods, "cumulative": cumulative, "companion": c_bonuses}
+
+def _get_snapshot(save_data):
+    key = (
+        _MODIFIER_VERSION,
+        save_data.get("fortune", 0.0),
+        registry.get_content_version("content_hideout"),
+        registry.get_content_version("content_companions")
+    )
+    if _MOD_CACHE["save"] is not save_data or _MOD_CACHE["key"] != key:
+        _MOD_CACHE.update(save=save_data, key=key, snapshot=_build_snapshot(save_data))
+    return _MOD_CACHE["snapshot"]
+
+def get_player_modifiers(save_data):
+    """
+    Combines Active Buffs, Hideout Buffs, and Companion Bonuses into a single modifier set.
+    Served from the cached snapshot (see invalidate_modifiers).
+    """
+    return dict(_get_snapshot(save_data)["mods"])
 
 def calculate_cumulative_multiplier(save_data, stat_type):
     """
     Calculates the total bonus percentage for a specific stat.
     """
-    total_bonus = 0.0
-    
-    # Consumables
-    buffs = save_data.get("active_buffs", [])
-    for b in buffs:
-        bid = b.get("id")
-        if stat_type == "xp" and (bid == "xp_boost" or bid == "rested_xp"): 
-            total_bonus += 0.25
-        elif stat_type == "caps" and bid == "caps_boost": 
-            total_bonus += 0.25
-        elif stat_type == "scrip" and bid == "scrip_boost": 
-            total_bonus += 0.25
-    
-    # Hideout
-    h_buffs = get_hideout_buffs(save_data)
-    if stat_type == "xp": total_bonus += h_buffs.get("xp_mult", 0.0)
-    elif stat_type == "caps": total_bonus += h_buffs.get("caps_mult", 0.0)
-    
-    # Companions
-    c_bonuses = calculate_companion_bonuses(save_data)
-    if stat_type in c_bonuses:
-        total_bonus += (c_bonuses[stat_type] - 1.0)
-        
-    return 1.0 + total_bonus
\ No newline at end of file
+    return 1.0 + _get_snapshot(save_data)["cumulative"].get(stat_type, 0.0)
@@ -2,8 +2,8 @@ import random
 import math
 
 # Foundation Modules
-import etw_config as config
-import etw_io as io
+import etw_content as registry
+import etw_buffs as buffs
 
 # Note: engine imported ONLY for types/constants if strictly needed, 
 # but preferably avoided to keep clean architecture.
@@ -55,18 +55,12 @@ DEFAULT_MILESTONES = {
     "diff_cleared_hard": False
 }
 
-# --- CACHING OPTIMIZATION ---
-_ROSTER_CACHE = None
-
 def load_companion_roster():
     """
     Loads the static companion definitions from JSON.
-    Uses caching to prevent redundant disk I/O.
+    Served by the Content Registry to prevent redundant disk I/O.
     """
-    global _ROSTER_CACHE
-    if _ROSTER_CACHE is None:
-        _ROSTER_CACHE = io.load_json(config.PATHS["content_companions"], {})
-    return _ROSTER_CACHE
+    return registry.get_content("content_companions", {})
 
 # ----------------------------------------------------------------------
 # 2. STATE MANAGEMENT
@@ -125,6 +119,7 @@ def set_active_companion(save_data, companion_id):
     if not save_data["companions"][companion_id]["unlocked"]: return False
     
     save_data["global_companion_state"]["active_companion_id"] = companion_id
+    buffs.invalidate_modifiers()
     return True
 
 # ----------------------------------------------------------------------
@@ -207,6 +202,7 @@ def check_milestones(save_data, context):
 
     if updated:
         _update_pending_slots(save_data, len(roster))
+    return updated
 
 def _update_pending_slots(save_data, roster_size):
     """
@@ -350,6 +346,7 @@ def add_companion_xp(save_data, player_xp_amount):
             
     if new_level > c_data["level"]:
         c_data["level"] = new_level
+        buffs.invalidate_modifiers()
         if new_level >= 5 and not c_data["loyalty_unlocked"]:
             c_data["loyalty_unlocked"] = True
             
@@ -389,4 +386,5 @@ def get_loyalty_quest_params(companion_id):
 
 def complete_loyalty(save_data, companion_id):
     if companion_id not in save_data.get("companions", {}): return
-    save_data["companions"][companion_id]["loyalty_completed"] = True
\ No newline at end of file
+    save_data["companions"][companion_id]["loyalty_completed"] = True
+    buffs.invalidate_modifiers()
\ No newline at end of file
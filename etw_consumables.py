@@ -1,8 +1,8 @@
 import random
 
 # Foundation Modules
-import etw_config as config
-import etw_io as io
+import etw_save_manager as save_manager
+import etw_buffs as buffs
 
 # ----------------------------------------------------------------------
 # CONSUMABLE ITEM LOGIC
@@ -36,6 +36,7 @@ def use_lunchbox(save_data):
     current_buffs = save_data.get("active_buffs", [])
     current_buffs.append(new_buff)
     save_data["active_buffs"] = current_buffs
+    buffs.invalidate_modifiers()
     
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     return {"success": True, "message": f"Opened: {new_buff['name']}", "buff_name": new_buff['name']}
\ No newline at end of file
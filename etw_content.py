@@ -0,0 +1,99 @@
+import os
+import threading
+
+# Foundation Modules
+import etw_config as config
+import etw_io as io
+
+# ----------------------------------------------------------------------
+# CONTENT REGISTRY
+# ----------------------------------------------------------------------
+# Central cache for the static JSON content listed in config.PATHS.
+# Each file is parsed once and only re-parsed when its mtime/size changes,
+# so hot paths pay a single os.stat() per lookup instead of a full parse.
+#
+# IMPORTANT: Returned objects are SHARED between all callers.
+# Treat them as read-only. Use copy.deepcopy() before mutating or before
+# storing pieces of content inside save_data.
+
+# Keys that are mutable state or non-JSON, never cached here.
+EXCLUDED_KEYS = ("save_data", "ahk_script", "version_log")
+
+_CACHE = {}           # path -> {"sig": (mtime_ns, size), "data": obj, "version": int}
+_CACHE_LOCK = threading.Lock()
+_MISSING = object()
+
+def get_content_keys():
+    """
+    Returns every config.PATHS key managed by the registry.
+    """
+    return [k for k, p in config.PATHS.items() if k not in EXCLUDED_KEYS and p.endswith(".json")]
+
+def _resolve_path(key):
+    return config.PATHS.get(key, key)
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+# ----------------------------------------------------------------------
+# PUBLIC API
+# ----------------------------------------------------------------------
+
+def get_content(key, default=None):
+    """
+    Returns the parsed content for a config.PATHS key (or a raw path).
+    Re-parses only if the file changed on disk since the last load.
+    Returns 'default' if the file is missing or corrupt.
+    """
+    if default is None:
+        default = {}
+
+    path = _resolve_path(key)
+    sig = _file_signature(path)
+    if sig is None:
+        return default
+
+    with _CACHE_LOCK:
+        entry = _CACHE.get(path)
+        if entry and entry["sig"] == sig:
+            data = entry["data"]
+            return default if data is _MISSING else data
+
+        data = io.load_json(path, _MISSING)
+        version = entry["version"] + 1 if entry else 1
+        _CACHE[path] = {"sig": sig, "data": data, "version": version}
+
+    return default if data is _MISSING else data
+
+def get_content_version(key):
+    """
+    Returns a counter that increments every time the file is re-parsed.
+    Derived caches (loot index, station catalog) compare it to detect edits.
+    """
+    get_content(key)
+    entry = _CACHE.get(_resolve_path(key))
+    return entry["version"] if entry else 0
+
+def reload_content(key=None):
+    """
+    Hot-reload hook for content authors.
+    Drops one entry (or the whole cache) so the next lookup re-parses from disk.
+    Versions keep counting up so derived caches still see the change.
+    """
+    with _CACHE_LOCK:
+        paths = [_resolve_path(key)] if key else list(_CACHE.keys())
+        for path in paths:
+            entry = _CACHE.get(path)
+            if entry:
+                entry["sig"] = None
+
+def preload_all_content():
+    """
+    Parses every registered content file up front (e.g. during startup).
+    """
+    for key in get_content_keys():
+        get_content(key)
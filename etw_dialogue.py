@@ -1,17 +1,11 @@
-import etw_io as io
-import etw_config as config
+import etw_content as registry
 
 # ----------------------------------------------------------------------
 # DIALOGUE MANAGER
 # ----------------------------------------------------------------------
 
-_NPC_CACHE = None
-
 def _load_npc_data():
-    global _NPC_CACHE
-    if _NPC_CACHE is None:
-        _NPC_CACHE = io.load_json(config.PATHS["content_npcs"], {})
-    return _NPC_CACHE
+    return registry.get_content("content_npcs", {})
 
 def get_intro_text():
     data = _load_npc_data()
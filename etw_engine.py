@@ -5,6 +5,8 @@ import time
 # Foundation Modules (The New Base)
 import etw_config as config
 import etw_io as io
+import etw_save_manager as save_manager
+import etw_content as registry
 
 # Sub-Systems
 import etw_bridge as bridge
@@ -21,26 +23,26 @@ import etw_consumables
 # --------------------------
 # 1. Config & Pre-Load
 # --------------------------
-_TUNING = io.load_json(config.PATHS["config_tuning"])
-_RAIDS = io.load_json(config.PATHS["content_raids"]) 
+_TUNING = registry.get_content("config_tuning")
+_RAIDS = registry.get_content("content_raids")
 
 DIFFICULTY_SETTINGS = _TUNING.get("difficulty_settings", {})
 RAID_MODIFIERS = _RAIDS.get("raid_modifiers", {})
 RARITY_TUNING = _TUNING.get("rarity_tuning", {})
 CATEGORY_TUNING = _TUNING.get("category_tuning", {})
 
-def load_main_quests(): return io.load_json(config.PATHS["main_quests"], [])
-def load_side_quests(): return io.load_json(config.PATHS["side_quests"])
-def load_shop_items(): return io.load_json(config.PATHS["shop_items"])
-def load_character_themes(): return io.load_json(config.PATHS["character_themes"], [])
-def load_starter_loadouts(): return io.load_json(config.PATHS["starter_loadouts"])
-def load_blueprints(): return io.load_json(config.PATHS["blueprints"], {}) # NEW
+def load_main_quests(): return registry.get_content("main_quests", [])
+def load_side_quests(): return registry.get_content("side_quests")
+def load_shop_items(): return registry.get_content("shop_items")
+def load_character_themes(): return registry.get_content("character_themes", [])
+def load_starter_loadouts(): return registry.get_content("starter_loadouts")
+def load_blueprints(): return registry.get_content("blueprints", {}) # NEW
 
 # --------------------------
 # 2. Bridge Aliases
 # --------------------------
 def _process_game_commands(cmds):
-    data = load_save_data()
+    data = save_manager.get_live_data() or load_save_data()
     path = data.get("game_install_path", "")
     if path:
         bridge.process_game_commands(path, cmds)
@@ -53,8 +55,11 @@ def trigger_baseline_scan(save_data):
 # --------------------------
 # 3. Save Data Management
 # --------------------------
-def load_save_data():
-    default = {
+def get_default_save_data():
+    """
+    Fresh-character save layout. Also used as the key backfill on load.
+    """
+    return {
         "game_install_path": "", 
         "scrip": 0,
         "components": 0, # NEW: Meta-Currency for Crafting
@@ -106,9 +111,19 @@ def load_save_data():
         "homepoint": "Megaton", 
         "insured_items": []     
     }
+
+def load_save_data(flush_pending=True):
+    default = get_default_save_data()
     
+    # Pending coalesced writes must land before we read back
+    # (flush_pending=False after a reset: they belong to the deleted save)
+    if flush_pending: save_manager.flush()
     data = io.load_json(config.PATHS["save_data"], default)
     
+    # Re-apply journal records written after the last compaction (crash recovery)
+    if save_manager.replay_journal(data) > 0:
+        save_manager.mark_dirty(data)
+    
     for k, v in default.items():
         if k not in data: data[k] = v
         
@@ -119,7 +134,7 @@ def load_save_data():
     
     # NEW: Force Raid Modifier Init
     if not data.get("current_raid_modifier"):
-        conf = io.load_json(config.PATHS["content_raids"])
+        conf = registry.get_content("content_raids")
         mods = list(conf.get("raid_modifiers", {}).keys())
         if mods:
             new_mod = random.choice(mods)
@@ -130,7 +145,7 @@ def load_save_data():
     return data
 
 def save_save_data(data): 
-    io.save_json(config.PATHS["save_data"], data)
+    save_manager.mark_dirty(data)
 
 # --------------------------
 # 4. Global State Logic
@@ -140,7 +155,7 @@ def advance_game_cycle(save_data):
     cycle = save_data.get("day_cycle", 0) + 1
     save_data["day_cycle"] = cycle
     
-    conf = io.load_json(config.PATHS["content_raids"])
+    conf = registry.get_content("content_raids")
     mods = list(conf.get("raid_modifiers", {}).keys())
     if mods:
         new_mod = random.choice(mods)
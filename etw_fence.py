@@ -2,6 +2,7 @@ import json
 import os
 import random
 import math
+import etw_profiler as profiler
 import etw_engine as engine
 import etw_stats as stats # NEW: Required for reputation calculation
 import etw_loot as loot_logic # NEW: Required for loot pool access
@@ -74,6 +75,7 @@ def save_fence_shop(data):
 # ----------------------------------------------------------------------
 # CORE GENERATION LOGIC
 # ----------------------------------------------------------------------
+@profiler.timed
 def refresh_shop(save_data):
     """
     Main entry point to refresh inventory.
@@ -142,18 +144,21 @@ def _get_rep_band_key(rep):
     if rep <= 8: return "6-8"
     return "9-10"
 
+# Alias tables: the weights only depend on the mode / rep band, so build them once.
+_CATEGORY_SAMPLERS = {
+    "buy": loot_logic.AliasSampler(BUY_SLOT_WEIGHTS.keys(), BUY_SLOT_WEIGHTS.values()),
+    "sell": loot_logic.AliasSampler(SELL_SLOT_WEIGHTS.keys(), SELL_SLOT_WEIGHTS.values())
+}
+_RARITY_SAMPLERS = {
+    band: loot_logic.AliasSampler(table.keys(), table.values())
+    for band, table in REP_RARITY_TABLE.items()
+}
+
 def _roll_category(mode):
-    weights = BUY_SLOT_WEIGHTS if mode == "buy" else SELL_SLOT_WEIGHTS
-    cats = list(weights.keys())
-    vals = list(weights.values())
-    return random.choices(cats, weights=vals, k=1)[0]
+    return _CATEGORY_SAMPLERS["buy" if mode == "buy" else "sell"].sample()
 
 def _roll_rarity(rep):
-    band = _get_rep_band_key(rep)
-    table = REP_RARITY_TABLE[band]
-    tiers = list(table.keys())
-    probs = list(table.values())
-    return random.choices(tiers, weights=probs, k=1)[0]
+    return _RARITY_SAMPLERS[_get_rep_band_key(rep)].sample()
 
 def _roll_single_item(rep, mode):
     """
@@ -172,8 +177,8 @@ def _roll_single_item(rep, mode):
     # but some json files might use plural. We rely on the 'category' field in JSON.
     candidates = pool_data["by_category"].get(category, [])
     
-    # Filter by Rarity
-    tier_candidates = [i for i in candidates if i.get("rarity") == rarity]
+    # Filter by Rarity (precomputed composite index)
+    tier_candidates = pool_data["by_cat_rarity"].get((category, rarity), [])
     
     # Fallback logic if tier is empty for that category
     if not tier_candidates:
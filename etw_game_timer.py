@@ -15,7 +15,7 @@ SPICY_LIMIT_TIME = 900 # 15 Minutes
 
 def process_game_tick(save_data):
     """
-    Called every second by the main UI loop.
+    Called by the main UI loop at each next_event_delay deadline.
     Calculates game state updates based on elapsed raid time.
     Returns a status dictionary for the UI to render.
     """
@@ -103,4 +103,29 @@ def process_game_tick(save_data):
     if status["fail_state"] is None:
         status["fail_state"] = "DIED"
 
-    return status
\ No newline at end of file
+    return status
+
+# ----------------------------------------------------------------------
+# NEXT EVENT (Scheduler Deadline)
+# ----------------------------------------------------------------------
+TICK_SLACK = 0.01 # Land just past a boundary so int() has already rolled over
+
+def next_event_delay(save_data, status):
+    """
+    Seconds until the next tick that can change what the raid HUD shows,
+    given the status just returned by process_game_tick.
+    Returns None when nothing will change on its own (town, paused).
+    """
+    if not status["is_active"] or status["is_paused"]:
+        return None
+
+    elapsed = status["elapsed_seconds"]
+    # Clock, SOS and spicy countdowns are all whole-second displays of elapsed.
+    deadlines = [1.0 - (elapsed % 1.0)]
+    for limit in (SOS_UNLOCK_TIME, SPICY_LIMIT_TIME):
+        if limit > elapsed:
+            deadlines.append(limit - elapsed)
+    wait_ambush = ambush.seconds_until_next_ambush(save_data, elapsed)
+    if wait_ambush:
+        deadlines.append(wait_ambush)
+    return min(deadlines) + TICK_SLACK
\ No newline at end of file
@@ -0,0 +1,127 @@
+import os
+import sys
+import time
+import socket
+
+# ----------------------------------------------------------------------
+# STUB HELPER (Linux / Testing)
+# ----------------------------------------------------------------------
+# Speaks the etw_ahk_helper protocol but, instead of typing into Fallout 3,
+# "executes" each batch file itself with a tiny fake console:
+#   scof <file> / scof 0     -> opens / closes a log in the game directory
+#   player.GetLevel          -> "GetLevel >> 1.00"
+#   player.getbaseav <av>    -> "GetBaseActorValue: <av> >> 50.00"
+#   player.GetPos <axis>     -> "GetPos: <axis> >> 0.00"
+#   player.GetAngle Z        -> "GetAngle: Z >> 0.00"
+#   player.GetItemCount <id> -> "GetItemCount >> 0.00"
+# Every other command is appended to etw_helper_stub.log.
+#
+#   python etw_helper_stub.py <in_file> <out_file>   (file transport)
+#   python etw_helper_stub.py <port>                 (socket transport)
+
+POLL_INTERVAL = 0.02
+FAKE_LEVEL = 1.0
+FAKE_AV = 50.0
+
+def _echo(cmd):
+    """Returns the console echo for a command, or None if it prints nothing."""
+    parts = cmd.split()
+    if not parts: return None
+    verb = parts[0].lower()
+    arg = parts[1] if len(parts) > 1 else ""
+
+    if verb == "player.getlevel": return f"GetLevel >> {FAKE_LEVEL:.2f}"
+    if verb == "player.getbaseav": return f"GetBaseActorValue: {arg} >> {FAKE_AV:.2f}"
+    if verb == "player.getpos": return f"GetPos: {arg.upper()} >> 0.00"
+    if verb == "player.getangle": return f"GetAngle: {arg.upper()} >> 0.00"
+    if verb == "player.getitemcount": return "GetItemCount >> 0.00"
+    return None
+
+def execute_batch(game_path, batch_stem):
+    """Runs <game_path>/<batch_stem>.txt through the fake console."""
+    batch_path = os.path.join(game_path, batch_stem + ".txt")
+    with open(batch_path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+
+    log = None
+    unhandled = []
+    try:
+        for cmd in lines:
+            cmd = cmd.strip()
+            if not cmd: continue
+            if cmd.lower().startswith("scof "):
+                if log: log.close(); log = None
+                target = cmd.split(None, 1)[1]
+                if target != "0":
+                    log = open(os.path.join(game_path, target), "w", encoding="utf-8")
+                continue
+
+            echo = _echo(cmd)
+            if echo is None:
+                unhandled.append(cmd)
+            elif log:
+                log.write(echo + "\n")
+    finally:
+        if log: log.close()
+
+    if unhandled:
+        with open(os.path.join(game_path, "etw_helper_stub.log"), "a", encoding="utf-8") as f:
+            f.write("\n".join(unhandled) + "\n")
+
+def _handle(line, reply):
+    """Processes one request line. Returns False on QUIT."""
+    parts = line.rstrip("\r\n").split("\t")
+    if parts[0] == "QUIT":
+        return False
+    if parts[0] == "RUN" and len(parts) >= 4:
+        seq, game_path, stem = parts[1], parts[2], parts[3]
+        try:
+            execute_batch(game_path, stem)
+            reply(f"TYPED\t{seq}")
+        except Exception as e:
+            reply(f"FAIL\t{seq}\t{e}")
+    return True
+
+def serve_file(in_path, out_path):
+    def reply(line):
+        with open(out_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    reply("READY")
+    offset = 0
+    pending = ""
+    while True:
+        try:
+            with open(in_path, "r", encoding="utf-8") as f:
+                f.seek(offset)
+                pending += f.read()
+                offset = f.tell()
+        except OSError:
+            return
+        while "\n" in pending:
+            line, pending = pending.split("\n", 1)
+            if not _handle(line, reply): return
+        time.sleep(POLL_INTERVAL)
+
+def serve_socket(port):
+    conn = socket.create_connection(("127.0.0.1", port))
+    reply = lambda line: conn.sendall((line + "\n").encode("utf-8"))
+
+    reply("READY")
+    pending = b""
+    while True:
+        chunk = conn.recv(4096)
+        if not chunk: return
+        pending += chunk
+        while b"\n" in pending:
+            line, pending = pending.split(b"\n", 1)
+            if not _handle(line.decode("utf-8", "ignore"), reply): return
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        serve_file(sys.argv[1], sys.argv[2])
+    elif len(sys.argv) == 2:
+        serve_socket(int(sys.argv[1]))
+    else:
+        print("usage: etw_helper_stub.py <in_file> <out_file> | <port>")
+        sys.exit(2)
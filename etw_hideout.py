@@ -1,9 +1,10 @@
 import random
-import math
 
 # Foundation
-import etw_config as config
-import etw_io as io
+import etw_profiler as profiler
+import etw_save_manager as save_manager
+import etw_content as registry
+import etw_stations as catalog
 
 # Sub-Systems
 import etw_engine as engine 
@@ -19,13 +20,11 @@ def generate_station_costs(save_data):
     # Ensure cache is loaded
     loot.get_loot_pool_cached()
     
-    content = io.load_json(config.PATHS["content_hideout"])
-    stations_config = content.get("stations", [])
-    
     all_stations_costs = {}
     
-    for s_conf in stations_config:
-        s_id = s_conf["id"]
+    for station in catalog.get_catalog().values():
+        s_conf = station.raw
+        s_id = station.id
         station_levels = {}
         
         cost_theme_tags = []
@@ -56,14 +55,15 @@ def generate_station_costs(save_data):
                 if level >= 3: target_rarity = "tier_2"
                 if level == 5: target_rarity = "tier_3"
                 
-                pool = loot.get_loot_pool_cached()["all"]
+                pool = loot.get_loot_pool_cached()
                 
-                candidates = [i for i in pool if tag in i.get("tags", []) or i.get("tag") == tag or i.get("category") == tag]
+                # Tag OR Category match (pool order, each item once)
+                candidates = pool["by_tag_or_category"].get(tag, [])
                 tier_candidates = [i for i in candidates if i.get("rarity") == target_rarity]
                 
                 final_pool = tier_candidates if tier_candidates else candidates
                 if not final_pool: 
-                    final_pool = [i for i in pool if i.get("rarity") == "tier_1"]
+                    final_pool = [i for i in pool["all"] if i.get("rarity") == "tier_1"]
                 
                 if final_pool:
                     item = random.choice(final_pool)
@@ -85,112 +85,100 @@ def generate_station_costs(save_data):
         all_stations_costs[s_id] = station_levels
         
     save_data["generated_station_costs"] = all_stations_costs
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     return all_stations_costs
 
-def update_hideout_timers(save_data, elapsed_minutes):
+# ----------------------------------------------------------------------
+# PRODUCTION TIMERS (Closed Form)
+# ----------------------------------------------------------------------
+# Hideout time is measured in minutes of raid time. Catch-up is O(1) per
+# station/slot regardless of how many minutes elapsed:
+#   passive: units = floor(progress / rate), clamped to storage capacity
+#   active:  a slot finishes at most once per update, then goes idle
+
+def _advance_passive(storage, progress, cap, rate, minutes):
     """
-    Advances progress for ALL stations (Passive & Active).
+    Returns (storage, progress) after 'minutes' of passive production.
+    Full storage halts the timer; reaching capacity resets progress.
     """
-    stations = save_data.get("hideout_stations", {})
-    content = io.load_json(config.PATHS["content_hideout"])
-    config_map = {s["id"]: s for s in content.get("stations", [])}
+    if storage >= cap: return storage, progress
+    progress += minutes
+    if progress < rate: return storage, progress
+    if rate <= 0: return cap, 0.0
+    
+    units, progress = divmod(progress, rate)
+    storage += int(units)
+    if storage >= cap: return cap, 0.0
+    return storage, progress
+
+def _advance_stations(stations, elapsed_minutes):
+    """
+    Advances progress for the given hideout_stations dict in place.
+    """
+    station_map = catalog.get_catalog()
     
     for s_id, data in stations.items():
         level = data.get("level", 0)
         if level < 1: continue
         
-        s_conf = config_map.get(s_id)
-        if not s_conf: continue
+        station = station_map.get(s_id)
+        if not station: continue
         
-        lvl_conf = next((l for l in s_conf["levels"] if l["level"] == level), None)
+        lvl_conf = station.level(level)
         if not lvl_conf: continue
         
         # TYPE 1: PASSIVE PRODUCTION
-        if s_conf.get("type") == "passive_production":
+        if station.type == "passive_production":
             storage = data.get("storage", 0)
-            cap = math.ceil(level / 2.0)
-            
-            if storage >= cap: continue 
-            
-            rate = lvl_conf.get("production_rate", 60)
-            progress = data.get("progress", 0.0)
-            progress += elapsed_minutes
+            if storage >= lvl_conf.capacity: continue
             
-            while progress >= rate:
-                if storage < cap:
-                    storage += 1
-                    progress -= rate
-                    data["storage"] = storage
-                    if storage >= cap:
-                        progress = 0.0 
-                        break
-                else:
-                    progress = 0.0
-                    break
-            data["progress"] = progress
+            new_storage, data["progress"] = _advance_passive(
+                storage, data.get("progress", 0.0), lvl_conf.capacity,
+                lvl_conf.production_rate, elapsed_minutes)
+            if new_storage != storage:
+                data["storage"] = new_storage
 
         # TYPE 2: ACTIVE CRAFTING (Generic + Workbench)
-        elif s_conf.get("type") == "active_crafting":
+        elif station.type == "active_crafting":
             if "active_slots" not in data: data["active_slots"] = []
             
-            cap = math.ceil(level / 2.0)
+            cap = lvl_conf.capacity
             storage = data.get("storage", 0)
+            # Standardize rate: every slot uses the station speed
+            req_time = lvl_conf.production_rate
             
-            slots = data.get("active_slots", [])
-            
-            for slot in slots:
+            for slot in data["active_slots"]:
                 if not slot or not slot.get("code"): continue
                 if storage >= cap: break 
                 
-                # Standardize rate: Check if slot has specific time override (e.g. huge craft)
-                # For now, use station speed
-                req_time = lvl_conf.get("production_rate", 60)
                 slot["progress"] += elapsed_minutes
+                if slot["progress"] < req_time: continue
                 
-                while slot["progress"] >= req_time:
-                    if storage < cap:
-                        if "finished_items" not in data: data["finished_items"] = []
-                        
-                        # Store the result type (item vs currency)
-                        data["finished_items"].append({
-                            "code": slot["code"],
-                            "name": slot["name"],
-                            "base_qty": slot.get("base_qty", 1),
-                            "result_type": slot.get("result_type", "item") # Default to item
-                        })
-                        
-                        storage += 1
-                        data["storage"] = storage
-                        
-                        # Clear slot logic: set to None/Empty dict? 
-                        # Logic below relied on overwriting.
-                        # We need to clear THIS specific slot instance in the list?
-                        # The update logic for slots is complex if we modify list while iterating.
-                        # BUT here we are just calculating "did it finish?".
-                        # If finished, we effectively 'consume' the job time.
-                        
-                        # FIX: We need to MARK it as done or remove it?
-                        # The UI typically displays slots. If a slot finishes, it becomes empty.
-                        # But we are inside a loop over 'slots'.
-                        # The previous logic was: "slot['progress'] = 0.0" if blocked, or "break" if done?
-                        # Actually, previous logic was missing the "Remove from active_slots" step.
-                        # It seemed to assume the slot stays "Busy" until collected?
-                        # No, the previous code had `slot["progress"] -= req_time` if looping?
-                        # Wait, if it finishes, it moves to 'finished_items' storage.
-                        # So the SLOT should become free immediately.
-                        
-                        # Let's clear the slot data in place
-                        slot.clear() # Empties the dict, making it "Idle"
-                        slot["progress"] = 0.0 # Reset just in case
-                        
-                        # Since slot is now empty, we stop processing THIS slot's time
-                        break 
-                    else:
-                        slot["progress"] = req_time # Cap at max if storage full
-                        break
+                # Finished: move the result to storage and free the slot
+                if "finished_items" not in data: data["finished_items"] = []
+                data["finished_items"].append({
+                    "code": slot["code"],
+                    "name": slot["name"],
+                    "base_qty": slot.get("base_qty", 1),
+                    "result_type": slot.get("result_type", "item") # Default to item
+                })
+                
+                storage += 1
+                data["storage"] = storage
+                
+                slot.clear() # Empties the dict, making it "Idle"
+                slot["progress"] = 0.0
+
+@profiler.timed
+def update_hideout_timers(save_data, elapsed_minutes):
+    """
+    Advances progress for ALL stations (Passive & Active).
+    """
+    stations = save_data.get("hideout_stations", {})
+    _advance_stations(stations, elapsed_minutes)
 
-    io.save_json(config.PATHS["save_data"], save_data)
+    # Journal per-station progress instead of rewriting the whole save
+    save_manager.journal_changes(save_data, *[("hideout_stations", s_id) for s_id in stations])
 
 # ----------------------------------------------------------------------
 # JOB INITIATORS
@@ -218,16 +206,19 @@ def start_crafting_job(save_data, station_id, recipe_code, recipe_name, base_qty
     """
     return _start_job_internal(save_data, station_id, recipe_code, recipe_name, base_qty, "item")
 
-def start_dismantle_job(save_data, station_id, item_code, item_name, yield_amount):
+def start_dismantle_job(save_data, station_id, item_code, item_name, yield_amount, item_removed=False):
     """
     Starts a job that converts an item into Components (Currency).
+    item_removed=True: the caller already removed the item in-game (the UI
+    does that on the worker pool, see App.remove_game_items).
     """
     # 1. Verify & Remove Item
-    req_item = {"code": item_code, "qty": 1, "name": item_name}
-    result = inventory.verify_and_remove_items(save_data, [req_item])
-    
-    if not result["success"]:
-        return False, f"Missing: {item_name}"
+    if not item_removed:
+        req_item = {"code": item_code, "qty": 1, "name": item_name}
+        result = inventory.verify_and_remove_items(save_data, [req_item])
+        
+        if not result["success"]:
+            return False, f"Missing: {item_name}"
         
     # 2. Start Job (Code = "COMPONENTS", Qty = Yield)
     success, msg = _start_job_internal(save_data, station_id, "COMPONENTS", f"Dismantle: {item_name}", yield_amount, "currency")
@@ -253,13 +244,10 @@ def start_blueprint_craft_job(save_data, station_id, blueprint):
         
     # 2. Check Slots BEFORE debiting currency
     # Need to fetch max slots logic
-    content = io.load_json(config.PATHS["content_hideout"])
-    s_conf = next((s for s in content["stations"] if s["id"] == station_id), None)
     stations = save_data.get("hideout_stations", {})
     data = stations.get(station_id, {})
     level = data.get("level", 1)
-    lvl_conf = next((l for l in s_conf["levels"] if l["level"] == level), None)
-    max_slots = lvl_conf.get("slots", 1)
+    max_slots = catalog.get_level(station_id, level).slots
     
     if _get_free_slot_index(save_data, station_id, max_slots) == -1:
         return False, "All slots busy."
@@ -275,10 +263,10 @@ def start_blueprint_craft_job(save_data, station_id, blueprint):
     if not success:
         # Refund on failure
         save_data["components"] += cost
-        io.save_json(config.PATHS["save_data"], save_data)
+        save_manager.mark_dirty(save_data)
         return False, msg
         
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     return True, f"Crafting {name}..."
 
 def _start_job_internal(save_data, station_id, code, name, qty, result_type):
@@ -286,11 +274,8 @@ def _start_job_internal(save_data, station_id, code, name, qty, result_type):
     data = stations.get(station_id)
     if not data: return False, "Station locked."
     
-    content = io.load_json(config.PATHS["content_hideout"])
-    s_conf = next((s for s in content.get("stations", []) if s["id"] == station_id), None)
     level = data.get("level", 1)
-    lvl_conf = next((l for l in s_conf["levels"] if l["level"] == level), None)
-    max_slots = lvl_conf.get("slots", 1)
+    max_slots = catalog.get_level(station_id, level).slots
     
     idx = _get_free_slot_index(save_data, station_id, max_slots)
     
@@ -305,7 +290,7 @@ def _start_job_internal(save_data, station_id, code, name, qty, result_type):
         "result_type": result_type
     }
     
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     return True, f"Job started in Slot {idx + 1}"
 
 # ----------------------------------------------------------------------
@@ -345,7 +330,7 @@ def collect_finished_craft(save_data, station_id):
         inventory.update_local_inventory(save_data, added_items=[{"code": code, "qty": qty, "name": name}])
         msg = f"Collected: {name}"
         
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     return {"success": True, "msg": msg}
 
 def cancel_crafting_job(save_data, station_id, slot_index):
@@ -364,7 +349,7 @@ def cancel_crafting_job(save_data, station_id, slot_index):
         
     slots[slot_index] = {} 
     
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     return {"success": True, "msg": "Job Cancelled"}
 
 # ----------------------------------------------------------------------
@@ -381,11 +366,8 @@ def claim_production(save_data, station_id):
     storage = data.get("storage", 0)
     if storage <= 0: return {"success": False, "msg": "Storage empty"}
     
-    content = io.load_json(config.PATHS["content_hideout"])
-    s_conf = next((s for s in content.get("stations", []) if s["id"] == station_id), None)
     level = data.get("level", 1)
-    lvl_conf = next((l for l in s_conf["levels"] if l["level"] == level), None)
-    output = lvl_conf.get("output", {})
+    output = catalog.get_level(station_id, level).output
     
     reward_msg = ""
     cmds = []
@@ -416,26 +398,25 @@ def claim_production(save_data, station_id):
         for _ in range(total_items):
             # Note: accessing internal method via public import context
             tier = loot._choose_item_rarity(0, fortune) 
-            candidates = [i for i in pool["all"] if i.get("rarity") == tier]
-            if not candidates: candidates = pool["all"]
+            candidates = pool["by_rarity"].get(tier) or pool["all"]
             item = random.choice(candidates)
             items_gained.append(f"{item['name']}")
             cmds.append(f"player.additem {item['code']} 1")
         reward_msg = f"Looted: {len(items_gained)} Items"
 
     data["storage"] = 0
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     engine._process_game_commands(cmds)
     
     return {"success": True, "msg": reward_msg}
 
 def check_station_requirements(station_id, level, save_data):
-    content = io.load_json(config.PATHS["content_hideout"])
-    s_conf = next((s for s in content.get("stations", []) if s["id"] == station_id), None)
+    station_map = catalog.get_catalog()
+    station = station_map.get(station_id)
     
-    if not s_conf: return False, "Unknown Station"
+    if not station: return False, "Unknown Station"
     
-    req = s_conf.get("requirement")
+    req = station.requirement
     if not req: return True, "OK"
     
     req_id = req.get("station_id")
@@ -446,8 +427,8 @@ def check_station_requirements(station_id, level, save_data):
     current_lvl = target_data.get("level", 0)
     
     if current_lvl < req_target_lvl:
-        req_conf = next((s for s in content.get("stations", []) if s["id"] == req_id), None)
-        req_name = req_conf["name"] if req_conf else req_id
+        req_station = station_map.get(req_id)
+        req_name = req_station.name if req_station else req_id
         return False, f"Requires {req_name} Lvl {req_target_lvl}"
         
     return True, "OK"
@@ -461,7 +442,7 @@ def get_workbench_data(save_data, station_level):
     Returns (dismantle_list, craft_list) based on station level and inventory.
     """
     # 1. Load Blueprint DB
-    bp_db = io.load_json(config.PATHS["blueprints"], {})
+    bp_db = registry.get_content("blueprints", {})
     
     # 2. Build Dismantle List
     # Filter 'components' list by station level (Lvl 1=1 component, Lvl 4=4 components)
@@ -473,8 +454,7 @@ def get_workbench_data(save_data, station_level):
     
     # Check Player Inventory
     game_path = save_data.get("game_install_path", "")
-    char_data = inventory.get_character_data(game_path)
-    current_inv = char_data.get("inventory", [])
+    suffix_qty = inventory.get_inventory_index(game_path)["suffix_qty"]
     
     dismantle_options = []
     
@@ -482,13 +462,8 @@ def get_workbench_data(save_data, station_level):
         code = comp_def["code"]
         suffix = code[-6:] if len(code) >= 6 else code
         
-        # Find in inventory
-        found_qty = 0
-        for inv_item in current_inv:
-            inv_code = inv_item.get("code", "")
-            inv_suffix = inv_code[-6:] if len(inv_code) >= 6 else inv_code
-            if inv_code == code or inv_suffix == suffix:
-                found_qty += inv_item.get("qty", 0)
+        # Total owned across every code sharing the suffix
+        found_qty = suffix_qty.get(suffix, 0)
                 
         if found_qty > 0:
             dismantle_options.append({
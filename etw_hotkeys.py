@@ -4,7 +4,6 @@ except ImportError:
     print("WARNING: 'keyboard' module not installed. Hotkeys disabled.")
     keyboard = None
 
-import time
 import etw_bridge as bridge
 
 class GlobalHotkeyManager:
@@ -72,38 +71,20 @@ class GlobalHotkeyManager:
         if not game_path: 
             return
 
-        # Trigger Scan
-        bridge.trigger_baseline_scan(game_path)
-        
-        # Start Non-Blocking Polling Loop
-        # We pass the start time to handle timeouts
-        self.root.after(100, lambda: self._poll_scan_result(time.time()))
+        # Scan on the Tk-driven async loop (never blocks the hotkey thread or Tk)
+        self.app.aio.spawn(self._scan_baseline(game_path))
 
-    def _poll_scan_result(self, start_time):
-        """
-        Polls for the scan result without freezing the main thread.
-        """
-        game_path = self.app.save_data.get("game_install_path", "")
-        
-        # NON-BLOCKING READ
-        result = bridge.read_baseline_scan(game_path, blocking=False)
+    async def _scan_baseline(self, game_path):
+        result = await bridge.scan(game_path, timeout=15.0)
         
         if result:
-            # SUCCESS: File found and read
             if "baseline" not in self.app.save_data: 
                 self.app.save_data["baseline"] = {}
                 
-            self.app.save_data["baseline"]["level"] = result["level"]
-            self.app.save_data["baseline"].update(result["stats"])
+            self.app.save_data["baseline"]["level"] = result.level
+            self.app.save_data["baseline"].update(result.stats)
             
             # Optional: Visual feedback if we had access to a status bar
             # print("F5 Scan Complete: Baseline Updated")
-            
         else:
-            # WAITING or TIMEOUT
-            elapsed = time.time() - start_time
-            if elapsed > 15.0:
-                print("F5 Scan Timeout: File not found.")
-            else:
-                # Schedule next check in 100ms
-                self.root.after(100, lambda: self._poll_scan_result(start_time))
\ No newline at end of file
+            print("F5 Scan Timeout: File not found.")
\ No newline at end of file
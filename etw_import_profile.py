@@ -0,0 +1,68 @@
+import builtins
+import sys
+import time
+
+# ----------------------------------------------------------------------
+# IMPORT PROFILE MODE (--import-profile)
+# ----------------------------------------------------------------------
+# Wraps builtins.__import__ to time every first import of a module, and
+# records startup milestones (e.g. "splash shown"). write_report() dumps
+# both, slowest modules first, so startup regressions can be traced to the
+# module that introduced them. Off unless install() is called.
+
+REPORT_FILE = "import_profile.txt"
+TOP_N = 30
+
+_ORIGINAL_IMPORT = builtins.__import__
+_T0 = time.perf_counter()
+_RECORDS = {}   # module -> [self_seconds, cumulative_seconds]
+_STACK = []     # Child time accumulated by each import in progress
+_MARKS = []     # (label, seconds since install)
+
+def install():
+    global _T0
+    _T0 = time.perf_counter()
+    builtins.__import__ = _timed_import
+
+def is_active():
+    return builtins.__import__ is _timed_import
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level == 0 and name in sys.modules:
+        return _ORIGINAL_IMPORT(name, globals, locals, fromlist, level)
+
+    _STACK.append(0.0)
+    start = time.perf_counter()
+    try:
+        return _ORIGINAL_IMPORT(name, globals, locals, fromlist, level)
+    finally:
+        total = time.perf_counter() - start
+        children = _STACK.pop()
+        if _STACK: _STACK[-1] += total
+        rec = _RECORDS.setdefault("." * level + name, [0.0, 0.0])
+        rec[0] += total - children
+        rec[1] += total
+
+def mark(label):
+    """Records a startup milestone (no-op unless the profile is active)."""
+    if is_active():
+        _MARKS.append((label, time.perf_counter() - _T0))
+
+def write_report(path=REPORT_FILE):
+    rows = sorted(_RECORDS.items(), key=lambda kv: kv[1][0], reverse=True)
+    lines = ["--- Startup Milestones ---"]
+    lines += [f"{secs * 1000:9.1f} ms  {label}" for label, secs in _MARKS]
+    lines.append("")
+    lines.append(f"--- Imports: {len(rows)} modules, top {TOP_N} by self time ---")
+    lines.append(f"{'self ms':>9}  {'total ms':>9}  module")
+    lines += [f"{s * 1000:9.1f}  {t * 1000:9.1f}  {name}" for name, (s, t) in rows[:TOP_N]]
+
+    try:
+        with open(path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+    except OSError as e:
+        print(f"Import Profile Error: {e}")
+        return
+
+    total = _MARKS[-1][1] if _MARKS else 0.0
+    print(f"[Import Profile] {len(rows)} modules, {total * 1000:.0f} ms to last milestone -> {path}")
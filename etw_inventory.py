@@ -1,11 +1,11 @@
 import json
 import os
-import re
 import time
 
 # Foundation
 import etw_config as config
 import etw_io as io
+import etw_profiler as profiler
 
 # Sub-Systems
 import etw_bridge as bridge
@@ -26,123 +26,102 @@ def get_valid_loot_codes():
     """
     Returns a dictionary of valid item suffixes (last 6 chars) mapped to their data.
     These are the items defined in the loot_*.json files.
+    We strictly use the last 6 characters to handle load order variances (e.g. 04xxxxxx).
+    Served from the precomputed loot index (shared, do not mutate).
     """
-    pool = loot.get_loot_pool_cached()["all"]
-    valid_map = {}
-    
-    for item in pool:
-        code = item.get("code", "")
-        if len(code) >= 6:
-            # We strictly use the last 6 characters to handle load order variances (e.g. 04xxxxxx)
-            suffix = code[-6:].upper()
-            valid_map[suffix] = item
-            
-    return valid_map
+    return loot.get_loot_pool_cached()["by_suffix"]
+
+def _get_scan(game_path, scan):
+    if scan is not None: return scan
+    # Same wait budget as the old read_file_safely(retries=20, delay=0.25)
+    return bridge.read_scan(game_path, timeout=10.0)
 
-def parse_raw_inventory_log(game_path):
+def parse_raw_inventory_log(game_path, scan=None):
     """
-    Reads the raw output from 'player.showinventory' contained in the unified scan file.
+    Maps the 'player.showinventory' records of the unified scan file to item dicts.
+    scan: an already parsed bridge.ScanResult (skips the file read).
     """
-    # Uses the unified baseline filename from config
-    raw_path = os.path.join(game_path, RAW_INV_FILENAME)
-    lines = bridge.read_file_safely(raw_path)
-    
-    if not lines:
+    scan = _get_scan(game_path, scan)
+    if scan is None:
         print("Inventory Parse Warning: Log file was empty or could not be read.")
         return None # Critical: Return None to indicate failure
 
     valid_map = get_valid_loot_codes()
     parsed_inventory = []
     
-    # Regex Update: Tuned for "1 - ItemName (ID)..." format
-    # Matches: Count, Name, Full ID
-    pattern = re.compile(r"^\s*(\d+)\s+-\s+(.+?)\s+\(([0-9A-Fa-f]{8})\).*")
-    
-    for line in lines:
-        line = line.strip()
-        # Skip garbage lines or headers
-        if not line: continue
-        if "has" in line and "items" in line and line.endswith(":"): continue 
+    for qty, name, full_id in scan.items:
+        suffix = full_id[-6:]
         
-        # Skip stat dump lines (GetBaseActorValue, SetConsoleOutputFilename, etc.)
-        if "GetBaseActorValue" in line or "SetConsoleOutputFilename" in line or ">>" in line:
-            continue
-
-        match = pattern.match(line)
-        if match:
-            qty = int(match.group(1))
-            full_id = match.group(3).upper()
-            suffix = full_id[-6:]
-            
-            if suffix in valid_map:
-                item_def = valid_map[suffix]
-                parsed_inventory.append({
-                    "code": full_id, 
-                    "suffix": suffix,
-                    "name": item_def["name"],
-                    "category": item_def.get("category", "misc"),
-                    "qty": qty
-                })
-            elif suffix == "00000F": # Manual check for caps
-                 parsed_inventory.append({
-                    "code": full_id,
-                    "suffix": suffix,
-                    "name": "Caps",
-                    "category": "currency",
-                    "qty": qty
-                 })
-            else:
-                # UNKNOWN ITEMS (Quest items, Pipboy, Modded gear)
-                # These are NOT in the loot DB, so we mark them 'unknown'
-                parsed_inventory.append({
-                    "code": full_id,
-                    "suffix": suffix,
-                    "name": match.group(2).strip(),
-                    "category": "unknown",
-                    "qty": qty
-                })
+        if suffix in valid_map:
+            item_def = valid_map[suffix]
+            parsed_inventory.append({
+                "code": full_id, 
+                "suffix": suffix,
+                "name": item_def["name"],
+                "category": item_def.get("category", "misc"),
+                "qty": qty
+            })
+        elif suffix == "00000F": # Manual check for caps
+            parsed_inventory.append({
+                "code": full_id,
+                "suffix": suffix,
+                "name": "Caps",
+                "category": "currency",
+                "qty": qty
+            })
+        else:
+            # UNKNOWN ITEMS (Quest items, Pipboy, Modded gear)
+            # These are NOT in the loot DB, so we mark them 'unknown'
+            parsed_inventory.append({
+                "code": full_id,
+                "suffix": suffix,
+                "name": name,
+                "category": "unknown",
+                "qty": qty
+            })
                 
     return parsed_inventory
 
-def parse_raw_stats_log(game_path):
+def parse_raw_stats_log(game_path, scan=None):
     """
-    Parses the stats log generated by the bridge.
-    Now reads from the unified baseline file.
+    Returns the level and base actor values from the unified scan file.
+    scan: an already parsed bridge.ScanResult (skips the file read).
     """
-    log_path = os.path.join(game_path, RAW_STATS_FILENAME)
-    lines = bridge.read_file_safely(log_path)
-    
-    if not lines: 
+    scan = _get_scan(game_path, scan)
+    if scan is None: 
         print("Stats Parse Warning: Log file was empty or could not be read.")
         return None
-    
-    result = {"level": 1, "stats": {}}
-    
-    try:
-        for line in lines:
-            line = line.strip()
-            if "GetLevel >>" in line:
-                m = re.search(r">> ([\d\.]+)", line)
-                if m: result["level"] = float(m.group(1))
-            
-            if "GetBaseActorValue" in line and ">>" in line:
-                parts = line.split(">>")
-                if len(parts) == 2:
-                    val = float(parts[1].strip())
-                    left = parts[0].replace("GetBaseActorValue:", "").strip().lower()
-                    if left in bridge.STATS_COVERED:
-                        result["stats"][left] = val
-        return result
-    except Exception as e:
-        print(f"Inventory Module Stat Parse Error: {e}")
-        return None
+    return {"level": scan.level, "stats": dict(scan.stats)}
 
 # ----------------------------------------------------------------------
 # 2. STATE MANAGEMENT (Source of Truth)
 # ----------------------------------------------------------------------
 
+# character_data.json is cached in memory against its (mtime, size) signature,
+# so UI rows and requirement checks don't re-parse it on every call.
+# The Inventory model (code/suffix dicts) is built lazily on top of the cached dict.
+_CHAR_CACHE = {"signature": None, "data": None, "inventory": None}
+_LAST_SYNC_DIFF = {"added": [], "removed": [], "changed": []}
+
+def _char_path():
+    return os.path.join(os.getcwd(), CHAR_DATA_FILENAME)
+
+def _char_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 def get_character_data(game_path=None):
-    char_path = os.path.join(os.getcwd(), CHAR_DATA_FILENAME)
+    """
+    Returns character_data.json (served from memory while the file is unchanged).
+    The dict is shared: persist any mutation with save_character_data().
+    """
+    char_path = _char_path()
+    sig = _char_signature(char_path)
+    if sig is not None and sig == _CHAR_CACHE["signature"]:
+        return _CHAR_CACHE["data"]
     
     default_data = {
         "last_updated": 0,
@@ -150,27 +129,230 @@ def get_character_data(game_path=None):
         "stats": {},
         "inventory": []
     }
-    return io.load_json(char_path, default_data)
+    data = io.load_json(char_path, default_data)
+    _CHAR_CACHE.update(signature=sig, data=data, inventory=None)
+    return data
 
 def save_character_data(game_path, data):
-    char_path = os.path.join(os.getcwd(), CHAR_DATA_FILENAME)
+    char_path = _char_path()
     data["last_updated"] = time.time()
-    return io.save_json(char_path, data)
+    ok = io.save_json(char_path, data)
+    if ok:
+        model = _CHAR_CACHE["inventory"]
+        if model is not None and model.data is not data: model = None
+        _CHAR_CACHE.update(signature=_char_signature(char_path), data=data, inventory=model)
+    else:
+        # Memory may now be ahead of disk; re-read on next access
+        _CHAR_CACHE.update(signature=None, data=None, inventory=None)
+    return ok
+
+def _suffix(code):
+    return code[-6:] if len(code) >= 6 else code
+
+def build_inventory_index(inv_list):
+    """
+    Dict views over an inventory list:
+      by_code:    full code -> entry
+      by_suffix:  6-char suffix -> first entry (load order independent lookup)
+      suffix_qty: 6-char suffix -> total qty across all entries
+    """
+    by_code = {}
+    by_suffix = {}
+    suffix_qty = {}
+    for item in inv_list:
+        code = item.get("code", "")
+        suffix = _suffix(code)
+        by_code.setdefault(code, item)
+        by_suffix.setdefault(suffix, item)
+        suffix_qty[suffix] = suffix_qty.get(suffix, 0) + item.get("qty", 0)
+    return {"by_code": by_code, "by_suffix": by_suffix, "suffix_qty": suffix_qty}
+
+class Inventory:
+    """
+    Dict-backed model of character_data.json.
+    The on-disk layout is unchanged: 'inventory' stays a list of entries,
+    the dicts below point at the same entry objects.
+    """
+    def __init__(self, data):
+        self.data = data
+        self.items = data.setdefault("inventory", [])
+        self.index = build_inventory_index(self.items)
+
+    @property
+    def caps(self):
+        return self.data.get("caps", 0)
+
+    def find(self, code):
+        return find_owned(code, self.index)
+
+    def qty(self, code):
+        return owned_qty(code, self.index)
+
+    def check(self, requirements):
+        """
+        Matches requirement dicts ({'code', 'qty', 'name'}) against owned entries.
+        Requirements resolving to the same entry are summed.
+        Returns (removals, missing): removals as [{'code', 'qty'}] using the
+        actual owned code, missing as display strings.
+        """
+        needed = {}
+        names = {}
+        order = []
+        missing = []
+        
+        for req in requirements:
+            req_code = req.get("code", "")
+            req_qty = req.get("qty", 1)
+            req_name = req.get("name", "Unknown Item")
+            
+            # Exact code, else suffix match (actual code might differ from refID if modded)
+            item = self.find(req_code)
+            if item is None:
+                missing.append(f"{req_name} (Need {req_qty}, Have 0)")
+                continue
+            code = item["code"]
+            if code not in needed:
+                order.append(code)
+                needed[code] = 0
+            needed[code] += req_qty
+            names.setdefault(code, req_name)
+        
+        removals = []
+        for code in order:
+            have = self.index["by_code"][code].get("qty", 0)
+            if have < needed[code]:
+                missing.append(f"{names[code]} (Need {needed[code]}, Have {have})")
+            else:
+                removals.append({"code": code, "qty": needed[code]})
+        return removals, missing
+
+    def apply(self, added=None, removed=None, caps_delta=0):
+        """
+        Bulk update: adds/removes [{'code', 'qty'}] and shifts caps (floored at 0).
+        """
+        by_code = self.index["by_code"]
+        suffix_qty = self.index["suffix_qty"]
+        emptied = False
+        
+        for new_item in added or ():
+            code = new_item["code"]
+            qty = new_item.get("qty", 1)
+            suffix = _suffix(code)
+            existing = by_code.get(code)
+            
+            if existing is not None:
+                existing["qty"] += qty
+            else:
+                ref = loot.find_item_by_code(code)
+                entry = {
+                    "code": code,
+                    "suffix": suffix,
+                    "name": ref["name"] if ref else new_item.get("name", "Unknown Item"),
+                    "category": ref.get("category", "misc") if ref else "misc",
+                    "qty": qty
+                }
+                self.items.append(entry)
+                by_code[code] = entry
+                self.index["by_suffix"].setdefault(suffix, entry)
+            suffix_qty[suffix] = suffix_qty.get(suffix, 0) + qty
+        
+        for rem_item in removed or ():
+            existing = by_code.get(rem_item["code"])
+            if existing is None: continue
+            
+            taken = min(existing["qty"], rem_item.get("qty", 1))
+            existing["qty"] -= taken
+            suffix = _suffix(existing["code"])
+            suffix_qty[suffix] = suffix_qty.get(suffix, 0) - taken
+            if existing["qty"] <= 0: emptied = True
+        
+        if emptied:
+            # Rare path: drop empty entries and re-point the suffix views
+            self.items[:] = [i for i in self.items if i["qty"] > 0]
+            self.index = build_inventory_index(self.items)
+        
+        self.data["caps"] = max(0, self.caps + caps_delta)
+
+    def save(self, game_path=None):
+        return save_character_data(game_path, self.data)
+
+def get_inventory(game_path=None):
+    """
+    Returns the shared Inventory model of the stored character data.
+    """
+    data = get_character_data(game_path)
+    model = _CHAR_CACHE["inventory"]
+    if model is None or model.data is not data:
+        model = Inventory(data)
+        _CHAR_CACHE["inventory"] = model
+    return model
+
+def get_inventory_index(game_path=None):
+    """
+    Returns the index of the stored inventory (shared, do not mutate).
+    """
+    return get_inventory(game_path).index
+
+def find_owned(code, index=None):
+    """
+    Returns the stored inventory entry for a code: exact code first,
+    then any entry with the same 6-char suffix. None if not owned.
+    """
+    if index is None: index = get_inventory_index()
+    item = index["by_code"].get(code)
+    if item is None:
+        item = index["by_suffix"].get(_suffix(code))
+    return item
+
+def owned_qty(code, index=None):
+    item = find_owned(code, index)
+    return item.get("qty", 0) if item else 0
+
+def diff_inventory(old_list, new_list):
+    """
+    Compares two inventory lists by code.
+    Returns {"added": [entry], "removed": [entry], "changed": [(code, old_qty, new_qty)]}.
+    """
+    old_by_code = {i.get("code"): i for i in old_list}
+    new_by_code = {i.get("code"): i for i in new_list}
+    
+    added = [i for c, i in new_by_code.items() if c not in old_by_code]
+    removed = [i for c, i in old_by_code.items() if c not in new_by_code]
+    changed = []
+    for code, item in new_by_code.items():
+        old = old_by_code.get(code)
+        if old is not None and old.get("qty") != item.get("qty"):
+            changed.append((code, old.get("qty", 0), item.get("qty", 0)))
+    return {"added": added, "removed": removed, "changed": changed}
+
+def get_last_sync_diff():
+    """
+    Inventory changes found by the most recent perform_full_inventory_sync.
+    """
+    return _LAST_SYNC_DIFF
 
 # ----------------------------------------------------------------------
 # 3. OPERATION: FULL SYNC
 # ----------------------------------------------------------------------
 
-def perform_full_inventory_sync(save_data):
+@profiler.timed
+def perform_full_inventory_sync(save_data, scan=None):
     """
     Main entry point for syncing from Game to App.
     Reads from the unified 'etw_baseline' file.
+    scan: an already awaited bridge.ScanResult (skips the blocking wait).
     """
     game_path = save_data.get("game_install_path", "")
     if not game_path: return False
     
-    # 1. Parse Inventory (Reads etw_baseline)
-    inv_list = parse_raw_inventory_log(game_path)
+    # Read & parse etw_baseline once; both passes below share the result
+    scan = _get_scan(game_path, scan)
+    if scan is None:
+        print("Sync Aborted: Inventory log missing or locked.")
+        return False # Fail safe - DO NOT SAVE
+    
+    # 1. Parse Inventory
+    inv_list = parse_raw_inventory_log(game_path, scan)
     if inv_list is None:
         print("Sync Aborted: Inventory log missing or locked.")
         return False # Fail safe - DO NOT SAVE
@@ -184,8 +366,8 @@ def perform_full_inventory_sync(save_data):
         else:
             final_inv_list.append(item)
             
-    # 2. Parse Stats (Reads etw_baseline)
-    stat_data = parse_raw_stats_log(game_path)
+    # 2. Parse Stats
+    stat_data = parse_raw_stats_log(game_path, scan)
     if stat_data and stat_data.get("stats"):
         baseline = stat_data.get("stats", {})
     else:
@@ -193,7 +375,17 @@ def perform_full_inventory_sync(save_data):
         print("Sync Warning: Stat scan failed, preserving existing baseline.")
         baseline = save_data.get("baseline", {})
     
-    # 3. Save to Source of Truth (Only if Inventory was valid)
+    # 3. Diff against the stored copy; unchanged scans skip the write
+    global _LAST_SYNC_DIFF
+    previous = get_character_data(game_path)
+    diff = diff_inventory(previous.get("inventory", []), final_inv_list)
+    _LAST_SYNC_DIFF = diff
+    
+    if (not diff["added"] and not diff["removed"] and not diff["changed"]
+            and previous.get("caps") == caps_count and previous.get("stats") == baseline):
+        return True
+    
+    # 4. Save to Source of Truth (Only if Inventory was valid)
     char_data = {
         "caps": caps_count,
         "stats": baseline,
@@ -212,62 +404,9 @@ def update_local_inventory(save_data, added_items=None, removed_items=None, caps
     game_path = save_data.get("game_install_path", "")
     if not game_path: return
 
-    char_data = get_character_data(game_path)
-    current_inv = char_data.get("inventory", [])
-    current_caps = char_data.get("caps", 0)
-    
-    def _find_index(code):
-        for i, item in enumerate(current_inv):
-            if item["code"] == code: return i
-        return -1
-
-    if added_items:
-        pool = loot.get_loot_pool_cached()["all"]
-        for new_item in added_items:
-            code = new_item["code"]
-            qty = new_item.get("qty", 1)
-            idx = _find_index(code)
-            
-            if idx >= 0:
-                current_inv[idx]["qty"] += qty
-            else:
-                ref = None
-                for p in pool:
-                    if p.get("code") == code:
-                        ref = p; break
-                if not ref:
-                    suffix = code[-6:] if len(code) >= 6 else code
-                    for p in pool:
-                        if p.get("code", "").endswith(suffix):
-                            ref = p; break
-                            
-                name = ref["name"] if ref else "Unknown Item"
-                cat = ref.get("category", "misc") if ref else "misc"
-                
-                current_inv.append({
-                    "code": code,
-                    "qty": qty,
-                    "name": name,
-                    "category": cat
-                })
-
-    if removed_items:
-        for rem_item in removed_items:
-            code = rem_item["code"]
-            qty = rem_item.get("qty", 1)
-            idx = _find_index(code)
-            
-            if idx >= 0:
-                current_inv[idx]["qty"] = max(0, current_inv[idx]["qty"] - qty)
-                
-        current_inv = [i for i in current_inv if i["qty"] > 0]
-
-    new_caps = max(0, current_caps + caps_change)
-
-    char_data["inventory"] = current_inv
-    char_data["caps"] = new_caps
-    
-    save_character_data(game_path, char_data)
+    inv = get_inventory(game_path)
+    inv.apply(added_items, removed_items, caps_change)
+    inv.save(game_path)
 
 # ----------------------------------------------------------------------
 # 5. DEATH LOGIC
@@ -280,7 +419,7 @@ def calculate_death_losses(save_data):
     Everything else (Quest items, mod items, pipboy, keys) is SAFE.
     """
     game_path = save_data.get("game_install_path", "")
-    insured_items = save_data.get("insured_items", [])
+    insured_items = set(save_data.get("insured_items", []))
     
     char_data = get_character_data(game_path)
     current_inv = char_data.get("inventory", [])
@@ -329,6 +468,18 @@ def calculate_death_losses(save_data):
 # 6. VERIFICATION & REMOVAL HELPER
 # ----------------------------------------------------------------------
 
+def plan_item_removal(save_data, required_items):
+    """
+    Verification pass of verify_and_remove_items, without side effects.
+    Returns (items_to_remove, removal_commands, missing_items). Callers that
+    run the bridge batch off the Tk thread apply the result afterwards with
+    update_local_inventory(save_data, removed_items=items_to_remove).
+    """
+    inv = get_inventory(save_data.get("game_install_path", ""))
+    items_to_remove, missing_items = inv.check(required_items)
+    cmds = [f"player.removeitem {i['code']} {i['qty']}" for i in items_to_remove]
+    return items_to_remove, cmds, missing_items
+
 def verify_and_remove_items(save_data, required_items):
     """
     Checks if the player has the required items in the Source of Truth.
@@ -338,40 +489,9 @@ def verify_and_remove_items(save_data, required_items):
     required_items: list of dicts [{'code': 'XXX', 'qty': 1, 'name': 'Optional'}, ...]
     """
     game_path = save_data.get("game_install_path", "")
-    char_data = get_character_data(game_path)
-    current_inv = char_data.get("inventory", [])
-    
-    missing_items = []
-    items_to_remove_cmd = []
-    items_to_remove_json = []
     
     # 1. Verification Pass
-    for req in required_items:
-        req_code = req.get("code")
-        req_qty = req.get("qty", 1)
-        req_name = req.get("name", "Unknown Item")
-        
-        # Suffix matching logic
-        req_suffix = req_code[-6:] if len(req_code) >= 6 else req_code
-        
-        found_qty = 0
-        found_code = None # Actual code in inventory (might differ from refID if modded)
-        
-        for inv_item in current_inv:
-            inv_code = inv_item.get("code", "")
-            inv_suffix = inv_code[-6:] if len(inv_code) >= 6 else inv_code
-            
-            if inv_code == req_code or inv_suffix == req_suffix:
-                found_qty = inv_item.get("qty", 0)
-                found_code = inv_code
-                break
-        
-        if found_qty < req_qty:
-            missing_items.append(f"{req_name} (Need {req_qty}, Have {found_qty})")
-        else:
-            # Prepare removal data
-            items_to_remove_cmd.append(f"player.removeitem {found_code} {req_qty}")
-            items_to_remove_json.append({"code": found_code, "qty": req_qty})
+    items_to_remove_json, items_to_remove_cmd, missing_items = plan_item_removal(save_data, required_items)
 
     if missing_items:
         return {"success": False, "missing": missing_items}
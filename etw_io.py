@@ -1,11 +1,13 @@
 import json
 import os
+import etw_profiler as profiler
 
 # ----------------------------------------------------------------------
 # FILE I/O UTILITIES
 # ----------------------------------------------------------------------
 # This module handles all disk operations for JSON data.
-# It is dependency-free to allow safe import by any module.
+# It is dependency-free to allow safe import by any module
+# (etw_profiler is stdlib-only; its counters are a no-op unless --profile).
 
 def load_json(path, default=None):
     """
@@ -18,18 +20,32 @@ def load_json(path, default=None):
         return default
         
     try:
-        with open(path, "r", encoding="utf-8") as f: 
+        with profiler.io_call("load", path), open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except Exception as e:
         print(f"Error loading {path}: {e}")
         return default
 
-def save_json(path, data):
+def save_json(path, data, fsync=True):
     """
     Safely writes data to a JSON file using Atomic Save pattern.
     1. Writes to path.tmp
     2. Renames path.tmp -> path
     """
+    try:
+        text = json.dumps(data, indent=4)
+    except Exception as e:
+        print(f"Error serializing {path}: {e}")
+        return False
+        
+    return save_text(path, text, fsync)
+
+def save_text(path, text, fsync=True):
+    """
+    Atomically replaces 'path' with pre-serialized text.
+    fsync=False skips the disk flush (used by the coalescing save writer
+    for non-critical writes; the rename is still atomic).
+    """
     temp_path = f"{path}.tmp"
     
     try:
@@ -38,14 +54,14 @@ def save_json(path, data):
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
             
-        # Write to temporary file first
-        with open(temp_path, "w", encoding="utf-8") as f: 
-            json.dump(data, f, indent=4)
-            f.flush()
-            os.fsync(f.fileno()) # Force write to disk
-            
-        # Atomic replacement
-        os.replace(temp_path, path)
+        # Write to temporary file first, then replace atomically
+        with profiler.io_call("save", path):
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno()) # Force write to disk
+            os.replace(temp_path, path)
         return True
         
     except Exception as e:
@@ -1,9 +1,13 @@
 import random
 import datetime
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Batch rewards fall back to pure Python
+
 # Foundation Modules
-import etw_config as config
-import etw_io as io
+import etw_content as registry
 
 # Logic Modules
 import etw_buffs as buffs 
@@ -12,45 +16,206 @@ import etw_stats as stats
 # ----------------------------------------------------------------------
 # GLOBAL LOOT CACHE
 # ----------------------------------------------------------------------
-_INDEXED_LOOT = {"all": [], "by_category": {}, "by_rarity": {}} 
+LOOT_SOURCE_KEYS = ("weapons", "armor", "consumables", "ammo", "misc")
+REWARD_HISTORY_LIMIT = 50   # Entries kept in save_data["reward_history"]
+
+# Index layout (all lists keep the order of "all" so seeded rolls are stable):
+#   by_category:    category -> [items]  (missing category buckets as "misc")
+#   by_rarity:      rarity -> [items]    (missing rarity buckets as "tier_1")
+#   by_cat_rarity:  (category, rarity) -> [items]
+#   by_tag:         tag (from "tag" and "tags") -> [items]
+#   by_tag_or_category: label -> [items] carrying it as a tag OR as an explicit
+#                   "category" (each item once; hideout cost themes)
+#   by_code:        full code -> item (first occurrence wins)
+#   by_suffix:      last 6 chars of code (upper) -> item (first occurrence wins)
+_INDEXED_LOOT = {
+    "all": [], "by_category": {}, "by_rarity": {}, "by_cat_rarity": {},
+    "by_tag": {}, "by_tag_or_category": {}, "by_code": {}, "by_suffix": {}
+}
+_INDEXED_VERSIONS = None
+
+def code_suffix(code):
+    """
+    Load-order independent key: the last 6 characters of a FormID.
+    """
+    return code[-6:].upper() if len(code) >= 6 else code.upper()
 
 def get_loot_pool_cached():
     """
     Loads and indexes all loot files (weapons, armor, etc.) into a unified structure.
-    Returns the global cache.
-    """
-    if not _INDEXED_LOOT["all"]:
-        # Refactored to use IO/Config
-        weapons = io.load_json(config.PATHS["weapons"], [])
-        armor = io.load_json(config.PATHS["armor"], [])
-        consumables = io.load_json(config.PATHS["consumables"], [])
-        ammo = io.load_json(config.PATHS["ammo"], [])
-        misc = io.load_json(config.PATHS["misc"], [])
+    Returns the global cache. Rebuilt only when a loot file changes on disk.
+    """
+    global _INDEXED_VERSIONS
+    
+    versions = tuple(registry.get_content_version(k) for k in LOOT_SOURCE_KEYS)
+    if versions != _INDEXED_VERSIONS:
+        _INDEXED_VERSIONS = versions
         
-        all_items = weapons + armor + consumables + ammo + misc
-        _INDEXED_LOOT["all"] = all_items
+        all_items = []
+        for key in LOOT_SOURCE_KEYS:
+            all_items.extend(registry.get_content(key, []))
+        
+        by_category = {}
+        by_rarity = {}
+        by_cat_rarity = {}
+        by_tag = {}
+        by_tag_or_category = {}
+        by_code = {}
+        by_suffix = {}
         
         for item in all_items:
             cat = item.get("category", "misc")
             rar = item.get("rarity", "tier_1")
             
-            if cat not in _INDEXED_LOOT["by_category"]: 
-                _INDEXED_LOOT["by_category"][cat] = []
-            _INDEXED_LOOT["by_category"][cat].append(item)
+            by_category.setdefault(cat, []).append(item)
+            by_rarity.setdefault(rar, []).append(item)
+            by_cat_rarity.setdefault((cat, rar), []).append(item)
+            
+            tags = set(item.get("tags") or [])
+            if item.get("tag"): tags.add(item["tag"])
+            for t in tags:
+                by_tag.setdefault(t, []).append(item)
+            if item.get("category"): tags.add(item["category"])
+            for t in tags:
+                by_tag_or_category.setdefault(t, []).append(item)
             
-            if rar not in _INDEXED_LOOT["by_rarity"]: 
-                _INDEXED_LOOT["by_rarity"][rar] = []
-            _INDEXED_LOOT["by_rarity"][rar].append(item)
+            code = item.get("code", "")
+            if code:
+                by_code.setdefault(code, item)
+                by_suffix.setdefault(code_suffix(code), item)
+        
+        # Swap in one step so readers never see a half-built index
+        _INDEXED_LOOT.update({
+            "all": all_items, "by_category": by_category, "by_rarity": by_rarity,
+            "by_cat_rarity": by_cat_rarity, "by_tag": by_tag,
+            "by_tag_or_category": by_tag_or_category,
+            "by_code": by_code, "by_suffix": by_suffix
+        })
             
     return _INDEXED_LOOT
 
+def find_item_by_code(code):
+    """
+    O(1) lookup of a loot DB entry by exact code, falling back to the 6-char suffix.
+    """
+    pool = get_loot_pool_cached()
+    return pool["by_code"].get(code) or pool["by_suffix"].get(code_suffix(code))
+
+# ----------------------------------------------------------------------
+# WEIGHTED SAMPLING (Walker Alias Method)
+# ----------------------------------------------------------------------
+
+class AliasSampler:
+    """
+    Precomputed weighted sampler. O(n) to build, O(1) per draw.
+    Replaces per-item random.choices() calls that rebuilt weight lists every roll.
+    """
+    def __init__(self, outcomes, weights):
+        self.outcomes = list(outcomes)
+        self._np_tables = None
+        n = len(self.outcomes)
+        if n == 0:
+            raise ValueError("AliasSampler needs at least one outcome")
+        
+        weights = [max(0.0, float(w)) for w in weights]
+        total = sum(weights)
+        if total <= 0:
+            weights = [1.0] * n
+            total = float(n)
+        
+        # Scale so the average bucket holds exactly 1.0
+        scaled = [w * n / total for w in weights]
+        self.prob = [0.0] * n
+        self.alias = list(range(n))
+        
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= (1.0 - scaled[s])
+            if scaled[l] < 1.0: small.append(l)
+            else: large.append(l)
+            
+        # Leftovers are 1.0 up to float rounding
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self, rng=random):
+        """Single draw using one uniform variate (bucket + coin from the same number)."""
+        u = rng.random() * len(self.outcomes)
+        i = int(u)
+        if (u - i) < self.prob[i]:
+            return self.outcomes[i]
+        return self.outcomes[self.alias[i]]
+
+    def sample_u(self, u):
+        """Maps a pre-drawn uniform in [0, 1) to an outcome (same math as sample())."""
+        u = u * len(self.outcomes)
+        i = int(u)
+        if (u - i) < self.prob[i]:
+            return self.outcomes[i]
+        return self.outcomes[self.alias[i]]
+
+    def sample_array(self, us):
+        """
+        Vectorized sample_u over a NumPy array of uniforms.
+        Returns an object array of outcomes with the same shape.
+        """
+        n = len(self.outcomes)
+        if self._np_tables is None:
+            self._np_tables = (np.array(self.prob), np.array(self.alias), np.array(self.outcomes, dtype=object))
+        prob, alias, outcomes = self._np_tables
+        
+        scaled = np.asarray(us, dtype=float) * n
+        idx = scaled.astype(np.int64)
+        pick = np.where((scaled - idx) < prob[idx], idx, alias[idx])
+        return outcomes[pick]
+
+    def sample_n(self, k, rng=random):
+        """Draws k samples in one call."""
+        n = len(self.outcomes)
+        outcomes = self.outcomes
+        prob = self.prob
+        alias = self.alias
+        rand = rng.random
+        
+        out = []
+        for _ in range(k):
+            u = rand() * n
+            i = int(u)
+            out.append(outcomes[i] if (u - i) < prob[i] else outcomes[alias[i]])
+        return out
+
+# Quantization step for (rep, fortune) cache keys. Rep is a continuous log score,
+# so nearby values share one table instead of building a fresh one per roll.
+SAMPLER_QUANTUM = 0.1
+SAMPLER_CACHE_LIMIT = 512
+
+_SAMPLER_CACHE = {}
+
+def _quantize(value):
+    return round(round(value / SAMPLER_QUANTUM) * SAMPLER_QUANTUM, 4)
+
+def _get_cached_sampler(key, builder):
+    sampler = _SAMPLER_CACHE.get(key)
+    if sampler is None:
+        if len(_SAMPLER_CACHE) >= SAMPLER_CACHE_LIMIT:
+            _SAMPLER_CACHE.clear()
+        sampler = builder()
+        _SAMPLER_CACHE[key] = sampler
+    return sampler
+
 # ----------------------------------------------------------------------
 # SELECTION LOGIC
 # ----------------------------------------------------------------------
 
-def _choose_item_category(rep, fortune):
+def _category_weights(rep, fortune):
     """
-    Weighted selection of item category based on Reputation and Fortune.
+    Category weights based on Reputation and Fortune.
     High Rep -> More Weapons/Armor. High Fortune -> More Misc/Valuables.
     """
     weights = {"consumable": 40, "ammo": 30, "weapon": 10, "armor": 10, "misc": 10}
@@ -67,14 +232,11 @@ def _choose_item_category(rep, fortune):
     # Fortune Tilt (favor misc/valuables)
     weights["misc"] += (fortune * 1.0)
     
-    cats = list(weights.keys())
-    vals = [weights[k] for k in cats]
-    
-    return random.choices(cats, weights=vals, k=1)[0]
+    return weights
 
-def _choose_item_rarity(rep, fortune, difficulty="easy"):
+def _rarity_weights(rep, fortune, difficulty="easy"):
     """
-    Weighted selection of Rarity Tier (1-4).
+    Rarity Tier (1-4) weights.
     Heavily influenced by Difficulty, Reputation, and Fortune.
     """
     # Base weights
@@ -101,18 +263,66 @@ def _choose_item_rarity(rep, fortune, difficulty="easy"):
     total_high_tier_weight = w["tier_2"] + w["tier_3"] + w["tier_4"]
     w["tier_1"] = max(10, w["tier_1"] - (total_high_tier_weight * 0.2))
     
-    tiers = list(w.keys())
-    vals = [w[k] for k in tiers]
-    
-    return random.choices(tiers, weights=vals, k=1)[0]
+    return w
+
+def get_category_sampler(rep, fortune):
+    """
+    Cached alias table for item categories, keyed on quantized (rep, fortune).
+    """
+    q_rep, q_fortune = _quantize(rep), _quantize(fortune)
+    def build():
+        w = _category_weights(q_rep, q_fortune)
+        return AliasSampler(w.keys(), w.values())
+    return _get_cached_sampler(("category", q_rep, q_fortune), build)
+
+def get_rarity_sampler(rep, fortune, difficulty="easy"):
+    """
+    Cached alias table for rarity tiers, keyed on quantized (rep, fortune, difficulty).
+    """
+    q_rep, q_fortune = _quantize(rep), _quantize(fortune)
+    def build():
+        w = _rarity_weights(q_rep, q_fortune, difficulty)
+        return AliasSampler(w.keys(), w.values())
+    return _get_cached_sampler(("rarity", q_rep, q_fortune, difficulty), build)
+
+def _choose_item_category(rep, fortune):
+    """
+    Weighted selection of item category based on Reputation and Fortune.
+    """
+    return get_category_sampler(rep, fortune).sample()
+
+def _choose_item_rarity(rep, fortune, difficulty="easy"):
+    """
+    Weighted selection of Rarity Tier (1-4).
+    """
+    return get_rarity_sampler(rep, fortune, difficulty).sample()
 
 # ----------------------------------------------------------------------
 # REWARD CALCULATORS
 # ----------------------------------------------------------------------
 
-def calculate_reward_package(source_type, difficulty, save_data, duration=0):
+# ----------------------------------------------------------------------
+# REWARD PACKAGES (Scalar + Batch)
+# ----------------------------------------------------------------------
+# Every package consumes a fixed block of uniforms so the batch path and the
+# scalar path read the random stream identically:
+#   [0] companion loot roll   [1] bonus item roll
+#   [2] bonus item rarity     [3] bonus item pick
+#   then per item slot: category, rarity, pick, quantity
+# Slots beyond the rolled item count are drawn but unused.
+_REWARD_FIXED_DRAWS = 4
+_REWARD_SLOT_DRAWS = 4
+
+QTY_RANGES = {"ammo": (20, 50), "consumable": (1, 2)}
+
+def _pick_from(candidates, u):
+    """Uniform pick from a list using a pre-drawn variate."""
+    return candidates[min(int(u * len(candidates)), len(candidates) - 1)]
+
+def _build_reward_context(source_type, difficulty, save_data):
     """
-    Generates a full reward bundle (XP, Caps, Scrip, Items) based on context.
+    Resolves everything a package depends on EXCEPT randomness.
+    Expensive lookups (modifiers, reputation, companions) happen here once.
     """
     pool_data = get_loot_pool_cached()
     mods = buffs.get_player_modifiers(save_data)
@@ -142,12 +352,7 @@ def calculate_reward_package(source_type, difficulty, save_data, duration=0):
     xp_mult = mods["xp_mult"] * global_xp
     scrip_mult = mods["scrip_mult"] * global_scrip
     
-    final_caps = int(base_caps * caps_mult)
-    final_scrip = int(base_scrip * scrip_mult)
-    final_xp = int(base_xp * xp_mult)
-    
-    # Item Generation
-    items = []
+    # Item Count
     base_items = 1
     if difficulty == "medium": base_items = 2
     if difficulty == "hard": base_items = 3
@@ -155,32 +360,80 @@ def calculate_reward_package(source_type, difficulty, save_data, duration=0):
     total_items = base_items + mods["loot_count_bonus"]
     if rep >= 8: total_items += 1
     
-    # Companion Bonus Loot Roll
+    # Companion Bonus Loot Roll (rolled per package)
     c_bonuses = buffs.calculate_companion_bonuses(save_data) 
-    if c_bonuses["loot"] > 1.0:
-        if random.random() < (c_bonuses["loot"] - 1.0): 
-            total_items += 1
+    companion_chance = c_bonuses["loot"] - 1.0 if c_bonuses["loot"] > 1.0 else 0.0
+    
+    # Quantity Multipliers
+    q_mult = 1.0 + (rep * 0.1) + (fortune * 0.05)
+    if difficulty == "medium": q_mult += 0.2
+    if difficulty == "hard": q_mult += 0.5
+    
+    # Raid Modifier Bonus Item
+    bonus_chance = 0.0
+    if current_mod and source_type == "raid":
+        bonus_chance = 1.0 if current_mod == "fortunes_bounty" else 0.5
+    
+    max_items = max(0, total_items) + (1 if companion_chance > 0 else 0)
+    
+    return {
+        "pool": pool_data,
+        "xp": int(base_xp * xp_mult),
+        "caps": int(base_caps * caps_mult),
+        "scrip": int(base_scrip * scrip_mult),
+        "total_items": total_items,
+        "companion_chance": companion_chance,
+        "max_items": max_items,
+        "q_mult": q_mult,
+        "bonus_chance": bonus_chance,
+        "cat_sampler": get_category_sampler(rep, fortune),
+        "tier_sampler": get_rarity_sampler(rep, fortune, difficulty),
+        "bonus_sampler": get_rarity_sampler(rep, fortune + 5.0, difficulty),
+        "width": _REWARD_FIXED_DRAWS + _REWARD_SLOT_DRAWS * max_items
+    }
+
+def _draw_uniforms(rng, n, width):
+    """
+    Returns an n x width block of uniforms in [0, 1).
+    NumPy Generators fill the block in one call; anything else
+    (random module, random.Random) is read row by row.
+    """
+    if np is not None and isinstance(rng, np.random.Generator):
+        return rng.random((n, width))
+    rand = (rng or random).random
+    return [[rand() for _ in range(width)] for _ in range(n)]
+
+def _slot_columns(ctx, offset):
+    return [_REWARD_FIXED_DRAWS + _REWARD_SLOT_DRAWS * s + offset for s in range(ctx["max_items"])]
 
-    for _ in range(total_items):
-        cat = _choose_item_category(rep, fortune)
-        tier = _choose_item_rarity(rep, fortune, difficulty)
+def _assemble_package(ctx, row, cats, tiers):
+    """
+    Turns one row of uniforms (plus its resolved categories/tiers) into a package.
+    """
+    pool_data = ctx["pool"]
+    items = []
+    
+    total_items = ctx["total_items"]
+    if ctx["companion_chance"] > 0 and row[0] < ctx["companion_chance"]:
+        total_items += 1
+
+    for s in range(total_items):
+        base = _REWARD_FIXED_DRAWS + _REWARD_SLOT_DRAWS * s
+        cat = cats[s]
+        tier = tiers[s]
         
-        candidates = [i for i in pool_data["all"] if i.get("category") == cat and i.get("rarity") == tier]
+        candidates = pool_data["by_cat_rarity"].get((cat, tier))
         if not candidates: 
-            candidates = [i for i in pool_data["all"] if i.get("category") == cat]
+            candidates = pool_data["by_category"].get(cat)
             
         if candidates:
-            item = random.choice(candidates)
+            item = _pick_from(candidates, row[base + 2])
             base_qty = 1
-            if cat == "ammo": base_qty = random.randint(20, 50)
-            elif cat == "consumable": base_qty = random.randint(1, 2)
-            
-            # Quantity Multipliers
-            q_mult = 1.0 + (rep * 0.1) + (fortune * 0.05)
-            if difficulty == "medium": q_mult += 0.2
-            if difficulty == "hard": q_mult += 0.5
+            if cat in QTY_RANGES:
+                lo, hi = QTY_RANGES[cat]
+                base_qty = lo + min(int(row[base + 3] * (hi - lo + 1)), hi - lo)
             
-            final_qty = max(1, int(base_qty * q_mult))
+            final_qty = max(1, int(base_qty * ctx["q_mult"]))
             
             items.append({
                 "code": item.get("code", ""), 
@@ -188,30 +441,68 @@ def calculate_reward_package(source_type, difficulty, save_data, duration=0):
                 "qty": final_qty
             })
 
-    # Raid Modifier Bonus Item
-    if current_mod and source_type == "raid":
-        chance = 1.0 if current_mod == "fortunes_bounty" else 0.5
-        
-        if random.random() < chance:
-            tier = _choose_item_rarity(rep, fortune + 5.0, difficulty) 
-            pool = pool_data["all"]
-            candidates = [i for i in pool if i.get("rarity") == tier]
-            if candidates:
-                bonus_item = random.choice(candidates)
-                items.append({
-                    "code": bonus_item.get("code", ""), 
-                    "name": bonus_item.get("name", "Bonus Item"), 
-                    "qty": 1,
-                    "from_modifier": True 
-                })
+    if ctx["bonus_chance"] > 0 and row[1] < ctx["bonus_chance"]:
+        tier = ctx["bonus_sampler"].sample_u(row[2])
+        candidates = pool_data["by_rarity"].get(tier)
+        if candidates:
+            bonus_item = _pick_from(candidates, row[3])
+            items.append({
+                "code": bonus_item.get("code", ""), 
+                "name": bonus_item.get("name", "Bonus Item"), 
+                "qty": 1,
+                "from_modifier": True 
+            })
                 
     return {
-        "xp": final_xp, 
-        "caps": final_caps, 
-        "scrip": final_scrip, 
+        "xp": ctx["xp"], 
+        "caps": ctx["caps"], 
+        "scrip": ctx["scrip"], 
         "items": items
     }
 
+def calculate_reward_packages(n, source_type, difficulty, save_data, duration=0, rng=None, seed=None):
+    """
+    Batch version of calculate_reward_package for balance simulations.
+    Modifiers/reputation/companions are resolved once; all category and rarity
+    samples are drawn up front (vectorized when NumPy is installed).
+    
+    rng:  random.Random, numpy.random.Generator, or None (global random module).
+    seed: convenience; builds a fresh random.Random when rng is not given, so a
+          seed gives the same packages with or without NumPy installed. Pass a
+          numpy Generator as rng to opt into the vectorized draw.
+    
+    With the same rng state, the result equals n consecutive scalar calls.
+    """
+    if n <= 0:
+        return []
+    if rng is None and seed is not None:
+        rng = random.Random(seed)
+
+    ctx = _build_reward_context(source_type, difficulty, save_data)
+    block = _draw_uniforms(rng, n, ctx["width"])
+    
+    cat_cols = _slot_columns(ctx, 0)
+    tier_cols = _slot_columns(ctx, 1)
+    
+    if np is not None and isinstance(block, np.ndarray):
+        cats = ctx["cat_sampler"].sample_array(block[:, cat_cols]).tolist()
+        tiers = ctx["tier_sampler"].sample_array(block[:, tier_cols]).tolist()
+        rows = block.tolist()
+    else:
+        rows = block
+        cat_u = ctx["cat_sampler"].sample_u
+        tier_u = ctx["tier_sampler"].sample_u
+        cats = [[cat_u(row[c]) for c in cat_cols] for row in rows]
+        tiers = [[tier_u(row[c]) for c in tier_cols] for row in rows]
+
+    return [_assemble_package(ctx, rows[i], cats[i], tiers[i]) for i in range(n)]
+
+def calculate_reward_package(source_type, difficulty, save_data, duration=0, rng=None):
+    """
+    Generates a full reward bundle (XP, Caps, Scrip, Items) based on context.
+    """
+    return calculate_reward_packages(1, source_type, difficulty, save_data, duration, rng=rng)[0]
+
 def calculate_extraction_reward(duration, save_data):
     """
     Calculates rewards specifically for the Raid Time (Survival Bonus).
@@ -247,11 +538,14 @@ def calculate_extraction_reward(duration, save_data):
 def log_reward_history(save_data, source, pkg):
     """
     Logs the acquisition to the history buffer for UI display.
+    Returns the appended entry.
     """
     if "reward_history" not in save_data:
         save_data["reward_history"] = []
         
+    history = save_data["reward_history"]
     entry = {
+        "seq": max((e.get("seq", 0) for e in history), default=0) + 1, # Unique id for journal replay
         "source": source,
         "time": datetime.datetime.now().strftime("%H:%M"),
         "xp": pkg.get("xp", 0),
@@ -263,5 +557,6 @@ def log_reward_history(save_data, source, pkg):
     save_data["reward_history"].append(entry)
     
     # Cap history size
-    if len(save_data["reward_history"]) > 50:
-        save_data["reward_history"] = save_data["reward_history"][-50:]
\ No newline at end of file
+    if len(save_data["reward_history"]) > REWARD_HISTORY_LIMIT:
+        save_data["reward_history"] = save_data["reward_history"][-REWARD_HISTORY_LIMIT:]
+    return entry
\ No newline at end of file
@@ -0,0 +1,165 @@
+import contextlib
+import datetime
+import functools
+import os
+import threading
+import time
+
+# ----------------------------------------------------------------------
+# PROFILING HARNESS (ETW_App.py --profile)
+# ----------------------------------------------------------------------
+# Off by default; every hook below is a single flag check until enable().
+#   @timed / timing(label)   wall time of engine entry points and bridge waits
+#   io_call(op, path)        per-path counters for etw_io loads/saves
+#   set_action(label)        the last user action; timings and I/O are
+#                            attributed to it ("which click read what")
+#   startup cProfile         captured from enable(startup=True) to splash
+# flush() appends everything recorded since the previous flush to
+# STATS_FILE (next to error_log.txt), rotating it like a log file.
+# Stdlib only, so etw_io can stay importable from anywhere.
+
+STATS_FILE = "etw_stats.txt"
+STATS_MAX_BYTES = 512 * 1024
+STATS_BACKUPS = 3
+STATS_FLUSH_INTERVAL = 60.0   # Seconds between periodic flushes (App scheduler)
+STARTUP_PROFILE_FILE = "etw_startup.prof"
+STARTUP_TOP_N = 25
+
+ENABLED = False
+
+_LOCK = threading.Lock()
+_ACTION = {"label": "startup"}
+_TIMINGS = {}   # (action, label) -> [calls, total_s, max_s]
+_IO = {}        # (action, op, path) -> [calls, total_s]
+_STARTUP = {"profiler": None, "report": None}
+
+def enable(startup=False):
+    """Turns recording on; startup=True also starts the startup cProfile."""
+    global ENABLED
+    ENABLED = True
+    if startup:
+        import cProfile
+        _STARTUP["profiler"] = cProfile.Profile()
+        _STARTUP["profiler"].enable()
+
+def set_action(label):
+    if ENABLED:
+        _ACTION["label"] = label
+
+# --- Recording ---
+
+def _record(table, key, elapsed):
+    with _LOCK:
+        rec = table.get(key)
+        if rec is None:
+            rec = table[key] = [0, 0.0, 0.0]
+        rec[0] += 1
+        rec[1] += elapsed
+        if elapsed > rec[2]: rec[2] = elapsed
+
+@contextlib.contextmanager
+def timing(label):
+    """Times a block (also across awaits inside a coroutine)."""
+    if not ENABLED:
+        yield
+        return
+    action = _ACTION["label"]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(_TIMINGS, (action, label), time.perf_counter() - start)
+
+def timed(fn):
+    """Decorator: records each call of fn under 'module.function'."""
+    label = f"{fn.__module__.replace('etw_', '')}.{fn.__name__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not ENABLED:
+            return fn(*args, **kwargs)
+        with timing(label):
+            return fn(*args, **kwargs)
+    return wrapper
+
+@contextlib.contextmanager
+def io_call(op, path):
+    """Counts one JSON load/save of `path` (used by etw_io)."""
+    if not ENABLED:
+        yield
+        return
+    action = _ACTION["label"]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(_IO, (action, op, os.path.basename(str(path))), time.perf_counter() - start)
+
+# --- Startup cProfile ---
+
+def stop_startup_profile():
+    """Stops the startup cProfile, dumps it, and keeps a text summary for flush()."""
+    prof = _STARTUP["profiler"]
+    if prof is None: return
+    prof.disable()
+    _STARTUP["profiler"] = None
+
+    import io as stdio
+    import pstats
+    try:
+        prof.dump_stats(STARTUP_PROFILE_FILE)
+    except OSError as e:
+        print(f"Profiler Error: {e}")
+    buf = stdio.StringIO()
+    pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(STARTUP_TOP_N)
+    _STARTUP["report"] = buf.getvalue().strip()
+
+# --- Stats File ---
+
+def _rotate(path):
+    try:
+        if os.path.getsize(path) < STATS_MAX_BYTES: return
+    except OSError:
+        return
+    for i in range(STATS_BACKUPS - 1, 0, -1):
+        src, dst = f"{path}.{i}", f"{path}.{i + 1}"
+        if os.path.exists(src): os.replace(src, dst)
+    os.replace(path, f"{path}.1")
+
+def _format_section(timings, io_calls):
+    by_action = {}
+    for (action, label), (calls, total, peak) in timings.items():
+        by_action.setdefault(action, ([], []))[0].append(
+            f"    {label:<40} {calls:>5}x  {total * 1000:9.1f} ms  (max {peak * 1000:.1f})")
+    for (action, op, path), (calls, total, _) in io_calls.items():
+        by_action.setdefault(action, ([], []))[1].append(
+            f"    {op:<5} {path:<34} {calls:>5}x  {total * 1000:9.1f} ms")
+
+    lines = []
+    for action, (t_lines, io_lines) in by_action.items():
+        lines.append(f"  > {action}")
+        lines += sorted(t_lines)
+        lines += sorted(io_lines)
+    return lines
+
+def flush(path=STATS_FILE):
+    """Appends (and clears) everything recorded since the last flush."""
+    if not ENABLED: return
+    with _LOCK:
+        timings, io_calls = dict(_TIMINGS), dict(_IO)
+        _TIMINGS.clear()
+        _IO.clear()
+    startup, _STARTUP["report"] = _STARTUP["report"], None
+    if not timings and not io_calls and not startup: return
+
+    lines = [f"=== {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ==="]
+    if startup:
+        lines += ["--- Startup cProfile (cumulative) ---", startup, ""]
+    lines += _format_section(timings, io_calls)
+
+    try:
+        _rotate(path)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n\n")
+    except OSError as e:
+        print(f"Profiler Error: {e}")
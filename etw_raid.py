@@ -4,7 +4,10 @@ import copy
 
 # Foundation
 import etw_config as config
-import etw_io as io
+import etw_profiler as profiler
+import etw_save_manager as save_manager
+import etw_content as registry
+import etw_buffs as buffs
 
 # Sub-Systems
 import etw_bridge as bridge
@@ -47,8 +50,8 @@ def _process_raid_return_shared(save_data, duration):
     cycle = save_data.get("day_cycle", 0) + 1
     save_data["day_cycle"] = cycle
     
-    # Load modifier config fresh to avoid state stale issues
-    conf = io.load_json(config.PATHS["content_raids"])
+    # Registry re-parses on edit, so the modifier list is never stale
+    conf = registry.get_content("content_raids")
     mods = list(conf.get("raid_modifiers", {}).keys())
     if mods:
         new_mod = random.choice(mods)
@@ -57,7 +60,7 @@ def _process_raid_return_shared(save_data, duration):
     # 5. Refresh Board
     tasks.refresh_taskboard(save_data) 
     
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
 
 def _get_companion_context(save_data):
     """
@@ -95,6 +98,7 @@ def _get_companion_context(save_data):
 # RAID START
 # ----------------------------------------------------------------------
 
+@profiler.timed
 def process_raid_start(save_data):
     """
     Sets up the raid state and prepares commands. 
@@ -114,11 +118,11 @@ def process_raid_start(save_data):
     }
     
     # 2. Setup Extractions
-    pool_data = io.load_json(config.PATHS["world_pool"], {})
+    pool_data = registry.get_content("world_pool", {})
     extractions_pool = pool_data.get("extractions", [])
     
     mod_id = save_data.get("current_raid_modifier")
-    raids_content = io.load_json(config.PATHS["content_raids"])
+    raids_content = registry.get_content("content_raids")
     mod = raids_content.get("raid_modifiers", {}).get(mod_id, {})
     
     # Modifier: Extraction Count
@@ -131,10 +135,11 @@ def process_raid_start(save_data):
             num_extracts = random.randint(ext_effect.get("min", 6), ext_effect.get("max", 8))
             
     if extractions_pool: 
-        save_data["current_extractions"] = random.sample(
+        # Deep copy: registry content is shared and must not leak into save_data
+        save_data["current_extractions"] = copy.deepcopy(random.sample(
             extractions_pool, 
             min(len(extractions_pool), num_extracts)
-        )
+        ))
     
     # Modifier: Wasteland in Need
     if mod_id == "wasteland_in_need":
@@ -156,11 +161,15 @@ def process_raid_start(save_data):
         save_data["original_threat_level"] = save_data.get("threat_level", 1)
         save_data["threat_level"] = 5
     
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     
     # 3. Logic for Departure (UPDATED)
     # Load Departures Config
-    departures_map = io.load_json(config.PATHS["content_departures"], {})
+    departures_map = registry.get_content("content_departures", {})
+    
+    # Flat list format: the same departure points serve every tier
+    if isinstance(departures_map, list):
+        departures_map = {"Easy": departures_map}
     
     # Determine Difficulty Tier
     selected_diff = save_data.get("raid_difficulty_selection", "Easy")
@@ -180,7 +189,7 @@ def process_raid_start(save_data):
     # Store Location info for UI Transition Screen
     save_data["current_raid_location_name"] = start_point["name"]
     save_data["current_raid_difficulty"] = selected_diff
-    io.save_json(config.PATHS["save_data"], save_data) # Resave for UI access
+    save_manager.mark_dirty(save_data) # Resave for UI access
     
     game_path = save_data.get("game_install_path", "")
     
@@ -252,7 +261,7 @@ def prepare_death(save_data):
         "event": "raid_end", "success": False, "death_occurred": True, "duration": duration
     }
     companions.check_milestones(save_data, ms_context)
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.commit(save_data) # Critical: Death is a commit point
     
     mins = int(duration // 60)
     secs = int(duration % 60)
@@ -298,11 +307,23 @@ def _aggregate_extraction_rewards(raid_rewards, accumulated_rewards):
         
     return master
 
+@profiler.timed
 def prepare_extraction(save_data, is_sos=False):
     """
     Step 1 of Extract: Aggregates Rewards, Sends BIG BATCH, Waits for Echo.
     If Echo is confirmed -> Commits to Save Data.
     UPDATED: Handles Difficulty Scaling Multipliers.
+    Blocking; the App runs the three phases separately so that only
+    send_extraction_batch leaves the Tk thread.
+    """
+    plan = plan_extraction(save_data, is_sos)
+    return commit_extraction(save_data, plan, send_extraction_batch(plan))
+
+@profiler.timed
+def plan_extraction(save_data, is_sos=False):
+    """
+    Phase 1 (Tk thread): settles tasks and rolls rewards into the master
+    package. Returns the plan; nothing is sent to the game yet.
     """
     # 1. Apply Difficulty Bonuses (Inject Fortune BEFORE calculation if VeryHard)
     difficulty = save_data.get("raid_difficulty_selection", "Easy")
@@ -312,6 +333,7 @@ def prepare_extraction(save_data, is_sos=False):
         # Inject temporary buff for calculation logic
         temp_fortune_buff = {"id": "temp_vh_fortune", "name": "High Stakes (+1 Fortune)"}
         save_data["active_buffs"].append(temp_fortune_buff)
+        buffs.invalidate_modifiers()
         # Note: We do NOT save_json here, this is ephemeral for math logic
         
     # 2. Calculate Metrics (Read-Only Logic)
@@ -327,10 +349,11 @@ def prepare_extraction(save_data, is_sos=False):
     # 3. Clean up Temporary Buff
     if temp_fortune_buff:
         save_data["active_buffs"].remove(temp_fortune_buff)
+        buffs.invalidate_modifiers()
         # Still do not save yet
     
     # 4. Apply Modifier Bonuses
-    raids_content = io.load_json(config.PATHS["content_raids"])
+    raids_content = registry.get_content("content_raids")
     mod_id = save_data.get("current_raid_modifier")
     mod = raids_content.get("raid_modifiers", {}).get(mod_id, {})
     reward_effect = mod.get("effects", {}).get("reward")
@@ -377,16 +400,36 @@ def prepare_extraction(save_data, is_sos=False):
     for it in master_pkg["items"]: 
         big_batch_cmds.append(f"player.additem {it['code']} {it['qty']}")
         
+    return {
+        "game_path": save_data.get("game_install_path", ""),
+        "cmds": big_batch_cmds,
+        "master_pkg": master_pkg,
+        "completion_metrics": completion_metrics,
+        "duration": duration,
+        "is_sos": is_sos
+    }
+
+def send_extraction_batch(plan):
+    """
+    Phase 2 (safe on a worker thread; reads only the plan):
+    sends the BIG BATCH and returns whether the game echoed it.
+    """
     # 8. EXECUTE WITH VERIFICATION (The Echo)
-    game_path = save_data.get("game_install_path", "")
-    verification_success = False
-    
-    if game_path:
-        # This call BLOCKS until confirmed or timeout
-        verification_success = bridge.execute_batch_with_verification(game_path, big_batch_cmds)
-    else:
-        # Debug mode fallback
-        verification_success = True 
+    if not plan["game_path"]:
+        return True # Debug mode fallback
+    # This call BLOCKS until confirmed or timeout
+    return bridge.execute_batch_with_verification(plan["game_path"], plan["cmds"])
+
+@profiler.timed
+def commit_extraction(save_data, plan, verification_success):
+    """
+    Phase 3 (Tk thread): commits the verified rewards and returns the
+    raid-end context, or an ERROR context if the echo never came.
+    """
+    master_pkg = plan["master_pkg"]
+    completion_metrics = plan["completion_metrics"]
+    duration = plan["duration"]
+    is_sos = plan["is_sos"]
 
     # 9. DECISION POINT
     if not verification_success:
@@ -429,7 +472,7 @@ def prepare_extraction(save_data, is_sos=False):
     companions.check_milestones(save_data, ms_context)
     loot.log_reward_history(save_data, "Raid Extraction", master_pkg)
     
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.commit(save_data) # Critical: Verified rewards must hit disk
     
     # 11. Return Success Context
     mins = int(duration // 60)
@@ -1,9 +1,8 @@
-import os
 import time
 
 # Foundation
 import etw_config as config
-import etw_io as io
+import etw_save_manager as save_manager
 
 # Sub-Systems
 import etw_bridge as bridge
@@ -29,9 +28,6 @@ def perform_teleport_home(save_data):
     # Critical: Teleport must be the ONLY command in its batch
     # This now uses the global verification bridge, which is fine for teleport too
     bridge.process_game_commands(game_path, [cmd])
-    
-    # Wait for AHK execution
-    bridge.wait_for_ahk()
 
 # ----------------------------------------------------------------------
 # DEATH SEQUENCE (GRANULAR STEPS)
@@ -48,12 +44,24 @@ def execute_death_step_1_scan(save_data):
     bridge.trigger_inventory_scan(game_path)
     
     # TIMING FIX: Smart Poll
-    log_path = os.path.join(game_path, config.INVENTORY_LOG_FILENAME)
-    bridge.await_file_creation(log_path, timeout=5.0)
+    # (the parsed scan is cached, so the sync below doesn't read it again)
+    bridge.read_scan(game_path, timeout=5.0)
     
     # Now safe to parse
     inventory.perform_full_inventory_sync(save_data)
 
+async def execute_death_step_1_scan_async(save_data):
+    """
+    Step 1 for the raid-end screen (Tk-driven event loop): awaits the scan
+    instead of blocking, then syncs on the calling thread.
+    """
+    game_path = save_data.get("game_install_path", "")
+    if not game_path: return
+
+    scan = await bridge.scan(game_path, timeout=5.0)
+    if scan is not None:
+        inventory.perform_full_inventory_sync(save_data, scan)
+
 def execute_death_step_2_losses(save_data):
     """
     Step 2: Calculate & Remove Losses.
@@ -66,14 +74,13 @@ def execute_death_step_2_losses(save_data):
     
     # Clear Insurance (Consumed on death to save items)
     save_data["insured_items"] = []
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.commit(save_data)
     
     if removed_items_data:
         inventory.update_local_inventory(save_data, removed_items=removed_items_data)
 
     if removal_cmds:
         bridge.process_game_commands(game_path, removal_cmds)
-        bridge.wait_for_ahk()
 
 def execute_death_step_3_debuff(save_data):
     """
@@ -83,7 +90,6 @@ def execute_death_step_3_debuff(save_data):
     if not game_path: return
 
     buff_manager.remove_companion_buffs(save_data)
-    bridge.wait_for_ahk()
 
 def execute_death_step_4_teleport(save_data):
     """
@@ -115,13 +121,12 @@ def execute_extraction_step_2_debuff(save_data):
     """
     # UPDATED: Clear Insurance (Consumed on extraction too, per "1 raid" rule)
     save_data["insured_items"] = []
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
 
     game_path = save_data.get("game_install_path", "")
     if not game_path: return
 
     buff_manager.remove_companion_buffs(save_data)
-    bridge.wait_for_ahk()
 
 def execute_extraction_step_3_teleport(save_data):
     """
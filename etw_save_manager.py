@@ -0,0 +1,386 @@
+import json
+import os
+import time
+import atexit
+import threading
+
+# Foundation Modules
+import etw_config as config
+import etw_io as io
+
+# ----------------------------------------------------------------------
+# SAVE MANAGER (Dirty Tracking + Coalescing Writer)
+# ----------------------------------------------------------------------
+# Gameplay code calls mark_dirty(save_data) after every mutation.
+# Writes landing within COALESCE_WINDOW are merged into a single disk write,
+# which runs on a background thread so the Tk main thread never blocks on I/O.
+#
+# Critical commit points (extraction, death, quitting) call commit(), which
+# writes synchronously with an fsync'd atomic replace.
+#
+# JOURNAL MODE: Frequent small mutations call journal_changes() instead.
+# Each changed value is appended to a sidecar write-ahead log
+# (save_data.json.journal) and the full save is only rewritten during
+# periodic compaction. load_save_data replays the journal on startup.
+
+COALESCE_WINDOW = 0.5   # Seconds to wait for further mutations before writing
+RETRY_DELAY = 2.0       # Backoff after a failed background write
+
+JOURNAL_ENABLED = True
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_FSYNC = False            # OS buffers survive an app crash; True = power-loss safe
+COMPACTION_INTERVAL = 30.0       # Seconds between full rewrites while journaling
+COMPACTION_MAX_RECORDS = 500     # Compact early once the journal grows this long
+
+PERSIST_ENABLED = True           # False = track state in memory only (headless simulator)
+
+_STATE_LOCK = threading.Lock()   # Guards _PENDING and _WRITER_THREAD
+_WRITE_LOCK = threading.Lock()   # Serializes actual file writes
+_JOURNAL_LOCK = threading.Lock() # Guards journal appends vs. rotation
+
+_PENDING = {
+    "data": None,        # Latest save_data reference
+    "generation": 0,     # Bumped on every mark_dirty/commit
+    "written": 0,        # Generation last persisted to disk
+    "deadline": 0.0,     # Earliest time the background writer may flush
+    "journal_records": 0 # Records appended since the last compaction
+}
+_WRITER_THREAD = None
+
+def _save_path():
+    return config.PATHS["save_data"]
+
+def _journal_path():
+    return _save_path() + JOURNAL_SUFFIX
+
+def _rotated_journal_path():
+    return _journal_path() + ".old"
+
+# ----------------------------------------------------------------------
+# INTERNALS
+# ----------------------------------------------------------------------
+
+def _serialize(data, attempts=5):
+    """
+    Serializes save_data off the main thread.
+    The Tk thread may mutate the dict mid-dump; retry on 'changed size' errors.
+    Any torn snapshot is superseded by the mark_dirty() that follows the mutation.
+    """
+    for _ in range(attempts):
+        try:
+            return json.dumps(data, indent=4)
+        except RuntimeError:
+            time.sleep(0.01)
+        except Exception as e:
+            print(f"[SaveManager] Serialize Error: {e}")
+            return None
+    return None
+
+def _rotate_journal():
+    """
+    Moves the live journal aside before a snapshot is taken.
+    Records appended after this point land in a fresh journal and are
+    replayed on top of the snapshot, so nothing is lost mid-compaction.
+    """
+    live = _journal_path()
+    rotated = _rotated_journal_path()
+    
+    with _JOURNAL_LOCK:
+        if not os.path.exists(live): return
+        try:
+            if os.path.exists(rotated):
+                # A previous compaction failed; keep its records in order
+                with open(live, "r", encoding="utf-8") as src, open(rotated, "a", encoding="utf-8") as dst:
+                    dst.write(src.read())
+                os.remove(live)
+            else:
+                os.replace(live, rotated)
+        except OSError as e:
+            print(f"[SaveManager] Journal Rotate Error: {e}")
+        
+        with _STATE_LOCK:
+            _PENDING["journal_records"] = 0
+
+def _write_pending(fsync):
+    """
+    Writes the latest pending snapshot if it has not been persisted yet.
+    A successful full write doubles as journal compaction.
+    Returns True if the file on disk is up to date.
+    """
+    with _WRITE_LOCK:
+        with _STATE_LOCK:
+            data = _PENDING["data"]
+            generation = _PENDING["generation"]
+            if generation == _PENDING["written"]:
+                return True
+
+        _rotate_journal()
+        text = _serialize(data)
+        ok = text is not None and io.save_text(_save_path(), text, fsync=fsync)
+
+        if ok and os.path.exists(_rotated_journal_path()):
+            try: os.remove(_rotated_journal_path())
+            except OSError: pass
+
+        with _STATE_LOCK:
+            if ok:
+                _PENDING["written"] = max(_PENDING["written"], generation)
+            else:
+                _PENDING["deadline"] = time.time() + RETRY_DELAY
+        return ok
+
+def _writer_loop():
+    """
+    Background thread. Sleeps until the coalescing deadline, then writes.
+    Exits once everything is persisted (restarted by the next mark_dirty).
+    """
+    global _WRITER_THREAD
+
+    while True:
+        with _STATE_LOCK:
+            if _PENDING["generation"] == _PENDING["written"]:
+                _WRITER_THREAD = None
+                return
+            delay = _PENDING["deadline"] - time.time()
+
+        if delay > 0:
+            time.sleep(delay)
+            continue
+
+        _write_pending(fsync=False)
+
+# ----------------------------------------------------------------------
+# PUBLIC API
+# ----------------------------------------------------------------------
+
+def _schedule_write(save_data, window):
+    """
+    Registers a pending write no later than 'window' seconds from now.
+    An already-open window is never pushed back, only pulled in.
+    """
+    global _WRITER_THREAD
+
+    with _STATE_LOCK:
+        deadline = time.time() + window
+        if _PENDING["generation"] == _PENDING["written"]:
+            _PENDING["deadline"] = deadline
+        else:
+            _PENDING["deadline"] = min(_PENDING["deadline"], deadline)
+        _PENDING["data"] = save_data
+        _PENDING["generation"] += 1
+
+        if _WRITER_THREAD is None or not _WRITER_THREAD.is_alive():
+            _WRITER_THREAD = threading.Thread(target=_writer_loop, daemon=True)
+            _WRITER_THREAD.start()
+
+def _track_only(save_data):
+    """
+    Persistence disabled: remember the live dict, never touch the disk.
+    """
+    with _STATE_LOCK:
+        _PENDING["data"] = save_data
+    return True
+
+def mark_dirty(save_data):
+    """
+    Flags save_data as modified. The write happens later on the writer thread.
+    Returns True (kept compatible with io.save_json call sites).
+    """
+    if not PERSIST_ENABLED:
+        return _track_only(save_data)
+    _schedule_write(save_data, COALESCE_WINDOW)
+    return True
+
+# ----------------------------------------------------------------------
+# JOURNAL (Write-Ahead Log)
+# ----------------------------------------------------------------------
+
+def _step(obj, key):
+    """
+    One path step: a dict key / list index, or a {field: value} selector
+    that matches the list entry carrying that value (KeyError if none does).
+    """
+    if isinstance(key, dict):
+        for entry in obj:
+            if all(entry.get(f) == v for f, v in key.items()):
+                return entry
+        raise KeyError(key)
+    return obj[key]
+
+def _read_path(save_data, path):
+    obj = save_data
+    for key in path:
+        obj = _step(obj, key)
+    return obj
+
+def _append_records(save_data, records):
+    """Writes journal records and schedules the next compaction."""
+    if not records:
+        return True
+    try:
+        lines = [json.dumps(r) for r in records]
+        with _JOURNAL_LOCK:
+            with open(_journal_path(), "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                if JOURNAL_FSYNC:
+                    os.fsync(f.fileno())
+    except (OSError, TypeError, ValueError) as e:
+        print(f"[SaveManager] Journal Write Error: {e}")
+        return mark_dirty(save_data)
+
+    with _STATE_LOCK:
+        _PENDING["journal_records"] += len(lines)
+        full = _PENDING["journal_records"] >= COMPACTION_MAX_RECORDS
+
+    _schedule_write(save_data, 0.0 if full else COMPACTION_INTERVAL)
+    return True
+
+def journal_changes(save_data, *paths):
+    """
+    Appends the CURRENT value at each path to the journal, then schedules
+    a compaction instead of an immediate full rewrite.
+    A path is a top-level key or a tuple of steps, e.g. "scrip" or
+    ("tasks", {"task_number": 7}, "objectives", 1, 3). List entries that can
+    move (accept, reroll, removal) must be addressed by such a selector,
+    never by index; a record whose entry is gone is skipped on replay.
+    Records are absolute values, so replaying one twice is harmless.
+    """
+    if not PERSIST_ENABLED or not JOURNAL_ENABLED:
+        return mark_dirty(save_data)
+
+    records = []
+    try:
+        for path in paths:
+            if isinstance(path, str): path = (path,)
+            records.append({"p": list(path), "v": _read_path(save_data, path), "t": time.time()})
+    except (KeyError, IndexError, TypeError) as e:
+        print(f"[SaveManager] Journal path error ({e}). Falling back to full save.")
+        return mark_dirty(save_data)
+    return _append_records(save_data, records)
+
+def journal_append(save_data, path, value, limit=None, key="seq"):
+    """
+    Journals one dict entry appended to the list at `path` (trimmed to its
+    last `limit` entries). value[key] must be unique within the list: replay
+    skips the record if an entry with that id is already there, so two equal
+    entries (same source, minute and amounts) both survive.
+    """
+    if not PERSIST_ENABLED or not JOURNAL_ENABLED:
+        return mark_dirty(save_data)
+    if not isinstance(value, dict) or value.get(key) is None:
+        print(f"[SaveManager] Journal append without '{key}'. Falling back to full save.")
+        return mark_dirty(save_data)
+    if isinstance(path, str): path = (path,)
+    record = {"p": list(path), "v": value, "t": time.time(), "append": limit or 0, "key": key}
+    return _append_records(save_data, [record])
+
+def _apply_record(save_data, record):
+    path = record.get("p") or []
+    if not path: return False
+    try:
+        if "append" in record:
+            target = _read_path(save_data, path)
+            value = record.get("v")
+            key = record.get("key")
+            if key:
+                if any(isinstance(e, dict) and e.get(key) == value.get(key) for e in target):
+                    return False
+            elif value in target:
+                return False # Pre-id record: best effort
+            target.append(value)
+            limit = record["append"]
+            if limit and len(target) > limit:
+                del target[:-limit]
+            return True
+
+        parent = _read_path(save_data, path[:-1])
+        key = path[-1]
+        if isinstance(parent, list):
+            parent[key] = record.get("v")
+        else:
+            parent[str(key)] = record.get("v")
+        return True
+    except (KeyError, IndexError, TypeError):
+        return False
+
+def replay_journal(save_data):
+    """
+    Re-applies journal records written after the last compaction.
+    Called by load_save_data right after the snapshot is read.
+    Returns the number of records applied.
+    """
+    applied = 0
+    for path in (_rotated_journal_path(), _journal_path()):
+        if not os.path.exists(path): continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line: continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn final line from a crash mid-append
+                        continue
+                    if _apply_record(save_data, record):
+                        applied += 1
+        except OSError as e:
+            print(f"[SaveManager] Journal Replay Error: {e}")
+    return applied
+
+def get_live_data():
+    """
+    Returns the most recent save_data passed to mark_dirty/commit (or None).
+    Lets helpers read settings without re-parsing the file from disk.
+    """
+    with _STATE_LOCK:
+        return _PENDING["data"]
+
+def is_dirty():
+    with _STATE_LOCK:
+        return _PENDING["generation"] != _PENDING["written"]
+
+def flush():
+    """
+    Synchronously persists any pending changes (fsync'd).
+    Call before reading save_data.json back from disk.
+    """
+    if not is_dirty():
+        return True
+    return _write_pending(fsync=True)
+
+def discard():
+    """
+    Drops pending changes without writing them (save reset).
+    Waits out an in-flight write, so call it BEFORE deleting save_data.json;
+    afterwards neither the writer thread nor the atexit flush has anything to write.
+    Both journal files are deleted too, so nothing replays onto the next save.
+    """
+    with _WRITE_LOCK:
+        with _STATE_LOCK:
+            _PENDING["data"] = None
+            _PENDING["written"] = _PENDING["generation"]
+            _PENDING["journal_records"] = 0
+        
+        with _JOURNAL_LOCK:
+            for path in (_rotated_journal_path(), _journal_path()):
+                try:
+                    if os.path.exists(path): os.remove(path)
+                except OSError as e:
+                    print(f"[SaveManager] Journal Delete Error: {e}")
+
+def commit(save_data):
+    """
+    Critical commit point (Extraction, Death, Quit).
+    Writes immediately with an fsync'd atomic replace. Returns success bool.
+    """
+    if not PERSIST_ENABLED:
+        return _track_only(save_data)
+    with _STATE_LOCK:
+        _PENDING["data"] = save_data
+        _PENDING["generation"] += 1
+    return _write_pending(fsync=True)
+
+# Daemon writer dies with the interpreter; make sure the last window lands.
+atexit.register(flush)
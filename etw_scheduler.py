@@ -0,0 +1,102 @@
+import heapq
+import itertools
+import sys
+import time
+
+# ----------------------------------------------------------------------
+# EVENT SCHEDULER (Deadline Heap on a single Tk after() job)
+# ----------------------------------------------------------------------
+# Callers register named events with an absolute deadline. Only the
+# earliest deadline owns a pending Tk after() job; when it fires, every due
+# event runs and the job is re-armed for the next deadline. With nothing
+# scheduled the scheduler is fully idle (no timer wakes the Tk loop).
+#
+# Keys are unique: scheduling an existing key replaces its deadline.
+# Replaced/cancelled heap entries are dropped lazily when they surface.
+
+MIN_DELAY_MS = 1   # after(0) would starve idle tasks if a callback re-arms at once
+
+class EventScheduler:
+    """Named one-shot deadlines multiplexed onto one after() job."""
+
+    def __init__(self, root):
+        self.root = root
+        self._heap = []              # (deadline, seq, key)
+        self._events = {}            # key -> (deadline, seq, callback)
+        self._seq = itertools.count()
+        self._job = None
+        self._job_deadline = None
+
+    # --- Registration ---
+
+    def schedule_at(self, key, deadline, callback):
+        """Runs callback() at wall time `deadline` (time.time() based)."""
+        seq = next(self._seq)
+        self._events[key] = (deadline, seq, callback)
+        heapq.heappush(self._heap, (deadline, seq, key))
+        self._arm()
+
+    def schedule_in(self, key, delay, callback):
+        """Runs callback() `delay` seconds from now."""
+        self.schedule_at(key, time.time() + max(0.0, delay), callback)
+
+    def cancel(self, key):
+        if self._events.pop(key, None) is not None:
+            self._arm()
+
+    def is_scheduled(self, key):
+        return key in self._events
+
+    def deadline(self, key):
+        entry = self._events.get(key)
+        return entry[0] if entry else None
+
+    # --- Internals ---
+
+    def _peek(self):
+        """Earliest live heap entry (discarding stale ones), or None."""
+        heap = self._heap
+        while heap:
+            deadline, seq, key = heap[0]
+            entry = self._events.get(key)
+            if entry is not None and entry[1] == seq:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def _arm(self):
+        head = self._peek()
+        target = head[0] if head else None
+        if target == self._job_deadline and (self._job is not None or target is None):
+            return
+
+        if self._job is not None:
+            try: self.root.after_cancel(self._job)
+            except Exception: pass
+            self._job = None
+        self._job_deadline = target
+
+        if target is not None:
+            delay_ms = max(MIN_DELAY_MS, int(round((target - time.time()) * 1000)))
+            self._job = self.root.after(delay_ms, self._fire)
+
+    def _fire(self):
+        self._job = None
+        self._job_deadline = None
+        now = time.time()
+
+        due = []
+        while True:
+            head = self._peek()
+            if head is None or head[0] > now: break
+            heapq.heappop(self._heap)
+            _, _, callback = self._events.pop(head[2])
+            due.append(callback)
+
+        # Re-arm before running callbacks so a failing one cannot stall the rest.
+        self._arm()
+        for callback in due:
+            try:
+                callback()
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
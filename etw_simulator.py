@@ -0,0 +1,361 @@
+import argparse
+import concurrent.futures
+import json
+import os
+import random
+import time
+
+# Foundation
+import etw_save_manager as save_manager
+import etw_content as registry
+import etw_buffs as buffs
+import etw_stations as catalog
+
+# Core Systems (same import order as ETW_App, avoids circular import surprises)
+import etw_engine as engine
+import etw_raid as raid
+import etw_bridge as bridge
+import etw_tasks as tasks
+import etw_fence as fence
+import etw_hideout as hideout
+import etw_companions as companions
+import etw_stats as stats
+
+# ----------------------------------------------------------------------
+# HEADLESS ECONOMY SIMULATOR
+# ----------------------------------------------------------------------
+# Plays thousands of in-game days through the real raid/task/loot/fence/hideout
+# logic without Tk or the game bridge, then reports per-day distributions.
+#
+#   python etw_simulator.py --runs 500 --days 60 --workers 8 --seed 1
+#
+# Nothing touches the player's files: the bridge is stubbed out, save_data
+# lives in memory (save_manager.PERSIST_ENABLED = False) and the fence shop
+# is kept in a per-process dict instead of fence_shop.json.
+# Each run reseeds the global RNG from (seed + run index), so results do not
+# depend on the worker count.
+
+# Player behaviour model. Death/objective odds stand in for actual gameplay.
+DEFAULT_POLICY = {
+    "death_base": 0.10,           # Death chance per raid at threat 0
+    "death_per_threat": 0.05,     # Added per threat level
+    "difficulty_death": {"Easy": 0.0, "Medium": 0.05, "Hard": 0.10, "VeryHard": 0.15},
+    "objective_success": {"easy": 0.85, "medium": 0.65, "hard": 0.45},
+    "raid_minutes": (15.0, 45.0), # Uniform raid length
+    "town_minutes": 20.0,         # Hideout production time between raids
+    "max_difficulty": "VeryHard", # Highest tier the player will pick
+    "fence_sells": 2,             # Best-paying sell slots used per day
+    "buy_upgrades": True          # Spend scrip on board/slot/hideout upgrades
+}
+
+# Mirrors the gates in etw_ui_town._select_difficulty (highest first)
+DIFFICULTY_REP_GATES = (("VeryHard", 6), ("Hard", 4), ("Medium", 2), ("Easy", 0))
+
+METRICS = ("scrip", "xp", "reputation", "threat", "hideout_levels", "extract_rate")
+PERCENTILES = (10, 50, 90)
+
+_FENCE_STATE = {"shop": None}
+
+# ----------------------------------------------------------------------
+# HEADLESS STUBS
+# ----------------------------------------------------------------------
+
+def _stub_commands(game_path, cmds, ahk_path=None, *args, **kwargs):
+    return True
+
+def _stub_submit(game_path, cmds, ahk_path=None, *args, **kwargs):
+    future = concurrent.futures.Future()
+    future.set_result(True)
+    return future
+
+def _stub_noop(*args, **kwargs):
+    return None
+
+def _stub_load_fence_shop():
+    return _FENCE_STATE["shop"]
+
+def _stub_save_fence_shop(data):
+    _FENCE_STATE["shop"] = data
+
+def install_headless_stubs():
+    """
+    Replaces every bridge/disk side effect with an in-memory stand-in.
+    Runs in the parent and in every worker (spawn-safe).
+    """
+    save_manager.PERSIST_ENABLED = False
+
+    bridge.process_game_commands = _stub_commands
+    bridge.submit_batch = _stub_submit
+    bridge.execute_batch_with_verification = _stub_commands
+    bridge.run_console_command = _stub_noop
+    bridge.trigger_stat_scan = _stub_noop
+    bridge.trigger_baseline_scan = _stub_noop
+    bridge.trigger_inventory_scan = _stub_noop
+    bridge.trigger_position_dump = _stub_noop
+    bridge.read_baseline_scan = _stub_noop
+    bridge.read_scan = _stub_noop
+    bridge.read_player_position = _stub_noop
+    bridge.await_file_creation = _stub_noop
+    bridge.wait_for_ahk = _stub_noop
+
+    fence.load_fence_shop = _stub_load_fence_shop
+    fence.save_fence_shop = _stub_save_fence_shop
+
+# ----------------------------------------------------------------------
+# SIMULATED PLAYER
+# ----------------------------------------------------------------------
+
+def new_sim_save():
+    """
+    Fresh character with the hideout and shop already unlocked
+    (their unlock quests are story gates, not economy).
+    """
+    save_data = engine.get_default_save_data()
+    save_data["hideout_unlocked"] = True
+    save_data["shop_unlocked"] = True
+
+    companions.initialize_companion_state(save_data)
+    hideout.generate_station_costs(save_data)
+
+    mods = list(registry.get_content("content_raids").get("raid_modifiers", {}).keys())
+    if mods:
+        save_data["current_raid_modifier"] = random.choice(mods)
+
+    tasks.refresh_taskboard(save_data)
+    save_manager.mark_dirty(save_data) # Registers the live dict for engine helpers
+    return save_data
+
+def _pick_difficulty(save_data, policy):
+    """Highest tier the reputation allows, capped by the policy."""
+    rep = stats.compute_reputation(save_data)
+    names = [name for name, _ in DIFFICULTY_REP_GATES]
+    allowed = names[names.index(policy["max_difficulty"]):]
+    
+    for name, req_rep in DIFFICULTY_REP_GATES:
+        if name in allowed and rep >= req_rep:
+            return name
+    return "Easy"
+
+def _buy_task_upgrades(save_data):
+    cost = tasks.get_next_slot_cost(save_data)
+    if cost is not None and save_data["scrip"] >= cost:
+        save_data["scrip"] -= cost
+        save_data["unlocked_task_slots"] = save_data.get("unlocked_task_slots", 1) + 1
+
+    cost = tasks.get_next_pool_cost(save_data)
+    if cost is not None and save_data["scrip"] >= cost:
+        save_data["scrip"] -= cost
+        save_data["unlocked_task_pool_size"] = save_data.get("unlocked_task_pool_size", 3) + 1
+
+def _upgrade_cheapest_station(save_data):
+    """
+    Buys the cheapest affordable station level (scrip only; material costs
+    are assumed scavenged, as the simulator has no game inventory).
+    Mirrors etw_ui_hideout._attempt_upgrade.
+    """
+    stations = save_data["hideout_stations"]
+    best = None
+
+    for station in catalog.get_catalog().values():
+        s_id = station.id
+        target = stations.get(s_id, {}).get("level", 0) + 1
+        lvl_conf = station.level(target)
+        if not lvl_conf: continue
+
+        ok, _ = hideout.check_station_requirements(s_id, target, save_data)
+        cost = lvl_conf.cost_scrip
+        if ok and cost <= save_data["scrip"] and (best is None or cost < best[2]):
+            best = (s_id, target, cost)
+
+    if not best: return
+
+    s_id, target, cost = best
+    save_data["scrip"] -= cost
+    data = stations.setdefault(s_id, {})
+    data["level"] = target
+    data["progress"] = 0.0
+    data["storage"] = 0
+    data.setdefault("active_slots", [])
+    buffs.invalidate_modifiers()
+
+def _town_phase(save_data, policy):
+    # Hideout: collect passive output, then spend
+    for s_id, data in list(save_data["hideout_stations"].items()):
+        if data.get("storage", 0) > 0:
+            hideout.claim_production(save_data, s_id)
+
+    if policy["buy_upgrades"]:
+        _buy_task_upgrades(save_data)
+        _upgrade_cheapest_station(save_data)
+
+    # Fence: fresh stock every day, sell the best-paying slots
+    fence.refresh_shop(save_data)
+    shop = _FENCE_STATE["shop"]
+    ranked = sorted(
+        (i for i, s in enumerate(shop["sell_slots"]) if s),
+        key=lambda i: shop["sell_slots"][i]["total_scrip_cost"], reverse=True
+    )
+    for idx in ranked[:policy["fence_sells"]]:
+        fence.perform_fence_sell(save_data, idx)
+
+    # Contracts: fill every open slot from the board
+    for t in list(save_data.get("taskboard_pool", [])):
+        res = tasks.accept_task_from_board(t["task_number"], save_data)
+        if not res["success"]: break
+
+    hideout.update_hideout_timers(save_data, policy["town_minutes"])
+
+def _raid_phase(save_data, policy):
+    """
+    Runs one raid through etw_raid. Returns True on extraction.
+    """
+    difficulty = _pick_difficulty(save_data, policy)
+    save_data["raid_difficulty_selection"] = difficulty
+    raid.process_raid_start(save_data)
+
+    # Backdate the start so duration-based rewards see a real raid length
+    lo, hi = policy["raid_minutes"]
+    save_data["last_raid_start_timestamp"] = time.time() - random.uniform(lo, hi) * 60.0
+
+    threat = save_data.get("threat_level", 1)
+    death_chance = policy["death_base"] + threat * policy["death_per_threat"]
+    death_chance += policy["difficulty_death"].get(difficulty, 0.0)
+
+    if random.random() < death_chance:
+        raid.prepare_death(save_data)
+        raid.execute_death_sequence(save_data)
+        return False
+
+    odds = policy["objective_success"]
+    for t in save_data.get("tasks", []):
+        if random.random() < odds.get(t.get("difficulty", "easy"), 0.5):
+            t["ready_to_complete"] = True
+
+    ctx = raid.prepare_extraction(save_data)
+    if ctx.get("outcome") != "EXTRACTED":
+        return False
+    raid.execute_extraction_sequence(save_data, ctx)
+    return True
+
+def _snapshot(save_data, extracted):
+    return {
+        "scrip": save_data.get("scrip", 0),
+        "xp": save_data.get("current_xp", 0),
+        "reputation": round(stats.compute_reputation(save_data), 3),
+        "threat": save_data.get("threat_level", 0),
+        "hideout_levels": sum(s.get("level", 0) for s in save_data["hideout_stations"].values()),
+        "extract_rate": 1.0 if extracted else 0.0
+    }
+
+def simulate_run(run_index, days, seed, policy):
+    """
+    One full playthrough. Returns a list of per-day metric snapshots.
+    """
+    random.seed(seed + run_index)
+    _FENCE_STATE["shop"] = None
+
+    save_data = new_sim_save()
+    history = []
+    for _ in range(days):
+        _town_phase(save_data, policy)
+        extracted = _raid_phase(save_data, policy)
+        history.append(_snapshot(save_data, extracted))
+    return history
+
+# ----------------------------------------------------------------------
+# AGGREGATION
+# ----------------------------------------------------------------------
+
+def _percentile(sorted_vals, pct):
+    """Nearest-rank percentile on a pre-sorted list."""
+    if not sorted_vals: return 0
+    k = max(0, min(len(sorted_vals) - 1, int(round(pct / 100.0 * (len(sorted_vals) - 1)))))
+    return sorted_vals[k]
+
+def summarize(histories, days):
+    """
+    Collapses run histories into per-day {metric: {mean, p10, p50, p90}}.
+    """
+    summary = []
+    for day in range(days):
+        day_stats = {"day": day + 1}
+        for metric in METRICS:
+            vals = sorted(h[day][metric] for h in histories)
+            entry = {"mean": round(sum(vals) / len(vals), 3)}
+            for p in PERCENTILES:
+                entry[f"p{p}"] = _percentile(vals, p)
+            day_stats[metric] = entry
+        summary.append(day_stats)
+    return summary
+
+def print_summary(summary, every):
+    header = f"{'DAY':>5}" + "".join(f"{m.upper():>24}" for m in METRICS)
+    print(header)
+    print(f"{'':>5}" + "".join(f"{'mean (p10/p50/p90)':>24}" for _ in METRICS))
+    print("-" * len(header))
+
+    for day_stats in summary:
+        day = day_stats["day"]
+        if day % every and day != len(summary): continue
+        row = f"{day:>5}"
+        for m in METRICS:
+            e = day_stats[m]
+            cell = f"{e['mean']:.1f} ({e['p10']:g}/{e['p50']:g}/{e['p90']:g})"
+            row += f"{cell:>24}"
+        print(row)
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+
+def run_simulation(runs, days, seed=0, workers=None, policy=None):
+    """
+    Runs 'runs' playthroughs across a process pool.
+    workers=1 stays in-process (handy for profiling).
+    Returns (histories, elapsed_seconds).
+    """
+    policy = dict(DEFAULT_POLICY, **(policy or {}))
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    if workers == 1:
+        install_headless_stubs()
+        histories = [simulate_run(i, days, seed, policy) for i in range(runs)]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=install_headless_stubs) as pool:
+            futures = [pool.submit(simulate_run, i, days, seed, policy) for i in range(runs)]
+            histories = [f.result() for f in futures]
+
+    return histories, time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless ETW economy simulator")
+    parser.add_argument("--runs", type=int, default=200, help="Independent playthroughs")
+    parser.add_argument("--days", type=int, default=30, help="Simulated days (one raid each)")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed (run i uses seed + i)")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = CPU count)")
+    parser.add_argument("--max-difficulty", default=DEFAULT_POLICY["max_difficulty"],
+                        choices=[name for name, _ in reversed(DIFFICULTY_REP_GATES)])
+    parser.add_argument("--death-base", type=float, default=DEFAULT_POLICY["death_base"])
+    parser.add_argument("--report-every", type=int, default=0, help="Print every Nth day (0 = auto)")
+    parser.add_argument("--json", dest="json_path", help="Write the full per-day summary here")
+    args = parser.parse_args(argv)
+
+    policy = {"max_difficulty": args.max_difficulty, "death_base": args.death_base}
+    histories, elapsed = run_simulation(args.runs, args.days, args.seed, args.workers or None, policy)
+    summary = summarize(histories, args.days)
+
+    every = args.report_every or max(1, args.days // 10)
+    print_summary(summary, every)
+
+    sim_days = args.runs * args.days
+    print(f"\n{args.runs} runs x {args.days} days in {elapsed:.2f}s "
+          f"({sim_days / elapsed:.0f} simulated days/s)")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"runs": args.runs, "days": args.days, "seed": args.seed, "summary": summary}, f, indent=4)
+        print(f"Summary written to {args.json_path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import math
+
+# Foundation
+import etw_content as registry
+
+# ----------------------------------------------------------------------
+# STATION CATALOG (Compiled content_hideout.json)
+# ----------------------------------------------------------------------
+# content_hideout.json is compiled once per content version into Station
+# objects with a level-indexed array of StationLevel configs, so timer ticks
+# and renderers do dict/array lookups instead of next(...) list scans.
+# Dependency-light (registry only) so etw_buffs can use it too.
+
+DEFAULT_PRODUCTION_RATE = 60
+
+_CATALOG = {"version": None, "stations": {}, "passive_buffs": []}
+
+class StationLevel:
+    """One level of a station with its derived values precomputed."""
+    __slots__ = ("level", "raw", "capacity", "production_rate", "slots",
+                 "cost_scrip", "output", "buff_type", "buff_value",
+                 "recipes", "base_yield_mult")
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.level = raw["level"]
+        self.capacity = math.ceil(self.level / 2.0)
+        self.production_rate = raw.get("production_rate", DEFAULT_PRODUCTION_RATE)
+        self.slots = raw.get("slots", 1)
+        self.cost_scrip = raw.get("cost_scrip", 0)
+        self.output = raw.get("output", {})
+        buff = raw.get("buff") or {}
+        self.buff_type = buff.get("type")
+        self.buff_value = buff.get("value", 0.0)
+        self.recipes = raw.get("recipes", [])
+        self.base_yield_mult = raw.get("base_yield_mult", 1.0)
+
+class Station:
+    """A station definition. levels[n] is the StationLevel for level n (or None)."""
+    __slots__ = ("id", "name", "type", "description", "requirement", "raw", "levels", "max_level")
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.id = raw["id"]
+        self.name = raw.get("name", self.id)
+        self.type = raw.get("type")
+        self.description = raw.get("description", "")
+        self.requirement = raw.get("requirement")
+
+        compiled = [StationLevel(l) for l in raw.get("levels", [])]
+        self.max_level = max((l.level for l in compiled), default=0)
+        self.levels = [None] * (self.max_level + 1)
+        for l in compiled:
+            if self.levels[l.level] is None: # First definition wins (matches next(...))
+                self.levels[l.level] = l
+
+    def level(self, level):
+        if 0 < level <= self.max_level:
+            return self.levels[level]
+        return None
+
+def _compile():
+    content = registry.get_content("content_hideout")
+    stations = {}
+    for s_conf in content.get("stations", []):
+        station = Station(s_conf)
+        stations.setdefault(station.id, station)
+    _CATALOG["stations"] = stations
+    _CATALOG["passive_buffs"] = [s for s in stations.values() if s.type == "passive_buff"]
+
+def _ensure_compiled():
+    version = registry.get_content_version("content_hideout")
+    if version != _CATALOG["version"]:
+        _compile()
+        _CATALOG["version"] = version
+
+# ----------------------------------------------------------------------
+# PUBLIC API
+# ----------------------------------------------------------------------
+
+def get_catalog():
+    """
+    Returns {station_id: Station} in content order (shared, do not mutate).
+    """
+    _ensure_compiled()
+    return _CATALOG["stations"]
+
+def get_station(station_id):
+    return get_catalog().get(station_id)
+
+def get_level(station_id, level):
+    """Returns the StationLevel for a station at a level, or None."""
+    station = get_station(station_id)
+    return station.level(level) if station else None
+
+def get_passive_buff_stations():
+    """Stations of type 'passive_buff', in content order."""
+    _ensure_compiled()
+    return _CATALOG["passive_buffs"]
@@ -2,8 +2,8 @@ import random
 import copy
 
 # Foundation
-import etw_config as config
-import etw_io as io
+import etw_profiler as profiler
+import etw_content as registry
 
 # Sub-Systems
 import etw_stats as stats
@@ -12,24 +12,27 @@ import etw_stats as stats
 # LOADERS
 # ----------------------------------------------------------------------
 
+# Served by the Content Registry: one stat() per call, parsed only on edit.
+
 def _load_content_tasks():
-    return io.load_json(config.PATHS["content_tasks"])
+    return registry.get_content("content_tasks")
 
 def _load_world_pool():
-    return io.load_json(config.PATHS["world_pool"])
+    return registry.get_content("world_pool")
 
 def _load_emergency_templates():
-    raids = io.load_json(config.PATHS["content_raids"])
+    raids = registry.get_content("content_raids")
     return raids.get("emergency_task_templates", [])
 
 def _load_difficulty_settings():
-    tuning = io.load_json(config.PATHS["config_tuning"])
+    tuning = registry.get_content("config_tuning")
     return tuning.get("difficulty_settings", {})
 
 # ----------------------------------------------------------------------
 # GENERATION LOGIC
 # ----------------------------------------------------------------------
 
+@profiler.timed
 def generate_task(save_data, i_offset=0, force_emergency=False, force_difficulty=None):
     """
     Generates a single, randomized task based on content pools and difficulty.
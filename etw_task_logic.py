@@ -1,6 +1,5 @@
 # Foundation
-import etw_config as config
-import etw_io as io
+import etw_save_manager as save_manager
 
 # Note: UI Modules are imported INSIDE functions to prevent Circular Dependency crashes.
 # This ensures the UI is fully loaded before we try to refresh it.
@@ -23,7 +22,7 @@ def tick_static_quest_objective(app, q_id, obj_idx):
     current_list[obj_idx] = True
     app.save_data["quest_progress"][key] = current_list
     
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    save_manager.journal_changes(app.save_data, ("quest_progress", key))
     
     # REFRESH UI
     _refresh_ui_safely(app)
@@ -69,11 +68,35 @@ def tick_dynamic_task_objective(app, task, obj_idx, is_quest=False):
         if all_done: 
             task["ready_to_complete"] = True
     
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    _journal_objective_tick(app.save_data, task, obj_idx, is_quest)
 
     # REFRESH UI
     _refresh_ui_safely(app)
 
+def _journal_objective_tick(save_data, task, obj_idx, is_quest):
+    """
+    Journals only the touched counter instead of rewriting the whole save.
+    The task is addressed by its id (quests) / task_number (contracts), not
+    its list position, so replay survives accepts, rerolls and removals.
+    Falls back to a full (coalesced) save if the task cannot be addressed.
+    """
+    list_key = "generated_side_quests" if is_quest else "tasks"
+    obj_key = "raw_objectives" if is_quest else "objectives"
+    id_key = "id" if is_quest else "task_number"
+    
+    owner = save_data.get(list_key, [])
+    task_id = task.get(id_key)
+    matches = [t for t in owner if t.get(id_key) == task_id]
+    if task_id is None or len(matches) != 1 or matches[0] is not task:
+        save_manager.mark_dirty(save_data)
+        return
+        
+    selector = {id_key: task_id}
+    paths = [(list_key, selector, obj_key, obj_idx, 3)]
+    if not is_quest and "ready_to_complete" in task:
+        paths.append((list_key, selector, "ready_to_complete"))
+    save_manager.journal_changes(save_data, *paths)
+
 # ----------------------------------------------------------------------
 # UI REFRESH HELPER
 # ----------------------------------------------------------------------
@@ -0,0 +1,146 @@
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# ----------------------------------------------------------------------
+# TASK RUNNER (Blocking Work off the Tk Thread)
+# ----------------------------------------------------------------------
+# Bridge round-trips (verified batches, position dumps, inventory scans)
+# block for seconds. Callbacks submit them here instead: the work runs on a
+# small thread pool, and its results/progress come back through a queue
+# that a Tk after() pump drains, so every callback below runs on the Tk
+# thread. The pump only runs while tasks are outstanding.
+#
+# Tasks are keyed: a key stays busy until its worker returns, and submitting
+# a busy key is refused (double clicks, re-entrant raid ticks).
+
+MAX_WORKERS = 2   # The bridge serializes batches anyway; one spare for dumps
+POLL_MS = 50      # Result pump cadence while tasks are outstanding
+
+class Task:
+    """
+    Handle for one submitted job. Workers that take it (pass_task=True) can
+    report progress and poll for cancellation.
+    """
+    def __init__(self, runner, key, on_progress):
+        self.key = key
+        self.future = None
+        self._runner = runner
+        self._on_progress = on_progress
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """
+        Drops the task's callbacks. A queued task never starts; a running one
+        finishes its current call (bridge batches cannot be recalled).
+        """
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def wait(self, seconds):
+        """Worker-side sleep. Returns True (early) if the task was cancelled."""
+        return self._cancel.wait(seconds)
+
+    def progress(self, *args):
+        """Worker-side: calls on_progress(*args) on the Tk thread."""
+        if self._on_progress and not self.cancelled():
+            self._runner._inbox.put((self, self._on_progress, args))
+
+class TaskRunner:
+    """ThreadPoolExecutor whose completions are marshalled back via root.after()."""
+
+    def __init__(self, root, max_workers=MAX_WORKERS):
+        self.root = root
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="etw-task")
+        self._inbox = queue.SimpleQueue()   # (task, callback, args) from workers
+        self._tasks = {}                    # key -> Task, until its worker returns
+        self._job = None
+
+    def submit(self, key, fn, *args, on_done=None, on_error=None, on_progress=None, pass_task=False, **kwargs):
+        """
+        Runs fn(*args, **kwargs) (or fn(task, *args, ...) with pass_task) on the pool.
+        on_done(result) / on_error(exc) / on_progress(...) run on the Tk thread.
+        Without on_error, failures go to root.report_callback_exception.
+        Returns the Task, or None if `key` is still busy.
+        """
+        if key in self._tasks:
+            return None
+
+        task = Task(self, key, on_progress)
+        call_args = (task,) + args if pass_task else args
+
+        def work():
+            try:
+                result = fn(*call_args, **kwargs)
+            except Exception:
+                self._inbox.put((task, self._settle, (task, None, on_error, sys.exc_info())))
+            else:
+                self._inbox.put((task, self._settle, (task, result, on_done, None)))
+
+        self._tasks[key] = task
+        try:
+            task.future = self._pool.submit(work)
+        except RuntimeError: # Pool already shut down (app closing)
+            del self._tasks[key]
+            return None
+        task.future.add_done_callback(lambda f: self._on_future_done(task, f))
+        self._arm()
+        return task
+
+    def is_running(self, key):
+        return key in self._tasks
+
+    def cancel(self, key):
+        task = self._tasks.get(key)
+        if task is not None:
+            task.cancel()
+
+    def shutdown(self):
+        for task in list(self._tasks.values()):
+            task.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _on_future_done(self, task, future):
+        # A future cancelled before it started never runs work(); settle it here
+        if future.cancelled():
+            self._inbox.put((task, self._settle, (task, None, None, None)))
+
+    # --- Tk side ---
+
+    def _settle(self, task, result, callback, exc_info):
+        # Frees the key first, so callbacks may resubmit it
+        if self._tasks.get(task.key) is task:
+            del self._tasks[task.key]
+        if task.cancelled():
+            return
+        if exc_info is None:
+            if callback: callback(result)
+        elif callback:
+            callback(exc_info[1])
+        else:
+            self.root.report_callback_exception(*exc_info)
+
+    def _pump(self):
+        self._job = None
+        while True:
+            try:
+                task, callback, args = self._inbox.get_nowait()
+            except queue.Empty:
+                break
+            # Settlement always runs (it frees the key); progress is dropped once cancelled
+            if task.cancelled() and callback != self._settle:
+                continue
+            try:
+                callback(*args)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+        self._arm()
+
+    def _arm(self):
+        if self._job is None and (self._tasks or not self._inbox.empty()):
+            self._job = self.root.after(POLL_MS, self._pump)
@@ -1,8 +1,7 @@
 import copy
 
 # Foundation Modules
-import etw_config as config
-import etw_io as io
+import etw_save_manager as save_manager
 
 # Sub-Systems
 import etw_companions as companions
@@ -38,7 +37,7 @@ def refresh_taskboard(save_data):
         next_id += 1
         
     save_data["taskboard_pool"] = pool
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
 
 def accept_task_from_board(task_number, save_data):
     """
@@ -59,7 +58,7 @@ def accept_task_from_board(task_number, save_data):
     pool.remove(target_task)
     save_data["tasks"].append(target_task)
     save_data["taskboard_pool"] = pool
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     
     return {"success": True, "message": "Contract Accepted"}
 
@@ -86,7 +85,7 @@ def reroll_task_on_board(task_number, save_data):
     idx = pool.index(target_task)
     pool[idx] = new_task
     
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     return True
 
 # ----------------------------------------------------------------------
@@ -194,7 +193,7 @@ def generate_companion_quest(save_data, companion_id, quest_type="recruitment"):
     if "quest_progress" not in save_data: save_data["quest_progress"] = {}
     save_data["quest_progress"][q_id] = [False] * len(objectives_list)
     
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     return quest_obj
 
 # ----------------------------------------------------------------------
@@ -232,7 +231,7 @@ def grant_task_reward(difficulty, save_data, is_emergency=False, bonus_mult=1.0,
     companions.add_companion_xp(save_data, pkg["xp"])
     
     ms_context = {"event": "task_complete", "difficulty": difficulty}
-    companions.check_milestones(save_data, ms_context)
+    slots_changed = companions.check_milestones(save_data, ms_context)
     
     # 5. [REMOVED] Deliver via Console (Direct Bridge Call)
     # The bridge call here caused race conditions. 
@@ -247,11 +246,28 @@ def grant_task_reward(difficulty, save_data, is_emergency=False, bonus_mult=1.0,
     
     # 6. Finalize
     save_data["reputation"] = stats.compute_reputation(save_data)
-    loot.log_reward_history(save_data, f"Task ({difficulty.capitalize()})", pkg)
-    io.save_json(config.PATHS["save_data"], save_data)
+    entry = loot.log_reward_history(save_data, f"Task ({difficulty.capitalize()})", pkg)
+    _journal_task_reward(save_data, entry, slots_changed)
     
     return pkg
 
+def _journal_task_reward(save_data, history_entry, slots_changed):
+    """
+    Journals only what a task reward touched: the scalars, the active
+    companion's progress, the milestone flags and the one history entry.
+    A milestone unlock reassigns companion slots, so that case saves in full.
+    """
+    if slots_changed:
+        save_manager.mark_dirty(save_data)
+        return
+        
+    paths = ["scrip", "current_xp", "reputation", ("global_companion_state", "milestones")]
+    active_id, _ = companions.get_active_companion(save_data)
+    if active_id:
+        paths += [("companions", active_id, k) for k in ("xp", "level", "loyalty_unlocked")]
+    save_manager.journal_changes(save_data, *paths)
+    save_manager.journal_append(save_data, "reward_history", history_entry, loot.REWARD_HISTORY_LIMIT)
+
 def process_raid_task_completion(save_data):
     """
     Called at the end of a raid. Checks active tasks for completion.
@@ -1,8 +1,9 @@
 import random
 
 # Foundation
-import etw_config as config
-import etw_io as io
+import etw_save_manager as save_manager
+import etw_content as registry
+import etw_buffs as buffs
 
 # Sub-Systems
 import etw_stats as stats
@@ -19,7 +20,7 @@ def rest_at_inn(save_data):
     Deducts scrip to advance the day, heal fatigue (conceptually), 
     and refresh daily spawns/tasks.
     """
-    bar_conf = io.load_json(config.PATHS["content_bar"])
+    bar_conf = registry.get_content("content_bar")
     base_cost = bar_conf.get("innkeeper", {}).get("cost_scrip", 3)
     final_cost = stats.apply_economy_mult(base_cost, "cost", save_data)
 
@@ -33,13 +34,14 @@ def rest_at_inn(save_data):
     save_data["active_buffs"] = []
     new_buff = {"id": "rested_xp", "name": "Rested XP (+25%)"}
     save_data["active_buffs"].append(new_buff)
+    buffs.invalidate_modifiers()
 
     # Progression
     engine.advance_game_cycle(save_data) 
     companions.roll_daily_bar_spawns(save_data)
     tasks.refresh_taskboard(save_data)
 
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     return {"success": True, "msg": f"Rested for {final_cost} Scrip. All temporary fatigue cleared."}
 
 # ----------------------------------------------------------------------
@@ -50,11 +52,11 @@ def buy_raid_intel(save_data):
     """
     Purchases a random unlocked intel dossier.
     """
-    intel_conf = io.load_json(config.PATHS["content_intel"])
+    intel_conf = registry.get_content("content_intel")
     pool = intel_conf.get("raid_intel", [])
     known_intel = save_data.get("unlocked_intel", [])
     
-    bar_conf = io.load_json(config.PATHS["content_bar"])
+    bar_conf = registry.get_content("content_bar")
     base_cost = bar_conf.get("broker", {}).get("cost_scrip", 1)
     
     final_cost = stats.apply_economy_mult(base_cost, "cost", save_data)
@@ -72,6 +74,6 @@ def buy_raid_intel(save_data):
     chosen_intel = random.choice(available)
     save_data["unlocked_intel"].append(chosen_intel["id"])
     
-    io.save_json(config.PATHS["save_data"], save_data)
+    save_manager.mark_dirty(save_data)
     
     return {"success": True, "msg": f"Acquired Dossier: {chosen_intel['title']}", "data": chosen_intel}
\ No newline at end of file
@@ -9,16 +9,21 @@ import etw_companions as companions
 import etw_ui_town 
 import etw_stats as stats
 import etw_town_services as town_services
-import etw_io as io
-import etw_config as config
+import etw_save_manager as save_manager
+import etw_content as registry
 import etw_dialogue as dialogue 
 import etw_bridge as bridge # Needed for scan
 import etw_inventory as inventory # Needed for verification
 import etw_ui_styles # Shared UI Utilities
+import etw_ui_view as ui_view # Keyed rendering
 
 # ----------------------------------------------------------------------
 # BAR UI MODULE
 # ----------------------------------------------------------------------
+# The content area is a ViewStack: "main" (locked or NPC panels) is only
+# rebuilt when its signature changes, so leaving a conversation re-packs the
+# existing panels. Conversations are fresh "talk" views; the fence keeps its
+# layout and diffs its slots by index.
 
 def build_bar_screen(app, frame):
     # 1. Header (Top)
@@ -38,27 +43,51 @@ def build_bar_screen(app, frame):
     # 4. Main Content
     app.bar_content_frame = tk.Frame(frame, bg="#111111")
     app.bar_content_frame.pack(fill="both", expand=True, padx=20, pady=5)
+    app.bar_views = ui_view.ViewStack(app.bar_content_frame)
 
 def refresh_bar_ui(app):
-    for w in app.bar_content_frame.winfo_children(): w.destroy()
     current_scrip = app.save_data.get('scrip', 0)
     if hasattr(app, 'bar_scrip_label') and app.bar_scrip_label.winfo_exists():
-        app.bar_scrip_label.config(text=f"Scrip: {current_scrip}")
+        ui_view.set_if_changed(app.bar_scrip_label, text=f"Scrip: {current_scrip}")
     app.bar_feedback_label.config(text="")
     
+    view, rebuild = app.bar_views.show("main", signature=_bar_main_signature(app))
+    if not rebuild: return
     if not app.save_data.get("bar_unlocked", False):
-        _build_bar_locked_ui(app)
+        _build_bar_locked_ui(app, view)
     else:
-        _build_bar_unlocked_ui(app)
+        _build_bar_unlocked_ui(app, view)
+
+def _bar_main_signature(app):
+    """Everything the main bar view displays; it is rebuilt only when this changes."""
+    sd = app.save_data
+    if not sd.get("bar_unlocked", False):
+        is_active = "bar_unlock" in sd.get("active_side_quests", [])
+        rep = round(stats.compute_reputation(sd), 2) if is_active else None
+        return ("locked", is_active, rep)
+    
+    bar_conf = registry.get_content("content_bar")
+    inn_cost = stats.apply_economy_mult(bar_conf.get("innkeeper", {}).get("cost_scrip", 3), "cost", sd)
+    intel_cost = stats.apply_economy_mult(bar_conf.get("broker", {}).get("cost_scrip", 1), "cost", sd)
+    known_intel = sd.get("unlocked_intel", [])
+    pool = registry.get_content("content_intel").get("raid_intel", [])
+    sold_out = all(i["id"] in known_intel for i in pool)
+    bar_slots = sd.get("global_companion_state", {}).get("bar_slots", [None, None, None])
+    return ("unlocked", inn_cost, intel_cost, sold_out, tuple(bar_slots), sd.get("day_cycle", 1))
+
+def _show_talk_view(app):
+    """A fresh full-width view for conversations and one-off panels."""
+    view, _ = app.bar_views.show("talk", fresh=True)
+    return view
 
 # ----------------------------------------------------------------------
 # LOCKED STATE
 # ----------------------------------------------------------------------
-def _build_bar_locked_ui(app):
+def _build_bar_locked_ui(app, view):
     q_id = "bar_unlock"
     q_data = next((q for q in app.side_quests if q["id"] == q_id), None)
     
-    center = tk.Frame(app.bar_content_frame, bg="#111111")
+    center = tk.Frame(view, bg="#111111")
     center.pack(expand=True)
     
     if not q_data:
@@ -103,7 +132,7 @@ def _accept_side_quest(app, q_id):
         count = len(q_data.get("objectives", [])) if q_data else 1
         if "quest_progress" not in app.save_data: app.save_data["quest_progress"] = {}
         app.save_data["quest_progress"][q_id] = [False] * count
-        io.save_json(config.PATHS["save_data"], app.save_data)
+        save_manager.mark_dirty(app.save_data)
         refresh_bar_ui(app)
 
 def _complete_bar_quest_inline(app, parent_frame, q_data):
@@ -114,15 +143,16 @@ def _complete_bar_quest_inline(app, parent_frame, q_data):
     if q_data["id"] in app.save_data["active_side_quests"]:
         app.save_data["active_side_quests"].remove(q_data["id"])
     app.save_data["bar_unlocked"] = True
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    app.bar_views.invalidate("main") # Drawn over in place
+    save_manager.mark_dirty(app.save_data)
     tk.Button(parent_frame, text="ENTER BAR", command=lambda: refresh_bar_ui(app), bg="#003300", fg="#00FF00", font=("Courier", 14, "bold")).pack(pady=20)
 
 # ----------------------------------------------------------------------
 # UNLOCKED STATE
 # ----------------------------------------------------------------------
-def _build_bar_unlocked_ui(app):
+def _build_bar_unlocked_ui(app, view):
     # Configure 3-column layout for NPCs
-    top_frame = tk.Frame(app.bar_content_frame, bg="#111111")
+    top_frame = tk.Frame(view, bg="#111111")
     top_frame.pack(fill="both", expand=True)
     top_frame.columnconfigure(0, weight=1, uniform="npc_col")
     top_frame.columnconfigure(1, weight=1, uniform="npc_col")
@@ -144,7 +174,7 @@ def _build_bar_unlocked_ui(app):
     _build_fence_panel(app, fence_panel)
     
     # 4. Lounge (Bottom)
-    bottom_panel = tk.Frame(app.bar_content_frame, bg="#111111", bd=2, relief="groove")
+    bottom_panel = tk.Frame(view, bg="#111111", bd=2, relief="groove")
     bottom_panel.pack(fill="x", pady=10, padx=5)
     _build_lounge_panel(app, bottom_panel)
 
@@ -155,7 +185,7 @@ def _build_innkeeper_panel(app, frame):
     desc = data.get("description", "")
     tk.Label(frame, text=desc, fg="#AAAAAA", bg="#1a1a1a", font=("Courier", 10, "italic"), wraplength=200).pack(pady=5)
     
-    bar_conf = io.load_json(config.PATHS["content_bar"])
+    bar_conf = registry.get_content("content_bar")
     base_cost = bar_conf.get("innkeeper", {}).get("cost_scrip", 3)
     final_cost = stats.apply_economy_mult(base_cost, "cost", app.save_data)
     
@@ -186,7 +216,7 @@ def _build_broker_panel(app, frame):
     desc = data.get("description", "")
     tk.Label(frame, text=desc, fg="#AAAAAA", bg="#1a1a1a", font=("Courier", 10, "italic"), wraplength=200).pack(pady=5)
     
-    intel_conf = io.load_json(config.PATHS["content_intel"])
+    intel_conf = registry.get_content("content_intel")
     pool = intel_conf.get("raid_intel", [])
     known_intel = app.save_data.get("unlocked_intel", [])
     available = [i for i in pool if i["id"] not in known_intel]
@@ -195,7 +225,7 @@ def _build_broker_panel(app, frame):
     intro_text = dialogue.get_dialogue("broker", "intro")
     if sold_out: intro_text = dialogue.get_dialogue("broker", "sold_out")
         
-    bar_conf = io.load_json(config.PATHS["content_bar"])
+    bar_conf = registry.get_content("content_bar")
     base_cost = bar_conf.get("broker", {}).get("cost_scrip", 1)
     final_cost = stats.apply_economy_mult(base_cost, "cost", app.save_data)
     
@@ -226,9 +256,13 @@ def _handle_buy_intel(app, parent_frame, cost):
         if res.get("sold_out"): refresh_bar_ui(app) 
         return
     
-    target_frame = parent_frame if parent_frame else app.bar_content_frame
-    
-    for w in target_frame.winfo_children(): w.destroy()
+    if parent_frame:
+        # Dossier replaces the broker panel in place
+        target_frame = parent_frame
+        ui_view.clear_children(target_frame)
+        app.bar_views.invalidate("main")
+    else:
+        target_frame = _show_talk_view(app)
     
     intel_data = res["data"]
     tk.Label(target_frame, text="DOSSIER ACQUIRED", fg="#00FF00", bg="#1a1a1a", font=("Courier", 14, "bold")).pack(pady=10)
@@ -265,11 +299,15 @@ def _start_fence_session(app):
     game_path = app.save_data.get("game_install_path", "")
     if game_path:
         app.show_temporary_text(app.bar_feedback_label, "Scanning Inventory...", "#FFFF00")
-        bridge.trigger_inventory_scan(game_path)
-        app.after(1500, lambda: _finalize_fence_entry(app))
+        app.aio.spawn(_scan_for_fence(app, game_path))
     else:
         _open_fence_interface(app)
 
+async def _scan_for_fence(app, game_path):
+    # Sync either way: a timed-out scan leaves the last known inventory
+    await bridge.scan(game_path, timeout=5.0)
+    _finalize_fence_entry(app)
+
 def _finalize_fence_entry(app):
     inventory.perform_full_inventory_sync(app.save_data)
     app.show_temporary_text(app.bar_feedback_label, "Inventory Synced.", "#00FF00")
@@ -285,7 +323,7 @@ def _build_lounge_panel(app, frame):
     g_state = app.save_data.get("global_companion_state", {})
     bar_slots = g_state.get("bar_slots", [None, None, None])
     day_cycle = app.save_data.get("day_cycle", 1)
-    rnd_npcs = io.load_json(config.PATHS["content_random_npcs"])
+    rnd_npcs = registry.get_content("content_random_npcs")
     for i, companion_id in enumerate(bar_slots):
         if companion_id:
             _build_companion_seat(app, seat_frame, companion_id)
@@ -332,13 +370,13 @@ def _open_talk_interface(app, name, descriptor, flavor_text, actions=None):
     """
     Standardized screen for NPC interaction.
     """
-    for w in app.bar_content_frame.winfo_children(): w.destroy()
+    view = _show_talk_view(app)
     
-    tk.Label(app.bar_content_frame, text=f"Talking to: {name}", fg="#00FF00", bg="#111111", font=("Courier", 16, "bold")).pack(pady=10)
-    tk.Label(app.bar_content_frame, text=f"({descriptor})", fg="#AAAAAA", bg="#111111", font=("Courier", 10)).pack()
-    tk.Label(app.bar_content_frame, text=f"\"{flavor_text}\"", fg="#FFFFFF", bg="#111111", font=("Courier", 12, "italic"), wraplength=500, justify="center").pack(pady=20)
+    tk.Label(view, text=f"Talking to: {name}", fg="#00FF00", bg="#111111", font=("Courier", 16, "bold")).pack(pady=10)
+    tk.Label(view, text=f"({descriptor})", fg="#AAAAAA", bg="#111111", font=("Courier", 10)).pack()
+    tk.Label(view, text=f"\"{flavor_text}\"", fg="#FFFFFF", bg="#111111", font=("Courier", 12, "italic"), wraplength=500, justify="center").pack(pady=20)
     
-    btn_frame = tk.Frame(app.bar_content_frame, bg="#111111")
+    btn_frame = tk.Frame(view, bg="#111111")
     btn_frame.pack(pady=20)
     
     if actions:
@@ -384,66 +422,99 @@ def _accept_recruit_quest(app, companion_id):
         app.show_temporary_text(app.bar_feedback_label, "Error starting quest.", "#FF0000")
 
 def _render_recruitment_completion_dialog(app, companion_id, c_def):
-    for w in app.bar_content_frame.winfo_children(): w.destroy()
-    tk.Label(app.bar_content_frame, text="CONTRACT FULFILLED", fg="#00FF00", bg="#111111", font=("Courier", 16, "bold")).pack(pady=10)
-    tk.Label(app.bar_content_frame, text=f"\"{c_def['name']}: You held up your end. I'm ready to work.\"", fg="#FFFFFF", bg="#111111", font=("Courier", 12, "italic"), wraplength=500, justify="center").pack(pady=20)
-    tk.Button(app.bar_content_frame, text="FINALIZE RECRUITMENT", command=lambda: _finalize_recruit(app, companion_id), bg="#004400", fg="#FFFF00", font=("Courier", 14, "bold")).pack(pady=20)
+    view = _show_talk_view(app)
+    tk.Label(view, text="CONTRACT FULFILLED", fg="#00FF00", bg="#111111", font=("Courier", 16, "bold")).pack(pady=10)
+    tk.Label(view, text=f"\"{c_def['name']}: You held up your end. I'm ready to work.\"", fg="#FFFFFF", bg="#111111", font=("Courier", 12, "italic"), wraplength=500, justify="center").pack(pady=20)
+    tk.Button(view, text="FINALIZE RECRUITMENT", command=lambda: _finalize_recruit(app, companion_id), bg="#004400", fg="#FFFF00", font=("Courier", 14, "bold")).pack(pady=20)
 
 def _finalize_recruit(app, companion_id):
     companions.complete_recruitment(app.save_data, companion_id)
     q_id = f"recruitment_{companion_id}"
     if q_id in app.save_data.get("active_side_quests", []):
         app.save_data["active_side_quests"].remove(q_id)
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    save_manager.mark_dirty(app.save_data)
     app.show_temporary_text(app.bar_feedback_label, "Recruited!", "#00FF00")
     refresh_bar_ui(app)
     etw_ui_town.update_town_stats(app) 
 
 # --- FENCE INTERFACE ---
 def _open_fence_interface(app):
-    for w in app.bar_content_frame.winfo_children(): w.destroy()
     import etw_fence as fence
     shop_data = fence.load_fence_shop()
     if not shop_data: shop_data = fence.refresh_shop(app.save_data)
+    
+    view, rebuild = app.bar_views.show("fence", signature="fence")
+    if rebuild:
+        app.fence_budget_var = tk.StringVar()
+        
+        header_frame = tk.Frame(view, bg="#111111")
+        header_frame.pack(fill="x", pady=10)
+        tk.Label(header_frame, text="BLACK MARKET FENCE", fg="#FFAA00", bg="#111111", font=("Courier", 20, "bold")).pack(side="left")
+        app.fence_budget_lbl = tk.Label(header_frame, textvariable=app.fence_budget_var, fg="#00FF00", bg="#111111", font=("Courier", 12))
+        app.fence_budget_lbl.pack(side="right")
         
-    app.fence_budget_var = tk.StringVar()
+        action_row = tk.Frame(view, bg="#111111")
+        action_row.pack(fill="x", pady=5)
+        app.fence_refresh_cost = 0
+        app.fence_refresh_btn = tk.Button(action_row, text="", command=lambda: _fence_refresh_action(app, app.fence_refresh_cost), bg="#333300", fg="#FFFF00", font=("Courier", 10, "bold"))
+        app.fence_refresh_btn.pack(side="right")
+        tk.Button(action_row, text="< EXIT TRADING", command=lambda: refresh_bar_ui(app), bg="#330000", fg="#FFFFFF", font=("Courier", 10)).pack(side="left")
+        
+        split_frame = tk.Frame(view, bg="#111111")
+        split_frame.pack(fill="both", expand=True, pady=10)
+        split_frame.columnconfigure(0, weight=1, uniform="group1")
+        split_frame.columnconfigure(1, weight=1, uniform="group1")
+        
+        buy_col = tk.Frame(split_frame, bg="#1a1a1a", bd=2, relief="ridge")
+        buy_col.grid(row=0, column=0, sticky="nsew", padx=5)
+        tk.Label(buy_col, text="BUY ITEMS (Fence Selling)", fg="#00FFFF", bg="#1a1a1a", font=("Courier", 12, "bold")).pack(pady=5)
+        
+        sell_col = tk.Frame(split_frame, bg="#1a1a1a", bd=2, relief="ridge")
+        sell_col.grid(row=0, column=1, sticky="nsew", padx=5)
+        tk.Label(sell_col, text="SELL ITEMS (Fence Buying)", fg="#FF00FF", bg="#1a1a1a", font=("Courier", 12, "bold")).pack(pady=5)
+        
+        # Slots keyed by index: only slots whose item/affordability changed are redrawn
+        app.fence_slot_rows = {
+            mode: ui_view.KeyedList(
+                col, key=lambda slot: slot[0], build=_build_fence_slot,
+                update=lambda f, slot, mode=mode: _fill_fence_slot(app, f, slot[1], slot[0], mode),
+                state=lambda slot, mode=mode: _fence_slot_state(app, slot[1], mode),
+                fill="x", padx=5, pady=2
+            )
+            for mode, col in (("buy", buy_col), ("sell", sell_col))
+        }
+    
     budget = shop_data.get("scrip_budget", 0)
     max_b = shop_data.get("max_budget", 0)
     app.fence_budget_var.set(f"Fence Budget: {budget}/{max_b} Scrip")
     
-    header_frame = tk.Frame(app.bar_content_frame, bg="#111111")
-    header_frame.pack(fill="x", pady=10)
-    tk.Label(header_frame, text="BLACK MARKET FENCE", fg="#FFAA00", bg="#111111", font=("Courier", 20, "bold")).pack(side="left")
-    app.fence_budget_lbl = tk.Label(header_frame, textvariable=app.fence_budget_var, fg="#00FF00", bg="#111111", font=("Courier", 12))
-    app.fence_budget_lbl.pack(side="right")
-
-    action_row = tk.Frame(app.bar_content_frame, bg="#111111")
-    action_row.pack(fill="x", pady=5)
     base_cost = fence.get_refresh_cost(app.save_data)
-    cost = stats.apply_economy_mult(base_cost, "cost", app.save_data)
+    app.fence_refresh_cost = stats.apply_economy_mult(base_cost, "cost", app.save_data)
+    ui_view.set_if_changed(app.fence_refresh_btn, text=f"REFRESH OFFERS ({app.fence_refresh_cost} Caps)")
     
-    tk.Button(action_row, text=f"REFRESH OFFERS ({cost} Caps)", command=lambda: _fence_refresh_action(app, cost), bg="#333300", fg="#FFFF00", font=("Courier", 10, "bold")).pack(side="right")
-    tk.Button(action_row, text="< EXIT TRADING", command=lambda: refresh_bar_ui(app), bg="#330000", fg="#FFFFFF", font=("Courier", 10)).pack(side="left")
+    _render_fence_slots(app, shop_data)
 
-    split_frame = tk.Frame(app.bar_content_frame, bg="#111111")
-    split_frame.pack(fill="both", expand=True, pady=10)
-    split_frame.columnconfigure(0, weight=1, uniform="group1")
-    split_frame.columnconfigure(1, weight=1, uniform="group1")
-    
-    buy_col = tk.Frame(split_frame, bg="#1a1a1a", bd=2, relief="ridge")
-    buy_col.grid(row=0, column=0, sticky="nsew", padx=5)
-    tk.Label(buy_col, text="BUY ITEMS (Fence Selling)", fg="#00FFFF", bg="#1a1a1a", font=("Courier", 12, "bold")).pack(pady=5)
-    
-    sell_col = tk.Frame(split_frame, bg="#1a1a1a", bd=2, relief="ridge")
-    sell_col.grid(row=0, column=1, sticky="nsew", padx=5)
-    tk.Label(sell_col, text="SELL ITEMS (Fence Buying)", fg="#FF00FF", bg="#1a1a1a", font=("Courier", 12, "bold")).pack(pady=5)
-    
-    for i, item in enumerate(shop_data.get("buy_slots", [])): _render_fence_slot(app, buy_col, item, i, "buy")
-    for i, item in enumerate(shop_data.get("sell_slots", [])): _render_fence_slot(app, sell_col, item, i, "sell")
+def _render_fence_slots(app, shop_data):
+    app.fence_slot_rows["buy"].render(list(enumerate(shop_data.get("buy_slots", []))))
+    app.fence_slot_rows["sell"].render(list(enumerate(shop_data.get("sell_slots", []))))
+
+def _fence_slot_state(app, item, mode):
+    if not item:
+        return None
+    if mode == "buy":
+        return (repr(item), app.save_data.get("scrip", 0) >= item["total_scrip_cost"])
+    game_path = app.save_data.get("game_install_path", "")
+    inv_index = inventory.get_inventory_index(game_path)
+    has_item = inventory.owned_qty(item.get("code", ""), inv_index) >= item.get("qty", 1)
+    shop = fence.load_fence_shop()
+    budget = shop.get("scrip_budget", 0) if shop else 0
+    return (repr(item), has_item, budget >= item["total_scrip_cost"])
+
+def _build_fence_slot(parent, slot):
+    return tk.Frame(parent, bg="#222222", bd=1, relief="solid")
 
-def _render_fence_slot(app, parent, item, index, mode):
-    f = tk.Frame(parent, bg="#222222", bd=1, relief="solid")
-    f.pack(fill="x", padx=5, pady=2)
+def _fill_fence_slot(app, f, item, index, mode):
+    ui_view.clear_children(f)
     if not item:
         tk.Label(f, text="--- EMPTY ---", fg="#555555", bg="#222222", font=("Courier", 10)).pack(pady=5)
         return
@@ -468,20 +539,8 @@ def _render_fence_slot(app, parent, item, index, mode):
     else:
         # Check Inventory for Sell Button Color AND Name Color
         game_path = app.save_data.get("game_install_path", "")
-        char_data = inventory.get_character_data(game_path)
-        current_inv = char_data.get("inventory", [])
-        
-        has_item = False
-        req_code = item.get("code", "")
-        req_suffix = req_code[-6:] if len(req_code) >= 6 else req_code
-        req_qty = item.get("qty", 1)
-        
-        for inv_item in current_inv:
-            inv_code = inv_item.get("code", "")
-            inv_suffix = inv_code[-6:] if len(inv_code) >= 6 else inv_code
-            if (inv_code == req_code or inv_suffix == req_suffix) and inv_item.get("qty", 0) >= req_qty:
-                has_item = True
-                break
+        inv_index = inventory.get_inventory_index(game_path)
+        has_item = inventory.owned_qty(item.get("code", ""), inv_index) >= item.get("qty", 1)
         
         cmd = lambda: _fence_sell_click(app, index, total_cost, item)
         import etw_fence as fence
@@ -530,30 +589,57 @@ def _fence_buy_click(app, index):
         _open_fence_interface(app)
 
 def _fence_sell_click(app, index, payout, item_data):
+    if app.tasks.is_running("fence_sell"):
+        app.show_temporary_text(app.bar_feedback_label, "Busy, please wait...", "#FFFF00")
+        return
+
+    # The offer is the slot as rendered; it must still stand when the removal lands
+    error = _fence_offer_error(index, payout, item_data)
+    if error:
+        app.show_temporary_text(app.bar_feedback_label, error, "#FF0000")
+        _open_fence_interface(app)
+        return
+
     # Verify Inventory BEFORE Selling
     req_item = {"code": item_data["code"], "qty": item_data["qty"], "name": item_data["name"]}
-    
-    result = inventory.verify_and_remove_items(app.save_data, [req_item])
-    
+    app.remove_game_items("fence_sell", [req_item],
+                          lambda result: _finish_fence_sell(app, index, payout, item_data, req_item, result))
+
+def _fence_offer_error(index, payout, item_data, shop=None):
+    """None if sell slot `index` still holds item_data and the fence can pay, else a message."""
+    shop = shop or fence.load_fence_shop()
+    if not shop: return "Shop not initialized."
+    slots = shop.get("sell_slots", [])
+    if index < 0 or index >= len(slots) or slots[index] != item_data:
+        return "Offer no longer available."
+    if shop.get("scrip_budget", 0) < payout:
+        return "Fence can't afford that."
+    return None
+
+def _finish_fence_sell(app, index, payout, item_data, req_item, result):
     if not result["success"]:
-        app.show_temporary_text(app.bar_feedback_label, f"Missing: {item_data['name']}", "#FF0000")
+        msg = f"Missing: {item_data['name']}" if result.get("missing") else result.get("msg", "Sale failed.")
+        app.show_temporary_text(app.bar_feedback_label, msg, "#FF0000")
+        return
+
+    # The shop may have been refreshed (or the budget spent) during the removal
+    shop = fence.load_fence_shop()
+    error = _fence_offer_error(index, payout, item_data, shop)
+    if error:
+        engine._process_game_commands([f"player.additem {req_item['code']} {req_item['qty']}"])
+        inventory.update_local_inventory(app.save_data, added_items=[{"code": req_item["code"], "qty": req_item["qty"]}])
+        app.show_temporary_text(app.bar_feedback_label, f"{error} Item returned.", "#FF0000")
+        _open_fence_interface(app)
         return
 
-    import etw_fence as fence_mod
-    shop = fence_mod.load_fence_shop()
-    if not shop: return
-    
-    slots = shop.get("sell_slots", [])
-    if index < 0 or index >= len(slots): return
-    
     # Update Stats
+    slots = shop["sell_slots"]
     app.save_data["scrip"] += payout
     shop["scrip_budget"] -= payout
     slots[index] = None
-    shop["sell_slots"] = slots
-    fence_mod.save_fence_shop(shop)
+    fence.save_fence_shop(shop)
     
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    save_manager.mark_dirty(app.save_data)
     
     app.show_temporary_text(app.bar_feedback_label, f"Sold for {payout} Scrip", "#00FF00")
     
@@ -1,10 +1,13 @@
 import tkinter as tk
 import random
 import os
+import copy
 
 # Foundation
 import etw_config as config
 import etw_io as io
+import etw_save_manager as save_manager
+import etw_content as registry
 
 # Sub-Systems
 import etw_engine as engine
@@ -149,7 +152,7 @@ def start_character_gen(app):
     Generates 3 random options if needed.
     """
     # Always reload themes to be safe
-    _GEN_STATE["themes_cache"] = io.load_json(config.PATHS["character_themes"], [])
+    _GEN_STATE["themes_cache"] = registry.get_content("character_themes", [])
         
     # Always reroll options on start for freshness
     if _GEN_STATE["themes_cache"]:
@@ -246,14 +249,15 @@ def _finalize_character_creation(app, theme):
             print(f"Error clearing character data: {e}")
 
     # 2. Reload Save Data (Safe refresh)
+    save_manager.flush()
     app.save_data = io.load_json(config.PATHS["save_data"], app.save_data) 
     
     # 3. Apply New Character Theme
-    app.save_data["character"] = theme
+    app.save_data["character"] = copy.deepcopy(theme) # Registry content is shared
     app.save_data["scrip"] = 0
     
     # 4. Grant Loadout
-    loadouts = io.load_json(config.PATHS["starter_loadouts"], {})
+    loadouts = registry.get_content("starter_loadouts", {})
     spec = theme.get("specialty", "")
     items = loadouts.get(spec, [])
     
@@ -266,7 +270,7 @@ def _finalize_character_creation(app, theme):
         bridge.process_game_commands(game_path, cmds)
         
     # 5. Final Save & Transition
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    save_manager.mark_dirty(app.save_data)
     app.current_character = theme
     app.show_town_screen()
 
@@ -283,7 +287,7 @@ def _update_stats_display(label, theme):
     label.config(text=stats_text)
 
 def _update_loadout_display(label, theme):
-    loadouts = io.load_json(config.PATHS["starter_loadouts"], {})
+    loadouts = registry.get_content("starter_loadouts", {})
     spec = theme.get("specialty", "")
     items = loadouts.get(spec, [])
     
@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import messagebox
 import os
 import etw_engine as engine
+import etw_save_manager as save_manager
 import etw_buffs as buffs
 import etw_inventory as inventory # Source of Truth Manager
 import etw_stats as stats # Needed for compute_reputation
@@ -219,6 +220,9 @@ def _reset_data_gui(app):
         
     path = app.save_data.get("game_install_path")
     
+    # Drop the old character's pending write first, or it lands after the delete
+    save_manager.discard()
+    
     if os.path.exists(engine.PATHS["save_data"]): 
         try:
             os.remove(engine.PATHS["save_data"])
@@ -230,7 +234,7 @@ def _reset_data_gui(app):
         try: os.remove(inventory.CHAR_DATA_FILENAME)
         except: pass
             
-    app.save_data = engine.load_save_data()
+    app.save_data = engine.load_save_data(flush_pending=False)
     app.save_data["game_install_path"] = path
     engine.save_save_data(app.save_data)
     
@@ -3,8 +3,7 @@ import time
 import random
 
 # Foundation
-import etw_config as config
-import etw_io as io
+import etw_save_manager as save_manager
 
 # Core & Systems
 import etw_engine as engine
@@ -361,9 +360,12 @@ def _create_raid_task_widget(app, parent, task):
 def update_companion_raid_hud(app):
     """
     Updates the Companion Info and Ultimate Bar based on raid progress.
+    Widgets are only touched when the rendered state differs from the last draw.
     """
     c_id, c_data = companions.get_active_companion(app.save_data)
     
+    txt, fg = "Active Companion: None", "#AAAAAA"
+    bar_w, show_btn = None, False
     if c_id:
         roster = companions.load_companion_roster()
         c_def = roster.get(c_id, {})
@@ -375,29 +377,35 @@ def update_companion_raid_hud(app):
             base_pct += 0.05
             
         txt = f"Active Companion: {c_def.get('name')} | Lvl {level} | {buff_name} +{int(base_pct*100)}%"
+        fg = "#00FF00"
         
         if level >= 5 and c_data.get('loyalty_completed'):
             prog = c_data.get('ultimate_progress', 0.0)
             prog_pct = int(prog * 100)
             txt += f" | Ult: {prog_pct}%"
-            
-            app.raid_ult_bar_canvas.pack(pady=2)
             w = 200
-            app.raid_ult_bar_canvas.coords(app.raid_ult_rect, 0, 0, int(w * prog), 8)
-            
-            if prog >= 1.0:
-                app.raid_ult_btn.pack(pady=2)
-            else:
-                app.raid_ult_btn.pack_forget()
+            bar_w = int(w * prog)
+            show_btn = prog >= 1.0
+
+    display = app.raid_active_companion_display
+    signature = (txt, fg, bar_w, show_btn)
+    # The text check catches show_temporary_text having swapped the label since.
+    if getattr(display, '_hud_signature', None) == signature and display.cget("text") == txt:
+        return
+
+
+    if bar_w is not None:
+        app.raid_ult_bar_canvas.pack(pady=2)
+        app.raid_ult_bar_canvas.coords(app.raid_ult_rect, 0, 0, bar_w, 8)
+        if show_btn:
+            app.raid_ult_btn.pack(pady=2)
         else:
-            app.raid_ult_bar_canvas.pack_forget()
             app.raid_ult_btn.pack_forget()
-            
-        app.raid_active_companion_display.config(text=txt, fg="#00FF00")
     else:
-        app.raid_active_companion_display.config(text="Active Companion: None", fg="#AAAAAA")
         app.raid_ult_bar_canvas.pack_forget()
         app.raid_ult_btn.pack_forget()
+    display.config(text=txt, fg=fg)
+    display._hud_signature = signature
 
 def refresh_extractions(app):
     for w in app.extract_frame.winfo_children(): w.destroy()
@@ -427,7 +435,7 @@ def trigger_companion_ultimate(app):
         if c_data.get("loyalty_completed"):
             c_data["ultimate_progress"] = 0.0
             # FIX: Use IO saving
-            io.save_json(config.PATHS["save_data"], app.save_data)
+            save_manager.mark_dirty(app.save_data)
             update_companion_raid_hud(app)
             app.show_temporary_text(app.raid_active_companion_display, "ULTIMATE ACTIVATED!", "#FFFFFF")
         else:
@@ -447,7 +455,8 @@ def toggle_raid_pause(app):
         app.save_data["raid_pause_start_timestamp"] = time.time()
         app.raid_pause_button.config(text="Resume")
     # FIX: Use IO saving
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    save_manager.mark_dirty(app.save_data)
+    app.wake_raid_timer()
 
 def save_and_quit_raid(app):
     """
@@ -459,7 +468,7 @@ def save_and_quit_raid(app):
     game_timer.process_game_tick(app.save_data)
     
     # 2. Force Save
-    if io.save_json(config.PATHS["save_data"], app.save_data):
+    if save_manager.commit(app.save_data):
         print("Raid State Saved. Closing...")
         app.destroy()
     else:
@@ -472,9 +481,10 @@ def save_and_quit_raid(app):
 def debug_add_time(app, seconds):
     if app.save_data.get("raid_active"):
         app.save_data["last_raid_start_timestamp"] -= seconds
-        io.save_json(config.PATHS["save_data"], app.save_data)
+        save_manager.mark_dirty(app.save_data)
         if seconds >= 1800:
             app.show_temporary_text(app.raid_timer_label, "DEBUG: +30 MINUTES", "#FFFF00")
+        app.wake_raid_timer()
 
 def debug_trigger_ambush(app):
     # REFACTORED: Use the new robust ambush logic via the main App controller if possible,
@@ -487,7 +497,10 @@ def debug_trigger_ambush(app):
     # Let's force the app to think an ambush triggered in the timer loop
     # We can do this by manually calling the handler logic that ETW_App uses.
     
-    ambush_data = ambush.prepare_ambush_coords(app.save_data)
+    app.tasks.submit("ambush_prep", ambush.prepare_ambush_coords, app.save_data,
+                     on_done=lambda ambush_data: _debug_spawn_ambush(app, ambush_data))
+
+def _debug_spawn_ambush(app, ambush_data):
     if ambush_data:
         app.show_temporary_text(app.raid_condition_raid_label, "DEBUG: AMBUSH TRIGGERED!", "#FF00FF")
         # Immediate execution for debug
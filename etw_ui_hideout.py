@@ -1,9 +1,9 @@
 import tkinter as tk
-import math
 
 # Foundation
-import etw_config as config
-import etw_io as io
+import etw_save_manager as save_manager
+import etw_buffs as buffs_logic
+import etw_stations as catalog
 
 # Core & Systems
 import etw_engine as engine
@@ -14,6 +14,7 @@ import etw_ui_town
 import etw_bridge as bridge 
 import etw_inventory as inventory 
 import etw_ui_styles # Shared UI Utilities
+import etw_ui_view as ui_view # Keyed rendering
 
 # ----------------------------------------------------------------------
 # HIDEOUT UI MODULE
@@ -56,9 +57,8 @@ def build_hideout_screen(app, frame):
     # 5. Main Container
     app.hideout_container = tk.Frame(frame, bg="#111111")
     app.hideout_container.pack(fill="both", expand=True, padx=10, pady=5)
-    # Configure grid weights for 2 columns
-    app.hideout_container.columnconfigure(0, weight=1, uniform="station_col")
-    app.hideout_container.columnconfigure(1, weight=1, uniform="station_col")
+    # Views: "stations" keeps its cards across refreshes; "pane" is rebuilt per use
+    app.hideout_views = ui_view.ViewStack(app.hideout_container, setup=_setup_two_columns)
     
     # NOTE: Scan trigger moved to refresh_hideout_ui to prevent startup firing
 
@@ -69,8 +69,12 @@ def _trigger_entry_scan(app):
     game_path = app.save_data.get("game_install_path", "")
     if game_path:
         app.hideout_feedback_label.config(text="Scanning Inventory...")
-        bridge.trigger_inventory_scan(game_path)
-        app.after(1500, lambda: _finalize_entry_scan(app))
+        app.aio.spawn(_scan_on_entry(app, game_path))
+
+async def _scan_on_entry(app, game_path):
+    # Sync either way: a timed-out scan leaves the last known inventory
+    await bridge.scan(game_path, timeout=5.0)
+    _finalize_entry_scan(app)
 
 def _finalize_entry_scan(app):
     inventory.perform_full_inventory_sync(app.save_data)
@@ -84,12 +88,12 @@ def refresh_hideout_ui(app):
     # Update Scrip
     current_scrip = app.save_data.get('scrip', 0)
     if hasattr(app, 'hideout_scrip_label'):
-        app.hideout_scrip_label.config(text=f"Scrip: {current_scrip}")
+        ui_view.set_if_changed(app.hideout_scrip_label, text=f"Scrip: {current_scrip}")
         
     # Update Components (NEW)
     current_comps = app.save_data.get('components', 0)
     if hasattr(app, 'hideout_comps_label'):
-        app.hideout_comps_label.config(text=f"Components: {current_comps}")
+        ui_view.set_if_changed(app.hideout_comps_label, text=f"Components: {current_comps}")
         
     app.hideout_feedback_label.config(text="")
     
@@ -110,42 +114,69 @@ def refresh_hideout_ui(app):
         # We rely on manual/entry triggers mostly.
         pass
 
+def _setup_two_columns(frame):
+    # Configure grid weights for 2 columns
+    frame.columnconfigure(0, weight=1, uniform="station_col")
+    frame.columnconfigure(1, weight=1, uniform="station_col")
+
+def _show_pane(app):
+    """Switches to a fresh 2-column pane (roster, dialogs, crafting) and returns it."""
+    app.hideout_pane, _ = app.hideout_views.show("pane", fresh=True)
+    return app.hideout_pane
+
 def _build_stations_ui(app):
-    for w in app.hideout_container.winfo_children(): w.destroy()
-    
     if not app.save_data.get("hideout_unlocked", False):
         _build_locked_hideout_ui(app)
         return
 
-    # FIX: Use IO/Config
-    content = io.load_json(config.PATHS["content_hideout"])
-    stations_conf = content.get("stations", [])
-    user_stations = app.save_data.get("hideout_stations", {})
-    generated_costs = app.save_data.get("generated_station_costs", {})
-    
+    view, rebuild = app.hideout_views.show("stations", signature="stations")
+    if rebuild:
+        # Cards keyed by station id; a card is redrawn only when its state changes
+        app.hideout_station_cards = ui_view.KeyedList(
+            view, key=lambda station: station.id,
+            build=lambda parent, station: tk.Frame(parent, bg="#111111"),
+            update=lambda cell, station: _refresh_station_card(app, cell, station),
+            state=lambda station: _station_card_state(app, station),
+            layout=_grid_station_card
+        )
+    app.hideout_station_cards.render(list(catalog.get_catalog().values()))
+
+def _grid_station_card(cell, index):
     # Grid Layout: Row-major order (Left, Right, Next Row)
-    for i, s_conf in enumerate(stations_conf):
-        row = i // 2
-        col = i % 2
-        
-        # Container frame for the station card
-        card_frame = tk.Frame(app.hideout_container, bg="#111111")
-        card_frame.grid(row=row, column=col, sticky="nsew", padx=5, pady=5)
-        
-        s_id = s_conf["id"]
-        s_data = user_stations.get(s_id, {})
-        s_costs = generated_costs.get(s_id, {})
-        
-        _build_station_card(app, card_frame, s_conf, s_data, s_costs)
+    cell.grid(row=index // 2, column=index % 2, sticky="nsew", padx=5, pady=5)
+
+def _refresh_station_card(app, cell, station):
+    ui_view.clear_children(cell)
+    s_data = app.save_data.get("hideout_stations", {}).get(station.id, {})
+    s_costs = app.save_data.get("generated_station_costs", {}).get(station.id, {})
+    _build_station_card(app, cell, station, s_data, s_costs)
+
+def _station_card_state(app, station):
+    """Everything a station card displays, including its upgrade tooltip inputs."""
+    s_data = app.save_data.get("hideout_stations", {}).get(station.id, {})
+    s_costs = app.save_data.get("generated_station_costs", {}).get(station.id, {})
+    target_level = s_data.get("level", 0) + 1
+    upgrade = None
+    if target_level <= 5:
+        can_build, reason = hideout_logic.check_station_requirements(station.id, target_level, app.save_data)
+        upgrade = (can_build, reason)
+        if can_build:
+            lvl_conf = station.level(target_level)
+            scrip_cost = lvl_conf.cost_scrip if lvl_conf else 0
+            inv_index = inventory.get_inventory_index(app.save_data.get("game_install_path", ""))
+            req_items = s_costs.get(str(target_level), {}).get("cost_items", [])
+            owned = tuple(inventory.owned_qty(i.get("code", ""), inv_index) for i in req_items)
+            upgrade += (app.save_data.get("scrip", 0) >= scrip_cost, owned)
+    return (repr(s_data), repr(s_costs), upgrade)
 
 # ----------------------------------------------------------------------
 # COMPANION ROSTER UI
 # ----------------------------------------------------------------------
 def _build_companion_roster_ui(app):
-    for w in app.hideout_container.winfo_children(): w.destroy()
+    _show_pane(app)
     
     # Span header across columns
-    header_frame = tk.Frame(app.hideout_container, bg="#111111")
+    header_frame = tk.Frame(app.hideout_pane, bg="#111111")
     header_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 10))
     
     tk.Label(header_frame, text="Crew Roster", fg="#00FFFF", bg="#111111", font=("Courier", 16, "bold")).pack(side="left")
@@ -155,11 +186,11 @@ def _build_companion_roster_ui(app):
     recruited_ids = [cid for cid, cdata in comps.items() if cdata.get("unlocked")]
     
     if not recruited_ids:
-        tk.Label(app.hideout_container, text="No companions recruited yet.\nCheck the Lounge in town.", fg="#555555", bg="#111111", font=("Courier", 12)).grid(row=1, column=0, columnspan=2, pady=20)
+        tk.Label(app.hideout_pane, text="No companions recruited yet.\nCheck the Lounge in town.", fg="#555555", bg="#111111", font=("Courier", 12)).grid(row=1, column=0, columnspan=2, pady=20)
         return
 
     # Use a sub-grid for cards so we don't mess up the main container config
-    roster_grid = tk.Frame(app.hideout_container, bg="#111111")
+    roster_grid = tk.Frame(app.hideout_pane, bg="#111111")
     roster_grid.grid(row=1, column=0, columnspan=2, sticky="nsew")
     roster_grid.columnconfigure(0, weight=1, uniform="roster_group")
     roster_grid.columnconfigure(1, weight=1, uniform="roster_group")
@@ -266,10 +297,10 @@ def _open_inline_companion_talk(app, c_id, c_def, c_data):
     """
     Replaces the Hideout content with a dialog screen.
     """
-    for w in app.hideout_container.winfo_children(): w.destroy()
+    _show_pane(app)
     
     # Dialog Frame (Grid spanning all)
-    d_frame = tk.Frame(app.hideout_container, bg="#111111")
+    d_frame = tk.Frame(app.hideout_pane, bg="#111111")
     d_frame.grid(row=0, column=0, columnspan=2, sticky="nsew", padx=20, pady=20)
     
     tk.Label(d_frame, text=f"Conversing with {c_def['name']}", fg="#00FF00", bg="#111111", font=("Courier", 16, "bold")).pack(pady=10)
@@ -307,7 +338,6 @@ def _open_inline_companion_talk(app, c_id, c_def, c_data):
     tk.Button(act_row, text="Leave", command=lambda: _build_companion_roster_ui(app), bg="#333333", fg="#FFFFFF", font=("Courier", 11)).pack(side="left", padx=10)
 
 def _trigger_loyalty_quest(app, c_id):
-    import etw_tasks
     quest = etw_tasks.generate_companion_quest(app.save_data, c_id, "loyalty")
     if quest:
         app.show_temporary_text(app.hideout_feedback_label, "Loyalty Quest Started!", "#FF00FF")
@@ -320,7 +350,7 @@ def _complete_loyalty_quest(app, c_id):
     q_id_loyalty = f"loyalty_{c_id}"
     if q_id_loyalty in app.save_data.get("active_side_quests", []):
         app.save_data["active_side_quests"].remove(q_id_loyalty)
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    save_manager.mark_dirty(app.save_data)
     
     roster = companions.load_companion_roster()
     c_def = roster.get(c_id)
@@ -334,7 +364,7 @@ def _build_locked_hideout_ui(app):
     q_id = "hideout_unlock"
     q_data = next((q for q in app.side_quests if q["id"] == q_id), None)
     
-    center = tk.Frame(app.hideout_container, bg="#111111")
+    center = tk.Frame(_show_pane(app), bg="#111111")
     # Grid center across both columns
     center.grid(row=0, column=0, columnspan=2)
     
@@ -375,7 +405,7 @@ def _accept_side_quest(app, q_id):
         count = len(q_data.get("objectives", [])) if q_data else 1
         if "quest_progress" not in app.save_data: app.save_data["quest_progress"] = {}
         app.save_data["quest_progress"][q_id] = [False] * count
-        io.save_json(config.PATHS["save_data"], app.save_data)
+        save_manager.mark_dirty(app.save_data)
         refresh_hideout_ui(app)
 
 def _complete_hideout_quest(app, parent_frame, q_data):
@@ -387,41 +417,41 @@ def _complete_hideout_quest(app, parent_frame, q_data):
     app.save_data["hideout_unlocked"] = True
     if "hideout_stations" not in app.save_data: app.save_data["hideout_stations"] = {}
     if not app.save_data.get("generated_station_costs"): hideout_logic.generate_station_costs(app.save_data)
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    save_manager.mark_dirty(app.save_data)
     tk.Button(parent_frame, text="ENTER SHELTER", command=lambda: refresh_hideout_ui(app), bg="#003300", fg="#00FF00", font=("Courier", 14, "bold")).pack(pady=20)
 
 # ----------------------------------------------------------------------
 # STATION CARDS
 # ----------------------------------------------------------------------
-def _build_station_card(app, parent, conf, user_data, cost_data):
+def _build_station_card(app, parent, station, user_data, cost_data):
     # Using 'pack' inside the grid cell
     f = tk.Frame(parent, bg="#222222", bd=2, relief="ridge")
     f.pack(fill="both", expand=True) # Fill the grid cell
     
-    s_id = conf["id"]
+    s_id = station.id
     level = user_data.get("level", 0)
-    s_type = conf.get("type", "passive_production")
+    s_type = station.type or "passive_production"
     
     h_frame = tk.Frame(f, bg="#222222")
     h_frame.pack(fill="x", padx=5, pady=2)
     name_color = "#00FFFF" if level > 0 else "#888888"
     lvl_text = f"Lvl {level}" if level > 0 else "Locked"
-    tk.Label(h_frame, text=conf["name"], fg=name_color, bg="#222222", font=("Courier", 12, "bold")).pack(side="left")
+    tk.Label(h_frame, text=station.name, fg=name_color, bg="#222222", font=("Courier", 12, "bold")).pack(side="left")
     tk.Label(h_frame, text=lvl_text, fg="#AAAAAA", bg="#222222", font=("Courier", 10)).pack(side="right")
     
-    etw_ui_styles.create_tooltip(h_frame, conf["description"])
+    etw_ui_styles.create_tooltip(h_frame, station.description)
     
     if level == 0:
         _build_upgrade_ui(app, f, s_id, 1, cost_data)
         return
 
-    lvl_conf = next((l for l in conf["levels"] if l["level"] == level), None)
+    lvl_conf = station.level(level)
     
     if s_type == "passive_production":
         storage = user_data.get("storage", 0)
         progress = user_data.get("progress", 0.0)
-        cap = math.ceil(level / 2.0)
-        rate = lvl_conf.get("production_rate", 60)
+        cap = lvl_conf.capacity
+        rate = lvl_conf.production_rate
         progress_pct = min(1.0, progress / rate) if rate > 0 else 0
         if storage >= cap: progress_pct = 1.0 
         rem_min = int(max(0, rate - progress))
@@ -439,7 +469,7 @@ def _build_station_card(app, parent, conf, user_data, cost_data):
         storage = user_data.get("storage", 0) 
         if storage > 0:
              tk.Button(f, text=f"COLLECT ({storage})", command=lambda: _collect_active_craft(app, s_id), bg="#004400", fg="#00FF00", font=("Courier", 10, "bold")).pack(pady=2)
-        max_slots = lvl_conf.get("slots", 1)
+        max_slots = lvl_conf.slots
         display_slots = active_slots[:]
         while len(display_slots) < max_slots: display_slots.append({})
         for i, slot in enumerate(display_slots):
@@ -447,12 +477,12 @@ def _build_station_card(app, parent, conf, user_data, cost_data):
             row.pack(fill="x", padx=5, pady=1)
             
             if slot and slot.get("code"):
-                rate = lvl_conf.get("production_rate", 60)
+                rate = lvl_conf.production_rate
                 progress = slot.get("progress", 0.0)
                 pct = min(1.0, progress / rate) if rate > 0 else 0
                 rem_min = int(max(0, rate - progress))
                 prog_txt = f"{int(pct*100)}% ({rem_min}m)"
-                cap = math.ceil(level / 2.0)
+                cap = lvl_conf.capacity
                 if user_data.get("storage", 0) >= cap: prog_txt = "Storage Full"
                 
                 # Check job type for visual distinction
@@ -465,9 +495,8 @@ def _build_station_card(app, parent, conf, user_data, cost_data):
                 tk.Label(row, text=f"Slot {i+1}: Idle", fg="#555555", bg="#222222", font=("Courier", 8)).pack(anchor="w")
 
     elif s_type == "passive_buff":
-        buff = lvl_conf.get("buff", {})
-        b_val = buff.get("value", 0)
-        b_type = buff.get("type", "unknown")
+        b_val = lvl_conf.buff_value
+        b_type = lvl_conf.buff_type or "unknown"
         txt = f"Active: {b_type} +{b_val}"
         if "mult" in b_type: txt = f"Active: {b_type.split('_')[0].upper()} +{int(b_val*100)}%"
         if s_id == "tree_of_fortune": txt = "Effect: Increases fortune"
@@ -475,7 +504,7 @@ def _build_station_card(app, parent, conf, user_data, cost_data):
 
     footer = tk.Frame(f, bg="#222222")
     footer.pack(fill="x", padx=5, pady=2)
-    cap = math.ceil(level / 2.0)
+    cap = lvl_conf.capacity if lvl_conf else 0
     current_storage = user_data.get("storage", 0)
     if s_type != "passive_buff":
         tk.Label(footer, text=f"Storage: {current_storage}/{cap}", fg="#AAAAAA", bg="#222222", font=("Courier", 8)).pack(side="left")
@@ -502,17 +531,13 @@ def _build_upgrade_ui(app, parent, s_id, target_level, cost_data):
         return
     lvl_cost = cost_data.get(str(target_level), {})
     req_items = lvl_cost.get("cost_items", [])
-    # FIX: Use IO/Config
-    content = io.load_json(config.PATHS["content_hideout"])
-    s_conf = next((s for s in content["stations"] if s["id"] == s_id), None)
-    lvl_conf = next((l for l in s_conf["levels"] if l["level"] == target_level), {})
-    scrip_cost = lvl_conf.get("cost_scrip", 0)
+    lvl_conf = catalog.get_level(s_id, target_level)
+    scrip_cost = lvl_conf.cost_scrip if lvl_conf else 0
     btn_text = "Construct" if target_level == 1 else "Upgrade"
     
     # NEW: Check inventory for missing items to highlight requirement text in red
     game_path = app.save_data.get("game_install_path", "")
-    char_data = inventory.get_character_data(game_path)
-    current_inv = char_data.get("inventory", [])
+    inv_index = inventory.get_inventory_index(game_path)
     
     # Tooltip construction using List of (Text, Color) tuples
     tip_content = []
@@ -528,16 +553,7 @@ def _build_upgrade_ui(app, parent, s_id, target_level, cost_data):
         name = item.get("name", "Unknown Item")
         needed_qty = item['qty']
         
-        found_qty = 0
-        req_code = item.get("code", "")
-        req_suffix = req_code[-6:] if len(req_code) >= 6 else req_code
-        
-        for inv_item in current_inv:
-            inv_code = inv_item.get("code", "")
-            inv_suffix = inv_code[-6:] if len(inv_code) >= 6 else inv_code
-            if inv_code == req_code or inv_suffix == req_suffix:
-                found_qty = inv_item.get("qty", 0)
-                break
+        found_qty = inventory.owned_qty(item.get("code", ""), inv_index)
         
         if found_qty < needed_qty:
             tip_content.append((f"- {needed_qty}x {name} (Have {found_qty})", "#FF4444"))
@@ -553,13 +569,13 @@ def _build_upgrade_ui(app, parent, s_id, target_level, cost_data):
 # CRAFTING SCREEN (SPLIT VIEW)
 # ----------------------------------------------------------------------
 def _render_crafting_screen(app, s_id, level):
-    for w in app.hideout_container.winfo_children(): w.destroy()
+    _show_pane(app)
     
     # Header
-    tk.Label(app.hideout_container, text=f"Station: {s_id.replace('_', ' ').title()}", fg="#00FFFF", bg="#111111", font=("Courier", 16, "bold")).grid(row=0, column=0, columnspan=2, pady=10)
+    tk.Label(app.hideout_pane, text=f"Station: {s_id.replace('_', ' ').title()}", fg="#00FFFF", bg="#111111", font=("Courier", 16, "bold")).grid(row=0, column=0, columnspan=2, pady=10)
     
     # Nav
-    nav = tk.Frame(app.hideout_container, bg="#111111")
+    nav = tk.Frame(app.hideout_pane, bg="#111111")
     nav.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10)
     tk.Button(nav, text="< Back to Shelter", command=lambda: refresh_hideout_ui(app), bg="#333333", fg="#FFFFFF", font=("Courier", 10)).pack(side="left")
     
@@ -569,10 +585,8 @@ def _render_crafting_screen(app, s_id, level):
     active_slots = s_data.get("active_slots", [])
     
     # We need max slots config
-    content = io.load_json(config.PATHS["content_hideout"])
-    s_conf = next((s for s in content["stations"] if s["id"] == s_id), None)
-    curr_lvl_conf = next((l for l in s_conf["levels"] if l["level"] == level), None)
-    max_slots = curr_lvl_conf.get("slots", 1)
+    curr_lvl_conf = catalog.get_level(s_id, level)
+    max_slots = curr_lvl_conf.slots
     
     busy_count = len([s for s in active_slots if s and s.get("code")])
     slots_txt = f"Slots Busy: {busy_count}/{max_slots}"
@@ -594,7 +608,7 @@ def _render_workbench_split_view(app, s_id, level, busy_count, max_slots):
     dismantle_list, craft_list = hideout_logic.get_workbench_data(app.save_data, level)
     
     # LEFT COLUMN: DISMANTLE
-    left_frame = tk.Frame(app.hideout_container, bg="#111111", bd=2, relief="ridge")
+    left_frame = tk.Frame(app.hideout_pane, bg="#111111", bd=2, relief="ridge")
     left_frame.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
     
     tk.Label(left_frame, text="DISMANTLE (Inventory)", fg="#FF8800", bg="#111111", font=("Courier", 12, "bold")).pack(pady=5)
@@ -634,7 +648,7 @@ def _render_workbench_split_view(app, s_id, level, busy_count, max_slots):
                       bg=btn_col, fg="#FF8800", font=("Courier", 8, "bold"), state=state).pack(side="right", padx=5, pady=2)
 
     # RIGHT COLUMN: CRAFT
-    right_frame = tk.Frame(app.hideout_container, bg="#111111", bd=2, relief="ridge")
+    right_frame = tk.Frame(app.hideout_pane, bg="#111111", bd=2, relief="ridge")
     right_frame.grid(row=2, column=1, sticky="nsew", padx=5, pady=5)
     
     tk.Label(right_frame, text="CRAFT (Blueprints)", fg="#0088FF", bg="#111111", font=("Courier", 12, "bold")).pack(pady=5)
@@ -690,20 +704,18 @@ def _render_generic_crafting_view(app, s_id, level, active_slots, max_slots, cur
     # We span across both columns
     
     # Recipes Logic
-    # FIX: Use IO/Config
-    content = io.load_json(config.PATHS["content_hideout"])
-    s_conf = next((s for s in content["stations"] if s["id"] == s_id), None)
-    base_yield = curr_lvl_conf.get("base_yield_mult", 1.0)
+    station = catalog.get_station(s_id)
+    base_yield = curr_lvl_conf.base_yield_mult
     
     recipes_by_tier = {}
     for lvl in range(1, level + 1):
-        l_conf = next((l for l in s_conf["levels"] if l["level"] == lvl), None)
-        if l_conf and "recipes" in l_conf:
+        l_conf = station.level(lvl)
+        if l_conf and "recipes" in l_conf.raw:
             tier_key = f"Tier {lvl}" 
             if tier_key not in recipes_by_tier: recipes_by_tier[tier_key] = []
-            recipes_by_tier[tier_key].extend(l_conf["recipes"])
+            recipes_by_tier[tier_key].extend(l_conf.recipes)
             
-    scroll_frame = tk.Frame(app.hideout_container, bg="#111111")
+    scroll_frame = tk.Frame(app.hideout_pane, bg="#111111")
     scroll_frame.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=20, pady=10)
     
     filled = len([s for s in active_slots if s and s.get("code")])
@@ -728,23 +740,32 @@ def _render_generic_crafting_view(app, s_id, level, active_slots, max_slots, cur
 # ACTIONS
 # ----------------------------------------------------------------------
 def _attempt_upgrade(app, s_id, level, scrip_cost, items):
+    if app.tasks.is_running("hideout_items"):
+        app.show_temporary_text(app.hideout_feedback_label, "Busy, please wait...", "#FFFF00")
+        return
+
     # 1. Scrip Check
     if app.save_data.get("scrip", 0) < scrip_cost:
         app.show_temporary_text(app.hideout_feedback_label, "Not enough Scrip!", "#FF0000")
         return
 
-    # 2. Inventory Check & Removal (Robust)
-    result = inventory.verify_and_remove_items(app.save_data, items)
-    
+    # 2. Reserve the scrip while the removal batch is in flight (refunded on failure)
+    app.save_data["scrip"] -= scrip_cost
+
+    # 3. Inventory Check & Removal (Robust) - verified batch, so off the Tk thread
+    app.remove_game_items("hideout_items", items,
+                          lambda result: _finish_upgrade(app, s_id, level, scrip_cost, result))
+
+def _finish_upgrade(app, s_id, level, scrip_cost, result):
     if not result["success"]:
-        missing = result.get("missing", [])
-        msg = "Missing Materials:\n" + "\n".join(missing)
+        app.save_data["scrip"] += scrip_cost
+        missing = result.get("missing")
+        msg = "Missing Materials:\n" + "\n".join(missing) if missing else result.get("msg", "Upgrade failed.")
         app.show_temporary_text(app.hideout_feedback_label, msg, "#FF0000", duration=4000)
+        refresh_hideout_ui(app)
         return
 
-    # 3. Transaction Success
-    app.save_data["scrip"] -= scrip_cost
-    
+    # 4. Transaction Success (scrip already debited)
     if s_id not in app.save_data["hideout_stations"]:
         app.save_data["hideout_stations"][s_id] = {}
         
@@ -753,8 +774,9 @@ def _attempt_upgrade(app, s_id, level, scrip_cost, items):
     app.save_data["hideout_stations"][s_id]["storage"] = 0
     if "active_slots" not in app.save_data["hideout_stations"][s_id]:
         app.save_data["hideout_stations"][s_id]["active_slots"] = []
+    buffs_logic.invalidate_modifiers()
     
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    save_manager.mark_dirty(app.save_data)
     app.show_temporary_text(app.hideout_feedback_label, f"Station Upgraded to Lvl {level}!", "#00FF00")
     refresh_hideout_ui(app)
 
@@ -775,7 +797,18 @@ def _start_craft_stay(app, s_id, level, code, name, qty):
     _render_crafting_screen(app, s_id, level)
 
 def _do_dismantle(app, s_id, level, code, name, yield_amt):
-    success, msg = hideout_logic.start_dismantle_job(app.save_data, s_id, code, name, yield_amt)
+    # Only the removal batch leaves the Tk thread; the job (and its slot) starts afterwards
+    req_item = {"code": code, "qty": 1, "name": name}
+    started = app.remove_game_items("hideout_items", [req_item],
+                                    lambda result: _finish_dismantle(app, s_id, level, code, name, yield_amt, result))
+    if not started:
+        app.show_temporary_text(app.hideout_feedback_label, "Busy, please wait...", "#FFFF00")
+
+def _finish_dismantle(app, s_id, level, code, name, yield_amt, result):
+    if result["success"]:
+        success, msg = hideout_logic.start_dismantle_job(app.save_data, s_id, code, name, yield_amt, item_removed=True)
+    else:
+        success, msg = False, result.get("msg") or f"Missing: {name}"
     col = "#00FF00" if success else "#FF0000"
     app.show_temporary_text(app.hideout_feedback_label, msg, col)
     # Reload UI to update inventory counts and slots
@@ -2,8 +2,8 @@ import tkinter as tk
 import os
 import etw_engine as engine
 import etw_inventory as inventory 
-import etw_config as config
-import etw_io as io
+import etw_save_manager as save_manager
+import etw_content as registry
 
 # ----------------------------------------------------------------------
 # INVENTORY UI MODULE (Restored Insurance Logic)
@@ -162,7 +162,7 @@ def _toggle_safe_status(app, item_code):
     else:
         app.save_data["insured_items"].append(item_code)
         
-    io.save_json(config.PATHS["save_data"], app.save_data)
+    save_manager.mark_dirty(app.save_data)
     _show_stored_inventory_view(app)
 
 def _show_dossier_view(app):
@@ -172,7 +172,7 @@ def _show_dossier_view(app):
     if not unlocked:
         tk.Label(app.inventory_content_frame, text="No intel acquired.", fg="#555555", bg="#111111", font=("Courier", 12)).pack(pady=20)
     else:
-        intel_db = io.load_json(config.PATHS["content_intel"])
+        intel_db = registry.get_content("content_intel")
         all_intel = intel_db.get("raid_intel", []) + intel_db.get("general_rumors", [])
         for intel_id in unlocked:
             data = next((i for i in all_intel if i["id"] == intel_id), None)
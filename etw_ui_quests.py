@@ -2,8 +2,7 @@ import tkinter as tk
 import re
 
 # Foundation
-import etw_config as config
-import etw_io as io
+import etw_content as registry
 
 # Core & Systems
 import etw_engine as engine
@@ -11,6 +10,7 @@ import etw_tasks as tasks
 import etw_task_logic as task_logic
 import etw_companions as companions 
 import etw_ui_styles # Shared UI Utilities
+import etw_ui_view as ui_view # Keyed rendering
 
 # Note: etw_ui_town import removed from top-level to prevent circular dependency
 
@@ -21,7 +21,7 @@ def _get_objective_color(text, original_col, is_struck):
     if is_struck: return "#555555"
     if "BONUS:" in text:
         # FIX: Use IO/Config here
-        conf = io.load_json(config.PATHS["content_tasks"])
+        conf = registry.get_content("content_tasks")
         cols = conf.get("icon_colors", {})
         low = text.lower()
         if "slay" in low: return cols.get("slay", "#FF4444")
@@ -85,19 +85,31 @@ def build_quest_log_screen(app, frame):
     tk.Label(frame, text="Active Contracts", fg="#00FFFF", bg="#111111", font=("Courier", 14, "bold"), anchor="w").pack(fill="x", padx=20, pady=(20, 0))
     app.quest_log_active_frame = tk.Frame(frame, bg="#111111")
     app.quest_log_active_frame.pack(fill="both", expand=True, padx=20, pady=5)
+    
+    # Cards keyed by quest id / task number; a card is redrawn only when its state changes
+    app.quest_log_quest_cards = ui_view.KeyedList(
+        app.quest_log_quests_frame, key=lambda entry: entry[0],
+        build=_build_card_cell, update=lambda cell, entry: _fill_quest_card(app, cell, entry),
+        state=lambda entry: _quest_card_state(app, entry)
+    )
+    app.quest_log_task_cards = ui_view.KeyedList(
+        app.quest_log_active_frame, key=lambda task: task.get("task_number"),
+        build=_build_card_cell, update=lambda cell, task: _fill_task_card(app, cell, task),
+        state=lambda task: _task_card_state(app, task)
+    )
+    app.quest_log_no_tasks_label = tk.Label(app.quest_log_active_frame, text="No active contracts.", fg="#555555", bg="#111111", font=("Courier", 12))
 
 def refresh_quest_log_screen(app):
     # Update Scrip
     current_scrip = app.save_data.get('scrip', 0)
     if hasattr(app, 'quest_log_scrip_label'):
-        app.quest_log_scrip_label.config(text=f"Scrip: {current_scrip}")
+        ui_view.set_if_changed(app.quest_log_scrip_label, text=f"Scrip: {current_scrip}")
 
     # --- Refresh Quests (Main + Side) ---
-    for w in app.quest_log_quests_frame.winfo_children(): w.destroy()
-    
+    entries = []
     mq_idx = app.save_data.get("current_main_quest_index", 0)
     if mq_idx < len(app.main_quests):
-        _create_full_quest_widget(app, app.quest_log_quests_frame, app.main_quests[mq_idx], "MAIN")
+        entries.append((("MAIN", mq_idx), "MAIN", app.main_quests[mq_idx]))
         
     active_side_ids = app.save_data.get("active_side_quests", [])
     static_db = app.side_quests
@@ -108,18 +120,40 @@ def refresh_quest_log_screen(app):
         if not q_data:
             q_data = next((q for q in dynamic_db if q["id"] == q_id), None)
         if q_data:
-            _create_full_quest_widget(app, app.quest_log_quests_frame, q_data, "SIDE")
+            entries.append((("SIDE", q_id), "SIDE", q_data))
+    app.quest_log_quest_cards.render(entries)
 
     # --- Refresh Tasks ---
-    for w in app.quest_log_active_frame.winfo_children(): w.destroy()
     active_tasks = [t for t in app.save_data.get("tasks", []) if t.get("state") == "pending"]
     active_tasks.sort(key=lambda x: not x.get("is_emergency", False))
     
     if not active_tasks:
-        tk.Label(app.quest_log_active_frame, text="No active contracts.", fg="#555555", bg="#111111", font=("Courier", 12)).pack(anchor="w")
+        app.quest_log_no_tasks_label.pack(anchor="w")
     else:
-        for task in active_tasks:
-            _create_log_task_widget(app, app.quest_log_active_frame, task)
+        app.quest_log_no_tasks_label.pack_forget()
+    app.quest_log_task_cards.render(active_tasks)
+
+def _build_card_cell(parent, entry):
+    return tk.Frame(parent, bg="#111111")
+
+def _quest_card_state(app, entry):
+    _, q_type, quest = entry
+    progress = app.save_data.get("quest_progress", {}).get(str(quest.get("id", "main")), [])
+    return (q_type, repr(quest), repr(progress), app.current_wrap_width)
+
+def _fill_quest_card(app, cell, entry):
+    _, q_type, quest = entry
+    ui_view.clear_children(cell)
+    _create_full_quest_widget(app, cell, quest, q_type)
+
+def _task_card_state(app, task):
+    # Tag tooltip colors depend on the active companion
+    c_id, _ = companions.get_active_companion(app.save_data)
+    return (repr(task), c_id, app.current_wrap_width)
+
+def _fill_task_card(app, cell, task):
+    ui_view.clear_children(cell)
+    _create_log_task_widget(app, cell, task)
 
 def _create_full_quest_widget(app, parent, quest, q_type):
     bg = "#222222"
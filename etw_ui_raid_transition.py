@@ -5,6 +5,8 @@ import etw_raid as raid
 import etw_companions as companions # Needs to be available for helper
 import etw_inventory as inventory # For accessing Source of Truth data
 
+STEP_DELAY = 0.5 # Pacing between clean-up steps (seconds)
+
 # ----------------------------------------------------------------------
 # HELPER: Companion XP Drawing
 # ----------------------------------------------------------------------
@@ -124,13 +126,12 @@ def update_depart_status(app, text):
             count = len(insured_list)
             # Fetch names for first few items to make it look nice
             game_path = app.save_data.get("game_install_path", "")
-            char_data = inventory.get_character_data(game_path)
-            inv = char_data.get("inventory", [])
+            by_code = inventory.get_inventory_index(game_path)["by_code"]
             
             names = []
             for code in insured_list[:3]: # Limit to 3 names
                 # Find item name in inventory
-                match = next((i for i in inv if i["code"] == code), None)
+                match = by_code.get(code)
                 if match: names.append(match["name"])
             
             display_str = "Insured: " + ", ".join(names)
@@ -193,6 +194,19 @@ def build_raid_end_screen(app, frame):
     app.end_confirm_btn.pack(pady=10)
 
 
+def show_extraction_pending(app):
+    """
+    Placeholder state while the reward batch is verified in the background.
+    """
+    app.end_header_lbl.config(text="EXTRACTING...", fg="#FFFF00")
+    app.end_comp_name_lbl.config(text="")
+    app.end_comp_xp_bar.pack_forget()
+    for lbl in app.end_stat_labels.values():
+        lbl.config(text="")
+    app.end_items_label.config(text="")
+    app.end_processing_lbl.config(text="STATUS: Transmitting rewards...", fg="#FFFF00")
+    app.end_confirm_btn.config(text="CONFIRM", state="disabled", bg="#333333", fg="#555555")
+
 def animate_raid_end_sequence(app, context):
     """
     Orchestrates the fade-in of stats and triggers background logic execution.
@@ -287,59 +301,58 @@ def _reveal_stat(app, key, text):
             app.update_idletasks()
 
 # ----------------------------------------------------------------------
-# BACKGROUND PROCESS (POLLING)
+# BACKGROUND PROCESS (ASYNC CLEAN-UP)
 # ----------------------------------------------------------------------
 
 def _start_background_process(app, context):
     """
-    Executes the clean-up steps sequentially using app.after() to avoid freezing the UI entirely
-    while still enforcing the delay.
+    Runs the clean-up steps as a coroutine on app.aio: every step mutates
+    save_data on the Tk thread, and only the inventory scan is awaited
+    (the other bridge calls are queued, not waited on). The confirm button
+    unlocks when all steps are done.
     """
     outcome = context.get("outcome")
+    cleanup = raid.raid_cleanup
+    save_data = app.save_data
     
     if outcome == "KIA":
-        app.end_processing_lbl.config(text="STATUS: Scanning inventory for losses...")
-        # Step 1: Scan
-        app.after(500, lambda: _kia_step_1(app))
-        
+        steps = [
+            ("STATUS: Scanning inventory for losses...", cleanup.execute_death_step_1_scan_async, (save_data,)),
+            ("STATUS: Removing lost items...", cleanup.execute_death_step_2_losses, (save_data,)),
+            ("STATUS: Removing buffs...", cleanup.execute_death_step_3_debuff, (save_data,))
+        ]
     elif outcome == "EXTRACTED":
         # Rewards were already sent/verified in Step 1 (Prepare)
-        app.end_processing_lbl.config(text="STATUS: Syncing local records...")
-        # Step 1: Sync Stub (Local JSON)
-        app.after(500, lambda: _ext_step_1(app, context))
-
-# --- KIA SEQUENCER ---
-def _kia_step_1(app):
-    # Execute Step 1 (Scan & Sync) - Has internal 2s delay
-    raid.raid_cleanup.execute_death_step_1_scan(app.save_data)
-    app.end_processing_lbl.config(text="STATUS: Removing lost items...")
-    app.after(500, lambda: _kia_step_2(app))
+        steps = [
+            ("STATUS: Syncing local records...", cleanup.execute_extraction_step_1_rewards, (save_data, context)),
+            ("STATUS: Removing buffs...", cleanup.execute_extraction_step_2_debuff, (save_data,))
+        ]
+    else:
+        return
+    
+    cancel_background_process(app)
+    app.raid_cleanup_task = app.aio.spawn(_run_cleanup_steps(app, steps))
 
-def _kia_step_2(app):
-    # Execute Step 2 (Losses) - Has internal 2s delay
-    raid.raid_cleanup.execute_death_step_2_losses(app.save_data)
-    app.end_processing_lbl.config(text="STATUS: Removing buffs...")
-    app.after(500, lambda: _kia_step_3(app))
+def cancel_background_process(app):
+    """Abandons the remaining clean-up steps (queued bridge batches still run)."""
+    task = getattr(app, "raid_cleanup_task", None)
+    if task is not None:
+        task.cancel()
+        app.raid_cleanup_task = None
 
-def _kia_step_3(app):
-    # Execute Step 3 (Debuff) - Has internal 2s delay
-    raid.raid_cleanup.execute_death_step_3_debuff(app.save_data)
+async def _run_cleanup_steps(app, steps):
+    import asyncio
+    for text, step, args in steps:
+        _set_processing_status(app, text)
+        await asyncio.sleep(STEP_DELAY)
+        result = step(*args)
+        if asyncio.iscoroutine(result):
+            await result
     _enable_confirm(app)
 
-# --- EXTRACTION SEQUENCER ---
-def _ext_step_1(app, context):
-    # Execute Step 1 (Local Sync Stub)
-    # The actual commands were sent in the "Big Batch" in etw_raid.py
-    # This step now just updates character_data.json
-    raid.raid_cleanup.execute_extraction_step_1_rewards(app.save_data, context)
-    
-    app.end_processing_lbl.config(text="STATUS: Removing buffs...")
-    app.after(500, lambda: _ext_step_2(app))
-
-def _ext_step_2(app):
-    # Execute Step 2 (Debuff) - Has internal 2s delay
-    raid.raid_cleanup.execute_extraction_step_2_debuff(app.save_data)
-    _enable_confirm(app)
+def _set_processing_status(app, text):
+    if hasattr(app, 'end_processing_lbl') and app.end_processing_lbl.winfo_exists():
+        app.end_processing_lbl.config(text=text)
 
 # --- FINAL ENABLE ---
 def _enable_confirm(app):
@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import time
 import etw_engine as engine
 import etw_bridge as bridge
 import etw_raid as raid
@@ -141,39 +140,25 @@ def _manual_scan(app):
         app.show_temporary_text(app.settings_feedback_lbl, "Game Path Not Set!", "#FF0000")
         return
 
-    bridge.trigger_baseline_scan(game_path)
     app.settings_feedback_lbl.config(text="Scanning... Please Wait...")
-    
-    # Start Non-Blocking Polling Loop
-    # We pass the start time to handle timeouts
-    app.after(100, lambda: _poll_manual_scan_result(app, time.time()))
+    app.aio.spawn(_run_manual_scan(app, game_path))
 
-def _poll_manual_scan_result(app, start_time):
-    game_path = app.save_data.get("game_install_path", "")
-    
-    # NON-BLOCKING READ
-    result = bridge.read_baseline_scan(game_path, blocking=False)
+async def _run_manual_scan(app, game_path):
+    result = await bridge.scan(game_path, timeout=15.0)
     
     if result:
         # SUCCESS
         if "baseline" not in app.save_data: app.save_data["baseline"] = {}
-        app.save_data["baseline"]["level"] = result["level"]
-        app.save_data["baseline"].update(result["stats"])
+        app.save_data["baseline"]["level"] = result.level
+        app.save_data["baseline"].update(result.stats)
         
         # Sync to JSON source of truth immediately after manual scan
         inventory.perform_full_inventory_sync(app.save_data)
         
         engine.save_save_data(app.save_data)
         app.show_temporary_text(app.settings_feedback_lbl, "Baseline Updated!", "#00FF00")
-        
     else:
-        # CHECK TIMEOUT
-        elapsed = time.time() - start_time
-        if elapsed > 15.0:
-            app.show_temporary_text(app.settings_feedback_lbl, "Scan Failed (Timeout)", "#FF0000")
-        else:
-            # RETRY IN 100ms
-            app.after(100, lambda: _poll_manual_scan_result(app, start_time))
+        app.show_temporary_text(app.settings_feedback_lbl, "Scan Failed (Timeout)", "#FF0000")
 
 def _manual_hard_reset(app):
     """
@@ -1,7 +1,6 @@
 import tkinter as tk
 import os
 import re
-import time
 import etw_engine as engine
 import etw_tasks as tasks 
 import etw_ui_town 
@@ -10,10 +9,16 @@ import etw_stats as stats # NEW: Import stats module for economy functions
 import etw_dialogue as dialogue # NEW
 import etw_loot as loot # NEW: For Tier lookups
 import etw_bridge as bridge # NEW: For polling
+import etw_ui_view as ui_view # Keyed/virtualized rendering
 
 # ----------------------------------------------------------------------
 # SHOP UI MODULE
 # ----------------------------------------------------------------------
+# The content area is a ViewStack (locked / unlocked / talk / insurance):
+# switching back to a view whose state is unchanged re-packs its existing
+# widgets, and item/insurance rows are diffed instead of rebuilt.
+
+INSURANCE_VISIBLE_ROWS = 12
 
 def build_shop_screen(app, frame):
     # 1. Header (Top)
@@ -37,13 +42,12 @@ def build_shop_screen(app, frame):
     # 4. Main Content Container
     app.shop_content_frame = tk.Frame(frame, bg="#111111")
     app.shop_content_frame.pack(fill="both", expand=True, padx=10, pady=5)
+    app.shop_views = ui_view.ViewStack(app.shop_content_frame)
 
 def refresh_shop_ui(app):
-    for w in app.shop_content_frame.winfo_children(): w.destroy()
-    
     current_scrip = app.save_data.get('scrip', 0)
     if hasattr(app, 'shop_scrip_label'):
-        app.shop_scrip_label.config(text=f"Scrip: {current_scrip}")
+        ui_view.set_if_changed(app.shop_scrip_label, text=f"Scrip: {current_scrip}")
     app.shop_feedback_label.config(text="") 
     
     if not app.save_data.get("shop_unlocked", False):
@@ -57,17 +61,21 @@ def refresh_shop_ui(app):
 def _build_shop_locked_ui(app):
     q_id = "shop_unlock"
     quest_data = next((q for q in app.side_quests if q["id"] == q_id), None)
+    active_side = app.save_data.get("active_side_quests", [])
+    is_active = q_id in active_side
+    progress = app.save_data.get("quest_progress", {}).get(q_id, [])
+    all_done = (len(progress) > 0 and all(progress))
+    
+    view, rebuild = app.shop_views.show("locked", signature=(quest_data is not None, is_active, all_done))
+    if not rebuild: return
     
-    center = tk.Frame(app.shop_content_frame, bg="#111111")
+    center = tk.Frame(view, bg="#111111")
     center.pack(expand=True)
     
     if not quest_data:
         tk.Label(center, text="[SHOP CLOSED]", fg="#FF0000", bg="#111111").pack()
         return
 
-    active_side = app.save_data.get("active_side_quests", [])
-    is_active = q_id in active_side
-    
     status_text = "[QUEST IN PROGRESS]" if is_active else "[SHOP LOCKED]"
     status_col = "#FFFF00" if is_active else "#FF0000"
     
@@ -78,9 +86,6 @@ def _build_shop_locked_ui(app):
     tk.Label(center, text=desc, fg="#AAAAAA", bg="#111111", font=("Courier", 12), wraplength=600, justify="center").pack(pady=10)
     
     if is_active:
-        progress = app.save_data.get("quest_progress", {}).get(q_id, [])
-        all_done = (len(progress) > 0 and all(progress))
-        
         if all_done:
             tk.Button(center, text="COMPLETE QUEST", command=lambda: _complete_shop_unlock_inline(app, center, quest_data), bg="#004400", fg="#00FF00", font=("Courier", 12, "bold")).pack(pady=20)
         else:
@@ -121,24 +126,28 @@ def _complete_shop_unlock_inline(app, parent_frame, q_data):
 # UNLOCKED STATE
 # ----------------------------------------------------------------------
 def _build_shop_unlocked_ui(app):
-    # Shopkeeper Panel
-    top_panel = tk.Frame(app.shop_content_frame, bg="#1a1a1a", bd=2, relief="ridge")
-    top_panel.pack(fill="x", pady=(0, 10), padx=5)
-    _build_shopkeeper_widget(app, top_panel)
-    
-    # Items List
-    bottom_panel = tk.Frame(app.shop_content_frame, bg="#111111")
-    bottom_panel.pack(fill="both", expand=True, padx=5)
-    
-    items = app.shop_items
-    if not items:
-        tk.Label(bottom_panel, text="Shop is empty.", fg="#555555", bg="#111111", font=("Courier", 12)).pack()
+    view, rebuild = app.shop_views.show("unlocked", signature=app.save_data.get("insurance_unlocked", False))
+    if rebuild:
+        # Shopkeeper Panel
+        top_panel = tk.Frame(view, bg="#1a1a1a", bd=2, relief="ridge")
+        top_panel.pack(fill="x", pady=(0, 10), padx=5)
+        _build_shopkeeper_widget(app, top_panel)
+        
+        # Items List (rows keyed by shop item id)
+        bottom_panel = tk.Frame(view, bg="#111111")
+        bottom_panel.pack(fill="both", expand=True, padx=5)
+        app.shop_empty_label = tk.Label(bottom_panel, text="Shop is empty.", fg="#555555", bg="#111111", font=("Courier", 12))
+        app.shop_item_rows = ui_view.KeyedList(
+            bottom_panel, key=lambda m: m["id"], build=_build_item_row, update=_update_item_row,
+            state=_item_row_state, padx=5, pady=4, fill="x"
+        )
+    
+    models = [m for m in (_shop_row_model(app, item) for item in app.shop_items) if m]
+    if models:
+        app.shop_empty_label.pack_forget()
     else:
-        for item in items:
-            if item.get("type") == "upgrade":
-                _build_upgrade_row(app, bottom_panel, item)
-            else:
-                _build_shop_item_row(app, bottom_panel, item)
+        app.shop_empty_label.pack()
+    app.shop_item_rows.render(models)
 
 def _build_shopkeeper_widget(app, frame):
     data = dialogue.get_npc_data("shopkeeper")
@@ -160,15 +169,15 @@ def _build_shopkeeper_widget(app, frame):
 
 def _open_shopkeeper_talk(app):
     # Replaces content with Talk Interface
-    for w in app.shop_content_frame.winfo_children(): w.destroy()
+    view, _ = app.shop_views.show("talk", fresh=True)
     
     data = dialogue.get_npc_data("shopkeeper")
     intro = dialogue.get_dialogue("shopkeeper", "intro")
     
-    tk.Label(app.shop_content_frame, text=f"Talking to: {data['name']}", fg="#00FF00", bg="#111111", font=("Courier", 16, "bold")).pack(pady=10)
-    tk.Label(app.shop_content_frame, text=f"\"{intro}\"", fg="#FFFFFF", bg="#111111", font=("Courier", 12, "italic")).pack(pady=20)
+    tk.Label(view, text=f"Talking to: {data['name']}", fg="#00FF00", bg="#111111", font=("Courier", 16, "bold")).pack(pady=10)
+    tk.Label(view, text=f"\"{intro}\"", fg="#FFFFFF", bg="#111111", font=("Courier", 12, "italic")).pack(pady=20)
     
-    btn_frame = tk.Frame(app.shop_content_frame, bg="#111111")
+    btn_frame = tk.Frame(view, bg="#111111")
     btn_frame.pack(pady=10)
     
     # Insurance Quest Logic
@@ -257,36 +266,22 @@ def _trigger_insurance_quest(app):
 def _open_insurance_ui(app):
     """
     Opens Insurance UI.
-    Uses Non-Blocking Polling for Inventory Scan.
+    Awaits a fresh Inventory Scan without blocking.
     """
     game_path = app.save_data.get("game_install_path", "")
     if not game_path: return
     
-    # 1. Trigger Scan
-    bridge.trigger_inventory_scan(game_path) # Use inventory scan for items
+    # 1. Scan (awaited on the Tk-driven async loop)
     app.shop_feedback_label.config(text="Scanning Inventory... Please Wait...")
-    
-    # 2. Start Polling
-    app.after(100, lambda: _poll_insurance_scan(app, time.time()))
+    app.aio.spawn(_scan_for_insurance(app, game_path))
 
-def _poll_insurance_scan(app, start_time):
-    game_path = app.save_data.get("game_install_path", "")
-    
-    # NON-BLOCKING READ
+async def _scan_for_insurance(app, game_path):
     # Note: Inventory scan uses same file as baseline (etw_baseline) per config
-    result = bridge.read_baseline_scan(game_path, blocking=False)
-    
+    result = await bridge.scan(game_path, timeout=15.0)
     if result:
-        # SUCCESS
         _finalize_insurance_scan(app)
     else:
-        # TIMEOUT CHECK
-        elapsed = time.time() - start_time
-        if elapsed > 15.0:
-            app.shop_feedback_label.config(text="Scan Timeout (Game Paused?)", fg="#FF0000")
-        else:
-            # RETRY
-            app.after(100, lambda: _poll_insurance_scan(app, start_time))
+        app.shop_feedback_label.config(text="Scan Timeout (Game Paused?)", fg="#FF0000")
 
 def _finalize_insurance_scan(app):
     # 3. Parse & Update Source of Truth
@@ -298,12 +293,8 @@ def _get_item_tier_cost(item_code):
     """
     Calculates insurance cost based on rarity tier in loot DB.
     """
-    pool = loot.get_loot_pool_cached()["all"]
     # Check full code first, then suffix
-    target = next((i for i in pool if i.get("code") == item_code), None)
-    if not target:
-        suffix = item_code[-6:] if len(item_code) >= 6 else item_code
-        target = next((i for i in pool if i.get("code", "").endswith(suffix)), None)
+    target = loot.find_item_by_code(item_code)
     
     if not target: return 5 # Default fallback
     
@@ -316,19 +307,33 @@ def _get_item_tier_cost(item_code):
     return 5
 
 def _render_insurance_screen(app):
-    for w in app.shop_content_frame.winfo_children(): w.destroy()
-    
-    tk.Label(app.shop_content_frame, text="ASSET PROTECTION", fg="#00FFFF", bg="#111111", font=("Courier", 16, "bold")).pack(pady=10)
-    tk.Label(app.shop_content_frame, text="Insured items are recovered after death.\nOne-time use (expires after next raid).", fg="#AAAAAA", bg="#111111", font=("Courier", 10)).pack(pady=5)
-    
-    list_frame = tk.Frame(app.shop_content_frame, bg="#111111")
-    list_frame.pack(fill="both", expand=True, padx=10)
+    view, rebuild = app.shop_views.show("insurance", signature="insurance")
+    if rebuild:
+        tk.Label(view, text="ASSET PROTECTION", fg="#00FFFF", bg="#111111", font=("Courier", 16, "bold")).pack(pady=10)
+        tk.Label(view, text="Insured items are recovered after death.\nOne-time use (expires after next raid).", fg="#AAAAAA", bg="#111111", font=("Courier", 10)).pack(pady=5)
+        
+        list_frame = tk.Frame(view, bg="#111111")
+        list_frame.pack(fill="both", expand=True, padx=10)
+        
+        empty = tk.Frame(list_frame, bg="#111111")
+        tk.Label(empty, text="No eligible items (Weapons/Armor) found in stored inventory.", fg="#555555", bg="#111111").pack(pady=20)
+        tk.Label(empty, text="(Try scanning again if items are missing)", fg="#333333", bg="#111111", font=("Courier", 8)).pack()
+        app.shop_insurance_empty = empty
+        
+        # Only INSURANCE_VISIBLE_ROWS row widgets exist, however large the inventory
+        app.shop_insurance_list = ui_view.VirtualList(
+            list_frame, _build_insurance_row, lambda row, item: _update_insurance_row(app, row, item),
+            rows=INSURANCE_VISIBLE_ROWS
+        )
+        
+        tk.Button(view, text="Done", command=lambda: refresh_shop_ui(app), bg="#333333", fg="#FFFFFF").pack(pady=10)
     
     # READ FROM SOURCE OF TRUTH (JSON)
     game_path = app.save_data.get("game_install_path", "")
     char_data = inventory.get_character_data(game_path)
     
     inv_list = char_data.get("inventory", [])
+    insured_list = app.save_data.get("insured_items", [])
     items_found = []
     
     # Filter for Weapon/Armor
@@ -340,43 +345,44 @@ def _render_insurance_screen(app):
                 "code": item["code"],
                 "name": item["name"],
                 "type": cat,
-                "cost": cost
+                "cost": cost,
+                "insured": item["code"] in insured_list
             })
     
+    vlist = app.shop_insurance_list
     if not items_found:
-        tk.Label(list_frame, text="No eligible items (Weapons/Armor) found in stored inventory.", fg="#555555", bg="#111111").pack(pady=20)
-        tk.Label(list_frame, text="(Try scanning again if items are missing)", fg="#333333", bg="#111111", font=("Courier", 8)).pack()
+        vlist.frame.pack_forget()
+        app.shop_insurance_empty.pack(fill="x")
     else:
-        canvas = tk.Canvas(list_frame, bg="#111111", highlightthickness=0)
-        scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#111111")
-        
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        insured_list = app.save_data.get("insured_items", [])
-        
-        for item in items_found:
-            row = tk.Frame(scrollable_frame, bg="#222222", bd=1, relief="solid")
-            row.pack(fill="x", pady=1)
-            
-            is_insured = item["code"] in insured_list
-            status_col = "#00FF00" if is_insured else "#555555"
-            
-            tk.Label(row, text=f"[{item['type'][0].upper()}]", fg="#AAAAAA", bg="#222222", width=4).pack(side="left")
-            tk.Label(row, text=item["name"], fg=status_col, bg="#222222", font=("Courier", 10)).pack(side="left", padx=5)
-            
-            if is_insured:
-                tk.Button(row, text="REMOVE", command=lambda c=item["code"], p=item["cost"]: _toggle_insurance(app, c, p, False), bg="#550000", fg="#FF0000", font=("Courier", 8)).pack(side="right", padx=5)
-                tk.Label(row, text="INSURED", fg="#00FF00", bg="#222222", font=("Courier", 10, "bold")).pack(side="right", padx=10)
-            else:
-                tk.Button(row, text=f"INSURE ({item['cost']})", command=lambda c=item["code"], p=item["cost"]: _toggle_insurance(app, c, p, True), bg="#003300", fg="#00FF00", font=("Courier", 8)).pack(side="right", padx=5)
+        app.shop_insurance_empty.pack_forget()
+        vlist.frame.pack(fill="both", expand=True)
+    vlist.set_items(items_found)
 
-    tk.Button(app.shop_content_frame, text="Done", command=lambda: refresh_shop_ui(app), bg="#333333", fg="#FFFFFF").pack(pady=10)
+def _build_insurance_row(parent):
+    row = tk.Frame(parent, bg="#222222", bd=1, relief="solid")
+    row.type_lbl = tk.Label(row, text="", fg="#AAAAAA", bg="#222222", width=4)
+    row.type_lbl.pack(side="left")
+    row.name_lbl = tk.Label(row, text="", bg="#222222", font=("Courier", 10))
+    row.name_lbl.pack(side="left", padx=5)
+    row.action = None
+    row.btn = tk.Button(row, text="", command=lambda: row.action(), font=("Courier", 8))
+    row.btn.pack(side="right", padx=5)
+    row.insured_lbl = tk.Label(row, text="INSURED", fg="#00FF00", bg="#222222", font=("Courier", 10, "bold"))
+    return row
+
+def _update_insurance_row(app, row, item):
+    is_insured = item["insured"]
+    code, cost = item["code"], item["cost"]
+    row.type_lbl.config(text=f"[{item['type'][0].upper()}]")
+    row.name_lbl.config(text=item["name"], fg="#00FF00" if is_insured else "#555555")
+    row.action = lambda: _toggle_insurance(app, code, cost, not is_insured)
+    
+    if is_insured:
+        row.btn.config(text="REMOVE", bg="#550000", fg="#FF0000")
+        row.insured_lbl.pack(side="right", padx=10)
+    else:
+        row.btn.config(text=f"INSURE ({cost})", bg="#003300", fg="#00FF00")
+        row.insured_lbl.pack_forget()
 
 def _toggle_insurance(app, item_code, price, enable):
     if enable:
@@ -403,32 +409,14 @@ def _toggle_insurance(app, item_code, price, enable):
 # ----------------------------------------------------------------------
 # STANDARD SHOP ITEMS
 # ----------------------------------------------------------------------
-def _build_upgrade_row(app, parent, item_data):
-    if item_data["id"] == "upgrade_task_slot":
-        current_slots = app.save_data.get("unlocked_task_slots", 1)
-        if current_slots >= 5:
-            _render_sold_out_row(parent, "Contract Slot Upgrade (MAX)")
-            return
-        cost = tasks.get_next_slot_cost(app.save_data)
-        if cost is None: return 
-        _render_item_row_widget(app, parent, item_data["name"], item_data["description"], cost, 0, lambda l: _purchase_slot_upgrade(app, cost, current_slots + 1, l), None)
-
-    elif item_data["id"] == "upgrade_task_pool":
-        current_pool = app.save_data.get("unlocked_task_pool_size", 3)
-        if current_pool >= 8:
-            _render_sold_out_row(parent, "Contract Board Expansion (MAX)")
-            return
-        cost = tasks.get_next_pool_cost(app.save_data)
-        if cost is None: return
-        _render_item_row_widget(app, parent, item_data["name"], item_data["description"], cost, 0, lambda l: _purchase_pool_upgrade(app, cost, current_pool + 1, l), None)
-
-def _render_sold_out_row(parent, name):
-    f = tk.Frame(parent, bg="#222222", bd=1, relief="ridge")
-    f.pack(fill="x", padx=5, pady=4)
-    tk.Label(f, text=name, fg="#555555", bg="#222222", font=("Courier", 12, "bold")).pack(side="left", padx=10, pady=5)
-    tk.Label(f, text="SOLD OUT", fg="#FF0000", bg="#222222", font=("Courier", 12, "bold")).pack(side="right", padx=10)
-
-def _build_shop_item_row(app, parent, item):
+def _shop_row_model(app, item):
+    """
+    Everything one shop row displays, or None to omit the row.
+    'action' is the BUY callback (takes the row's status label).
+    """
+    if item.get("type") == "upgrade":
+        return _upgrade_row_model(app, item)
+    
     base_scrip = item.get('cost_scrip', 0)
     base_caps = item.get('cost_caps', 0)
     
@@ -441,36 +429,87 @@ def _build_shop_item_row(app, parent, item):
     if inv_key:
         owned = app.save_data.get("inventory", {}).get(inv_key, 0)
     
-    _render_item_row_widget(app, parent, item["name"], item.get("description", ""), final_scrip, final_caps, lambda l: _purchase_item(app, item, final_scrip, final_caps, l), owned)
+    return _row_model(app, item.get("id", item["name"]), item["name"], item.get("description", ""), final_scrip, final_caps,
+                      lambda l: _purchase_item(app, item, final_scrip, final_caps, l), owned)
 
-def _render_item_row_widget(app, parent, name, desc, cost_scrip, cost_caps, cmd_callback, owned_count=None):
+def _upgrade_row_model(app, item_data):
+    if item_data["id"] == "upgrade_task_slot":
+        current_slots = app.save_data.get("unlocked_task_slots", 1)
+        if current_slots >= 5:
+            return _sold_out_model(item_data["id"], "Contract Slot Upgrade (MAX)")
+        cost = tasks.get_next_slot_cost(app.save_data)
+        if cost is None: return None
+        return _row_model(app, item_data["id"], item_data["name"], item_data["description"], cost, 0,
+                          lambda l: _purchase_slot_upgrade(app, cost, current_slots + 1, l), None, rev=current_slots)
+
+    elif item_data["id"] == "upgrade_task_pool":
+        current_pool = app.save_data.get("unlocked_task_pool_size", 3)
+        if current_pool >= 8:
+            return _sold_out_model(item_data["id"], "Contract Board Expansion (MAX)")
+        cost = tasks.get_next_pool_cost(app.save_data)
+        if cost is None: return None
+        return _row_model(app, item_data["id"], item_data["name"], item_data["description"], cost, 0,
+                          lambda l: _purchase_pool_upgrade(app, cost, current_pool + 1, l), None, rev=current_pool)
+    return None
+
+def _row_model(app, row_id, name, desc, cost_scrip, cost_caps, action, owned_count=None, rev=None):
+    return {
+        "id": row_id, "name": name, "desc": desc, "scrip": cost_scrip, "caps": cost_caps,
+        "owned": owned_count, "sold_out": False, "wrap": app.current_wrap_width - 400,
+        "rev": rev, "action": action
+    }
+
+def _sold_out_model(row_id, name):
+    return {"id": row_id, "name": name, "sold_out": True, "action": None}
+
+def _item_row_state(m):
+    # Everything the row shows (and the action closes over), minus the closure itself
+    return tuple(m.get(k) for k in ("name", "desc", "scrip", "caps", "owned", "sold_out", "wrap", "rev"))
+
+def _build_item_row(parent, model):
     f = tk.Frame(parent, bg="#222222", bd=1, relief="ridge")
-    f.pack(fill="x", padx=5, pady=4)
     
     info_frame = tk.Frame(f, bg="#222222")
     info_frame.pack(side="left", fill="both", expand=True, padx=10, pady=5)
-    tk.Label(info_frame, text=name, fg="#FFFFFF", bg="#222222", font=("Courier", 12, "bold")).pack(anchor="w")
-    desc_wrap = app.current_wrap_width - 400 
-    tk.Label(info_frame, text=desc, fg="#AAAAAA", bg="#222222", font=("Courier", 10), wraplength=desc_wrap, justify="left").pack(anchor="w")
+    f.name_lbl = tk.Label(info_frame, text="", fg="#FFFFFF", bg="#222222", font=("Courier", 12, "bold"))
+    f.name_lbl.pack(anchor="w")
+    f.desc_lbl = tk.Label(info_frame, text="", fg="#AAAAAA", bg="#222222", font=("Courier", 10), justify="left")
     
     btn_frame = tk.Frame(f, bg="#222222")
     btn_frame.pack(side="right", padx=10)
+    f.cost_lbl = tk.Label(btn_frame, text="", fg="#FFD700", bg="#222222", font=("Courier", 11))
+    f.cost_lbl.pack(anchor="e")
+    
+    f.action_row = tk.Frame(btn_frame, bg="#222222")
+    f.status_lbl = tk.Label(f.action_row, text="", bg="#222222", font=("Courier", 9, "bold"))
+    f.status_lbl.pack(side="left", padx=(0, 5))
+    f.action = None
+    tk.Button(f.action_row, text="BUY", command=lambda: f.action(f.status_lbl), bg="#003300", fg="#00FF00", font=("Courier", 10, "bold")).pack(side="left")
+    return f
+
+def _update_item_row(row, m):
+    row.action = m["action"]
+    if m["sold_out"]:
+        row.name_lbl.config(text=m["name"], fg="#555555")
+        row.desc_lbl.pack_forget()
+        row.cost_lbl.config(text="SOLD OUT", fg="#FF0000", font=("Courier", 12, "bold"))
+        row.action_row.pack_forget()
+        return
+    
+    row.name_lbl.config(text=m["name"], fg="#FFFFFF")
+    row.desc_lbl.config(text=m["desc"], wraplength=m["wrap"])
+    row.desc_lbl.pack(anchor="w")
     
     cost_str = []
-    if cost_scrip > 0: cost_str.append(f"{cost_scrip} Scrip")
-    if cost_caps > 0: cost_str.append(f"{cost_caps} Caps")
+    if m["scrip"] > 0: cost_str.append(f"{m['scrip']} Scrip")
+    if m["caps"] > 0: cost_str.append(f"{m['caps']} Caps")
     
     count_str = ""
-    if owned_count is not None:
-        count_str = f" (Owned: x{owned_count})"
-        
-    tk.Label(btn_frame, text=" + ".join(cost_str) + count_str, fg="#FFD700", bg="#222222", font=("Courier", 11)).pack(anchor="e")
+    if m["owned"] is not None:
+        count_str = f" (Owned: x{m['owned']})"
     
-    action_row = tk.Frame(btn_frame, bg="#222222")
-    action_row.pack(anchor="e", pady=(2, 0))
-    status_lbl = tk.Label(action_row, text="", bg="#222222", font=("Courier", 9, "bold"))
-    status_lbl.pack(side="left", padx=(0, 5))
-    tk.Button(action_row, text="BUY", command=lambda: cmd_callback(status_lbl), bg="#003300", fg="#00FF00", font=("Courier", 10, "bold")).pack(side="left")
+    row.cost_lbl.config(text=" + ".join(cost_str) + count_str, fg="#FFD700", font=("Courier", 11))
+    row.action_row.pack(anchor="e", pady=(2, 0))
 
 # ----------------------------------------------------------------------
 # PURCHASE LOGIC
@@ -1,8 +1,7 @@
 import tkinter as tk
 
 # Foundation
-import etw_config as config
-import etw_io as io
+import etw_content as registry
 
 # Core & Systems
 import etw_engine as engine
@@ -311,7 +310,7 @@ def update_raid_condition_labels(app):
     if not mod_id:
         txt = "Condition: Clear Skies"
     else:
-        conf = io.load_json(config.PATHS["content_raids"])
+        conf = registry.get_content("content_raids")
         mod_data = conf.get("raid_modifiers", {}).get(mod_id, {})
         name = mod_data.get("name", "Unknown")
         desc = mod_data.get("description", "")
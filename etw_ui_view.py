@@ -0,0 +1,238 @@
+import tkinter as tk
+
+# ----------------------------------------------------------------------
+# VIEW LAYER (Keyed, Diff-Based Widget Rendering)
+# ----------------------------------------------------------------------
+# Screens used to destroy every child and rebuild from scratch on each
+# refresh. These helpers keep widgets alive across refreshes instead:
+#   set_if_changed - config() only the options that actually differ
+#   ViewStack      - named sub-frames of one container, swapped by packing
+#   KeyedList      - rows keyed by stable ids, updated only when their state changes
+#   VirtualList    - a fixed pool of rows scrolled over a long uniform list
+
+_UNSET = object()
+
+def set_if_changed(widget, **options):
+    """
+    widget.config() with only the options whose current value differs.
+    Returns True if anything was changed.
+    """
+    changed = {k: v for k, v in options.items() if str(widget.cget(k)) != str(v)}
+    if changed:
+        widget.config(**changed)
+    return bool(changed)
+
+def clear_children(frame):
+    for w in frame.winfo_children(): w.destroy()
+
+# ----------------------------------------------------------------------
+# VIEW STACK
+# ----------------------------------------------------------------------
+class ViewStack:
+    """
+    Named child frames of one container; only the shown one is packed.
+    show() returns (frame, rebuild). rebuild is True when the caller must
+    (re)populate the frame: first use, a changed signature, or fresh=True.
+    Returning to an unchanged view re-packs it without touching its widgets.
+    """
+    def __init__(self, parent, bg="#111111", setup=None, **pack_opts):
+        self.parent = parent
+        self.bg = bg
+        self.setup = setup # Optional setup(frame) for new views (grid weights etc.)
+        self.pack_opts = pack_opts or {"fill": "both", "expand": True}
+        self._views = {}   # name -> [frame, signature]
+        self.current = None
+
+    def show(self, name, signature=None, fresh=False):
+        view = self._views.get(name)
+        if view is None or not view[0].winfo_exists():
+            frame = tk.Frame(self.parent, bg=self.bg)
+            if self.setup: self.setup(frame)
+            view = self._views[name] = [frame, _UNSET]
+            if self.current == name: self.current = None
+
+        frame = view[0]
+        rebuild = fresh or view[1] is _UNSET or view[1] != signature
+        if rebuild:
+            clear_children(frame)
+            view[1] = _UNSET if fresh else signature
+
+        if self.current != name:
+            prev = self._views.get(self.current)
+            if prev and prev[0].winfo_exists(): prev[0].pack_forget()
+            frame.pack(**self.pack_opts)
+            self.current = name
+        return frame, rebuild
+
+    def frame(self, name):
+        view = self._views.get(name)
+        return view[0] if view else None
+
+    def invalidate(self, name=None):
+        """Forces the next show() of a view (or of every view) to rebuild."""
+        for view_name, view in self._views.items():
+            if name is None or view_name == name:
+                view[1] = _UNSET
+
+# ----------------------------------------------------------------------
+# KEYED LIST
+# ----------------------------------------------------------------------
+class KeyedList:
+    """
+    Rows of `parent` keyed by stable ids (station id, slot index, quest id).
+    render(items) builds rows for new keys, destroys rows whose key vanished,
+    re-lays out only when the order changed, and calls update() only for rows
+    whose state(item) differs from the previous render.
+      key(item)           -> stable id
+      build(parent, item) -> row frame, created once per key
+      update(row, item)   -> brings the row's widgets up to date
+      state(item)         -> comparable snapshot (default: repr(item))
+      layout(row, index)  -> places a row (default: pack in order with pack_opts)
+    """
+    def __init__(self, parent, key, build, update, state=repr, layout=None, **pack_opts):
+        self.parent = parent
+        self.key = key
+        self.build = build
+        self.update = update
+        self.state = state
+        self.layout = layout
+        self.pack_opts = pack_opts or {"fill": "x"}
+        self._rows = {}   # key -> [row, state]
+        self._order = []
+
+    def render(self, items):
+        order = []
+        seen = set()
+        created = False
+        for item in items:
+            k = self.key(item)
+            if k in seen: continue # Duplicate key: first wins
+            seen.add(k)
+            entry = self._rows.get(k)
+            if entry is None or not entry[0].winfo_exists():
+                entry = self._rows[k] = [self.build(self.parent, item), _UNSET]
+                created = True
+            snapshot = self.state(item)
+            if entry[1] is _UNSET or snapshot != entry[1]:
+                self.update(entry[0], item)
+                entry[1] = snapshot
+            order.append(k)
+
+        for k in [k for k in self._rows if k not in seen]:
+            row = self._rows.pop(k)[0]
+            if row.winfo_exists(): row.destroy()
+
+        if created or order != self._order:
+            self._relayout(order)
+        self._order = order
+
+    def _relayout(self, order):
+        rows = [self._rows[k][0] for k in order]
+        if self.layout:
+            for i, row in enumerate(rows): self.layout(row, i)
+            return
+        for row in rows: row.pack_forget()
+        for row in rows: row.pack(**self.pack_opts)
+
+    def row(self, key):
+        entry = self._rows.get(key)
+        return entry[0] if entry else None
+
+    def invalidate(self, key=None):
+        """Forces update() on the next render for one key (or all)."""
+        for k, entry in self._rows.items():
+            if key is None or k == key:
+                entry[1] = _UNSET
+
+    def clear(self):
+        for row, _ in self._rows.values():
+            if row.winfo_exists(): row.destroy()
+        self._rows = {}
+        self._order = []
+
+# ----------------------------------------------------------------------
+# VIRTUAL LIST
+# ----------------------------------------------------------------------
+class VirtualList:
+    """
+    A scrollable list of uniform rows that only ever creates `rows` row
+    widgets. Scrolling re-binds the pooled rows to a different slice of the
+    items, so cost does not grow with the list.
+      build(parent) -> row frame (pooled, reused for any item)
+      update(row, item) -> fully re-binds a row to an item
+      state(item) -> comparable snapshot (default: repr(item))
+    """
+    def __init__(self, parent, build, update, rows=10, state=repr, bg="#111111"):
+        self.build = build
+        self.update = update
+        self.state = state
+        self.rows = rows
+        self.items = []
+        self.offset = 0
+        self._pool = []   # [row, state, packed]
+
+        self.frame = tk.Frame(parent, bg=bg)
+        self.body = tk.Frame(self.frame, bg=bg)
+        self.body.pack(side="left", fill="both", expand=True)
+        self.scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self._on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self._bind_wheel(self.body)
+
+    def set_items(self, items):
+        self.items = list(items)
+        self.offset = max(0, min(self.offset, len(self.items) - self.rows))
+        self._draw()
+
+    def scroll_to(self, offset):
+        offset = max(0, min(int(offset), len(self.items) - self.rows))
+        if offset != self.offset:
+            self.offset = offset
+            self._draw()
+
+    def _draw(self):
+        visible = self.items[self.offset:self.offset + self.rows]
+        while len(self._pool) < len(visible):
+            row = self.build(self.body)
+            self._bind_wheel(row)
+            self._pool.append([row, _UNSET, False])
+
+        # Visible rows are always a prefix of the pool, so re-packing keeps order
+        for i, entry in enumerate(self._pool):
+            row = entry[0]
+            if i < len(visible):
+                snapshot = self.state(visible[i])
+                if entry[1] is _UNSET or snapshot != entry[1]:
+                    self.update(row, visible[i])
+                    entry[1] = snapshot
+                if not entry[2]:
+                    row.pack(fill="x", pady=1)
+                    entry[2] = True
+            elif entry[2]:
+                row.pack_forget()
+                entry[2] = False
+
+        total = len(self.items)
+        if total <= self.rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + len(visible)) / total)
+
+    def _on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * len(self.items)))
+        elif action == "scroll":
+            step = self.rows if unit == "pages" else 1
+            self.scroll_to(self.offset + int(amount) * step)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4: direction = -1
+        elif getattr(event, "num", None) == 5: direction = 1
+        else: direction = -1 if event.delta > 0 else 1
+        self.scroll_to(self.offset + direction)
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", self._on_wheel)
+        widget.bind("<Button-5>", self._on_wheel)
+        for child in widget.winfo_children():
+            self._bind_wheel(child)